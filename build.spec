@@ -10,6 +10,9 @@ project_dir = os.path.abspath(os.getcwd())
 # Collect data files for faster_whisper to avoid ONNX errors
 faster_whisper_datas = collect_data_files('faster_whisper')
 
+# Whisper models from utils/download_model.py; the app never downloads them
+model_datas = [('models', 'models')] if os.path.isdir('models') else []
+
 a = Analysis(
     ['main.py'],
     pathex=[project_dir],
@@ -18,7 +21,7 @@ a = Analysis(
         ('app.ico', '.'),
         ('bin/ffmpeg.exe', 'bin'),  # Bundle FFmpeg binary
         ('src', 'src')  # Bundle entire src package directory
-    ] + faster_whisper_datas,
+    ] + faster_whisper_datas + model_datas,
     hiddenimports=[
         'pystray',
         'faster_whisper',
@@ -26,17 +29,42 @@ a = Analysis(
         'ctranslate2',
         'sklearn.utils._typedefs',
         'sounddevice',
+        'soundfile',
+        'numpy',
         'src',
         'src.config',
         'src.constants',
+        'src.startup',
+        'src.logs',
+        'src.profiling',
+        'src.single_instance',
         'src.ui',
         'src.ui.main_window',
         'src.ui.about_window',
         'src.ui.welcome_window',
         'src.ui.tray',
+        'src.ui.gui_queue',
+        'src.ui.search_window',
+        'src.ui.perf_window',
         'src.core',
         'src.core.audio_engine',
+        'src.core.ffmpeg_monitor',
+        'src.core.level_meter',
+        'src.core.stream_capture',
+        'src.core.capture_sources',
+        'src.core.wav_repair',
+        'src.core.importer',
+        'src.core.catalog',
+        'src.core.storage_manager',
+        'src.core.folder_watcher',
+        'src.core.perf',
+        'src.core.model_registry',
+        'src.core.resource_governor',
+        'src.core.device_watcher',
         'src.core.transcriber',
+        'src.core.segment_store',
+        'src.core.transcription_service',
+        'src.core.transcript_index',
         'src.utils'
     ],
     hookspath=[],
@@ -1,5 +1,7 @@
 import os
 import sys
+import logging
+import argparse
 
 if getattr(sys, 'frozen', False):
     base_path = sys._MEIPASS
@@ -9,12 +11,49 @@ else:
 if base_path not in sys.path:
     sys.path.insert(0, base_path)
 
-from src.utils import setup_logging
-from src.ui.main_window import DashboardApp
-from src.config import AppConfig
+# Imported first: marks the launch time and starts the startup phase timers
+from src import startup
+from src.single_instance import COMMANDS, InstanceServer, send_command
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="Synthotic")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--start", action="store_true", help="Start recording")
+    group.add_argument("--stop", action="store_true", help="Stop recording and transcribe")
+    group.add_argument("--import", dest="import_file", metavar="FILE", help="Transcribe an audio file")
+    group.add_argument("--search", metavar="TEXT", help="Search all transcripts, print the hits and exit")
+    parser.add_argument(startup.TRACE_FLAG, action="store_true", help="Record nested startup spans")
+    # Ignore anything else the shell or a shortcut may pass
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+def command_from_args(args):
+    if args.start:
+        return "start", None
+    if args.stop:
+        return "stop", None
+    if args.import_file:
+        return "import", os.path.abspath(args.import_file)
+    return "show", None
+
+def search(text):
+    # Reads the index directly: no window, no running instance needed
+    import time
+    from src.core.transcript_index import format_offset, get_index
+    started = time.perf_counter()
+    hits = get_index().search(text)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    for hit in hits:
+        snippet = " ".join(hit["snippet"].split())
+        print(f"{hit['path']} [{format_offset(hit['offset'])}] {snippet}")
+    print(f"{len(hits)} hits in {elapsed_ms:.1f} ms", file=sys.stderr)
 
 def main():
-    lock_path = os.path.join(os.path.expanduser("~"), "synthotic.lock")
+    args = parse_args()
+    if args.search:
+        search(args.search)
+        return
+    command, argument = command_from_args(args)
     
     try:
         import ctypes
@@ -23,20 +62,41 @@ def main():
     except Exception:
         pass
 
-    if os.path.exists(lock_path):
-        try:
-            os.remove(lock_path)
-        except OSError:
-            sys.exit()
+    # Holding the instance port makes this the running instance; otherwise hand the
+    # command over before any UI module is imported
+    server = None
+    instance_unreachable = False
+    if not startup.benchmark_mode():
+        server = InstanceServer.acquire()
+        if server is None:
+            if send_command(command, argument):
+                return
+            # Another program holds the port, or a running Synthotic is hung; logged once logging is up
+            instance_unreachable = True
+    
+    with startup.timer.phase("imports"):
+        from src.utils import setup_logging
+        from src.ui.main_window import DashboardApp
+        from src.config import AppConfig
+        from src import profiling
+    
+    config = None
     try:
-        with open(lock_path, 'w') as f:
-            f.write("LOCKED")
-
-        setup_logging()
-        config = AppConfig()
+        with startup.timer.phase("setup_logging"):
+            setup_logging()
+        if instance_unreachable:
+            logging.getLogger(__name__).warning("Instance port in use but no running instance answered, starting anyway")
+        with startup.timer.phase("AppConfig"):
+            config = AppConfig()
+        # Off unless switched on in Settings or by SYNTHOTIC_PROFILE; covers the Tk loop from here
+        profiling.configure(config)
+        
+        with startup.timer.phase("onboarding_check"):
+            show_wizard = config.get("first_run") and not startup.benchmark_mode()  # Default is True in AppConfig
         
         # ONBOARDING WIZARD - Show before main window if first run
-        if config.get("first_run"):  # Default is True in AppConfig
+        if show_wizard:
+            startup.timer.mark("onboarding_shown")
             import tkinter as tk
             from src.ui.onboarding_wizard import OnboardingWizard
             
@@ -55,17 +115,29 @@ def main():
                 return
             
             temp_root.destroy()
+            # Time spent in the wizard is user time, not startup cost
+            startup.timer.mark("onboarding_closed")
         
         # Main application
         app = DashboardApp(config)
+        if instance_unreachable:
+            app.after_idle(app.warn_instance_unreachable)
+        if command != "show":
+            app.gui_queue.put((COMMANDS[command], argument))
+        if server:
+            server.set_handler(lambda cmd, arg: app.gui_queue.put((cmd, arg)))
         app.mainloop()
         
     finally:
-        if os.path.exists(lock_path): 
-            try:
-                os.remove(lock_path)
-            except Exception:
-                pass
+        # Push out any debounced config write and a running profile before the process exits
+        if config:
+            profiling.stop_session()
+            config.flush()
+        if server:
+            server.close()
 
 if __name__ == "__main__":
+    # The transcription worker is a spawned process; in a frozen build it starts this exe again
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
@@ -1,10 +1,24 @@
 import os
 import json
+import shutil
 import logging
+import threading
+import weakref
+from contextlib import contextmanager
 from src.constants import CONFIG_FILE, BASE_DIR
 
 logger = logging.getLogger(__name__)
 
+CONFIG_BACKUP_FILE = CONFIG_FILE + ".bak"
+SAVE_DELAY = 0.5  # seconds of quiet before a debounced save hits the disk
+
+def _readable_config(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return isinstance(json.load(f), dict)
+    except (OSError, ValueError):
+        return False
+
 class AppConfig:
     
     def __init__(self):
@@ -13,33 +27,152 @@ class AppConfig:
             "first_run": True,
             "loopback_device_guid": None,
             "mic_device_guid": None,
-            "output_folder": None
+            "output_folder": None,
+            "silence_warning_seconds": 10,
+            "capture_backend": "ffmpeg",
+            "channel_mode": "mix",
+            "import_mode": "auto",
+            "storage_transcode_days": 0,
+            "storage_delete_days": 0,
+            "storage_max_gb": 0,
+            "watch_folders": [],
+            "watch_stable_seconds": 10,
+            "profiling_enabled": False
         }
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._dirty = False
+        self._save_timer = None
+        self._subscribers = []
+        self._pending_changes = {}
         self.load()
         
     def load(self):
-        if os.path.exists(CONFIG_FILE):
+        for path in (CONFIG_FILE, CONFIG_BACKUP_FILE):
+            if not os.path.exists(path):
+                continue
             try:
-                with open(CONFIG_FILE, 'r', encoding='utf-8') as f: 
+                with open(path, 'r', encoding='utf-8') as f: 
                     data = json.load(f)
-                    self.settings.update(data)
+                self.settings.update(data)
+                if path == CONFIG_BACKUP_FILE:
+                    logger.warning(f"Config file unreadable, restored settings from backup")
+                return
             except Exception as e:
-                logger.error(f"Error loading config: {e}")
+                logger.error(f"Error loading config from {path}: {e}")
             
     def save(self):
-        try:
-            os.makedirs(BASE_DIR, exist_ok=True)
+        with self._lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+                self._save_timer = None
+            payload = json.dumps(self.settings, indent=2, ensure_ascii=False)
+            self._dirty = False
             
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2, ensure_ascii=False)
-            
-            logger.info(f"Config saved successfully")
-        except Exception as e:
-            logger.error(f"Error saving config: {e}")
+            try:
+                os.makedirs(BASE_DIR, exist_ok=True)
+                
+                # Write a temp file and rename over the old one, so a crash never leaves a half-written config
+                tmp_path = CONFIG_FILE + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                # Only a config that still parses becomes the backup: after load() fell
+                # back to the .bak, copying the corrupt file would destroy the only good copy
+                if _readable_config(CONFIG_FILE):
+                    shutil.copy2(CONFIG_FILE, CONFIG_BACKUP_FILE)
+                elif os.path.exists(CONFIG_FILE):
+                    logger.warning("Config file unreadable, keeping the previous backup")
+                os.replace(tmp_path, CONFIG_FILE)
+                
+                logger.info(f"Config saved successfully")
+            except Exception as e:
+                self._dirty = True
+                logger.error(f"Error saving config: {e}")
         
     def get(self, key):
         return self.settings.get(key)
         
     def set(self, key, value):
-        self.settings[key] = value
-        self.save()
+        changes = None
+        with self._lock:
+            if self.settings.get(key) != value:
+                self._pending_changes[key] = value
+            self.settings[key] = value
+            self._dirty = True
+            if self._batch_depth == 0:
+                self._schedule_save()
+                changes = self._take_changes()
+        if changes:
+            self._notify(changes)
+    
+    @contextmanager
+    def batch(self):
+        """Group several set() calls into a single write when the block exits."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            changes = None
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    if self._dirty:
+                        self.save()
+                    changes = self._take_changes()
+            if changes:
+                self._notify(changes)
+    
+    def flush(self):
+        with self._lock:
+            if self._dirty:
+                self.save()
+    
+    def _schedule_save(self):
+        if self._save_timer:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(SAVE_DELAY, self.flush)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+    
+    def subscribe(self, callback, keys=None):
+        """
+        Call `callback(changes)` with a {key: new_value} dict whenever one of
+        `keys` (or any key) changes; a batch is delivered as one notification.
+        Bound methods are held weakly, so subscribers don't outlive their owner.
+        """
+        if hasattr(callback, "__self__"):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback
+        with self._lock:
+            self._subscribers.append((ref, frozenset(keys) if keys else None))
+        return callback
+    
+    def unsubscribe(self, callback):
+        with self._lock:
+            self._subscribers = [(ref, keys) for ref, keys in self._subscribers if ref() not in (None, callback)]
+    
+    def _take_changes(self):
+        changes, self._pending_changes = self._pending_changes, {}
+        return changes
+    
+    def _notify(self, changes):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        
+        for ref, keys in subscribers:
+            callback = ref()
+            if callback is None:
+                with self._lock:
+                    self._subscribers = [entry for entry in self._subscribers if entry[0] is not ref]
+                continue
+            relevant = changes if keys is None else {k: v for k, v in changes.items() if k in keys}
+            if not relevant:
+                continue
+            try:
+                callback(relevant)
+            except Exception as e:
+                logger.error(f"Config subscriber failed: {e}")
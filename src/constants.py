@@ -8,12 +8,22 @@ BUILD_DATE = "2026-02-08"
 BASE_DIR = os.path.join(os.path.expanduser("~"), "Documents", "Synthotic_Recordings")
 CONFIG_FILE = os.path.join(BASE_DIR, "config.json")
 LOG_FILE = os.path.join(BASE_DIR, "system.log")
+STARTUP_REPORT_FILE = os.path.join(BASE_DIR, "startup.json")
+INSTANCE_FILE = os.path.join(BASE_DIR, "instance.json")
+INDEX_DB_FILE = os.path.join(BASE_DIR, "index.db")
+CATALOG_DB_FILE = os.path.join(BASE_DIR, "catalog.db")
+INGEST_LEDGER_FILE = os.path.join(BASE_DIR, "ingest.db")
+PERF_LOG_FILE = os.path.join(BASE_DIR, "perf.jsonl")
+PROFILES_DIR = os.path.join(BASE_DIR, "profiles")
+MODELS_DIR = os.path.join(BASE_DIR, "models")
+MODEL_CHECKS_FILE = os.path.join(BASE_DIR, "model_checks.json")
 
 # Audio Constants (Standard for High-Fidelity Speech)
 SAMPLE_RATE = 48000
 CHANNELS = 2
 CHUNK_SIZE = 1024
 MODEL_SIZE = "small"  # Balanced for CPU inference speed vs accuracy
+METER_RATE_HZ = 20  # Level meter updates per second
 
 # Ensure Base Directory Exists
 os.makedirs(BASE_DIR, exist_ok=True)
@@ -73,6 +83,8 @@ LANG_TEXTS = {
         "err_loopback_msg": "Nenhum dispositivo de loopback de áudio do sistema foi encontrado.\n\nPara gravar o áudio do sistema, você precisa habilitar o 'Stereo Mix' ou dispositivo similar nas configurações de som do Windows.\n\nDeseja abrir as configurações de som agora?",
         "err_ffmpeg_title": "Erro no Motor de Áudio",
         "err_ffmpeg_msg": "Falha ao iniciar o motor de gravação de áudio. Verifique se o FFmpeg está instalado corretamente.",
+        "warn_instance_title": "Outra instância não responde",
+        "warn_instance_msg": "Outro Synthotic parece estar aberto, mas não responde. Esta janela funciona normalmente, mas atalhos e comandos como --start e --stop não chegam até ela. Se houver uma janela antiga travada, feche-a pelo Gerenciador de Tarefas.",
         "settings_title": "Configurações",
         "settings_audio": "Dispositivos de Áudio",
         "settings_loopback": "Áudio do Sistema (Loopback):",
@@ -97,6 +109,44 @@ LANG_TEXTS = {
         "onboarding_btn_finish": "Iniciar Synthotic",
         "onboarding_err_no_folder": "Por favor, selecione uma pasta válida.",
         "onboarding_err_no_devices": "Por favor, selecione ambos os dispositivos de áudio.",
+        "meter_loopback": "Sistema",
+        "meter_mic": "Microfone",
+        "warn_silent_title": "Sem Áudio Detectado",
+        "warn_silent_loopback": "O áudio do sistema está em silêncio. Verifique se o 'Mixagem Estéreo' está ativo.",
+        "warn_silent_mic": "O microfone está em silêncio. Verifique se ele não está mudo.",
+        "warn_device_title": "Dispositivo de Áudio Alterado",
+        "warn_device_switch": "A gravação continua no novo dispositivo.",
+        "warn_device_lost": "Nenhum dispositivo disponível. A gravação será retomada quando um dispositivo for conectado.",
+        "import_copying": "Copiando arquivo",
+        "import_copy_failed": "Não foi possível copiar o arquivo; a transcrição usa o original.",
+        "settings_import_label": "Arquivos importados:",
+        "import_mode_auto": "Vincular ou copiar para a pasta de saída",
+        "import_mode_copy": "Sempre copiar",
+        "import_mode_reference": "Manter no lugar (sem cópia)",
+        "search_label": "🔍 Buscar nas transcrições:",
+        "search_title": "Busca",
+        "search_summary": "{count} resultados em {ms:.0f} ms (mais recentes primeiro). Clique duas vezes para abrir.",
+        "search_no_results": "Nenhum resultado.",
+        "settings_storage": "Armazenamento",
+        "settings_transcode_days": "Converter áudio para Opus após (dias, 0 = nunca):",
+        "settings_delete_days": "Apagar áudio após (dias, 0 = nunca; transcrições são mantidas):",
+        "settings_max_gb": "Limite de espaço para áudio (GB, 0 = sem limite):",
+        "storage_reclaimed": "{size} liberados de gravações antigas.",
+        "settings_watch": "Pastas Monitoradas",
+        "settings_watch_label": "Arquivos de áudio colocados nestas pastas são transcritos automaticamente.",
+        "settings_watch_add": "Adicionar pasta...",
+        "settings_watch_remove": "Remover",
+        "watch_done": "Transcrito: {name}",
+        "watch_failed": "Não foi possível transcrever {name}",
+        "perf_title": "Desempenho",
+        "perf_transcription": "Transcrições (últimas {count})",
+        "perf_recording": "Gravações (últimas {count})",
+        "perf_no_data": "Sem dados ainda.",
+        "perf_failed": "{count} com falha",
+        "perf_recent_log": "Log recente",
+        "settings_diagnostics": "Diagnóstico",
+        "settings_profiling": "Modo de perfil (deixa o app mais lento)",
+        "settings_profiling_label": "Grava perfis de CPU e memória em {folder} para anexar a um chamado.",
         "language": "pt_BR"
     },
     "en_US": {
@@ -140,6 +190,8 @@ LANG_TEXTS = {
         "err_loopback_msg": "No system audio loopback device found.\n\nTo record system audio, you need to enable 'Stereo Mix' or similar loopback device in Windows Sound settings.\n\nWould you like to open the sound settings now?",
         "err_ffmpeg_title": "Audio Engine Error",
         "err_ffmpeg_msg": "Failed to start audio recording engine. Please verify that FFmpeg is installed correctly.",
+        "warn_instance_title": "Another instance is not responding",
+        "warn_instance_msg": "Another Synthotic seems to be running but does not respond. This window works normally, but shortcuts and commands such as --start and --stop cannot reach it. If an old window is frozen, close it from the Task Manager.",
         "settings_title": "Settings",
         "settings_audio": "Audio Devices",
         "settings_loopback": "System Audio (Loopback):",
@@ -164,6 +216,44 @@ LANG_TEXTS = {
         "onboarding_btn_finish": "Start Synthotic",
         "onboarding_err_no_folder": "Please select a valid folder.",
         "onboarding_err_no_devices": "Please select both audio devices.",
+        "meter_loopback": "System",
+        "meter_mic": "Mic",
+        "warn_silent_title": "No Audio Detected",
+        "warn_silent_loopback": "System audio is silent. Check that 'Stereo Mix' is enabled.",
+        "warn_silent_mic": "The microphone is silent. Check that it is not muted.",
+        "warn_device_title": "Audio Device Changed",
+        "warn_device_switch": "Recording continues on the new device.",
+        "warn_device_lost": "No device available. Recording will resume when a device is connected.",
+        "import_copying": "Copying file",
+        "import_copy_failed": "Could not copy the file; the transcript uses the original.",
+        "settings_import_label": "Imported files:",
+        "import_mode_auto": "Link or copy into the output folder",
+        "import_mode_copy": "Always copy",
+        "import_mode_reference": "Keep in place (no copy)",
+        "search_label": "🔍 Search transcripts:",
+        "search_title": "Search",
+        "search_summary": "{count} hits in {ms:.0f} ms (newest first). Double-click to open.",
+        "search_no_results": "No results.",
+        "settings_storage": "Storage",
+        "settings_transcode_days": "Convert audio to Opus after (days, 0 = never):",
+        "settings_delete_days": "Delete audio after (days, 0 = never; transcripts are kept):",
+        "settings_max_gb": "Audio size limit (GB, 0 = no limit):",
+        "storage_reclaimed": "Freed {size} from old recordings.",
+        "settings_watch": "Watch Folders",
+        "settings_watch_label": "Audio files dropped into these folders are transcribed automatically.",
+        "settings_watch_add": "Add folder...",
+        "settings_watch_remove": "Remove",
+        "watch_done": "Transcribed: {name}",
+        "watch_failed": "Could not transcribe {name}",
+        "perf_title": "Performance",
+        "perf_transcription": "Transcriptions (last {count})",
+        "perf_recording": "Recordings (last {count})",
+        "perf_no_data": "No data yet.",
+        "perf_failed": "{count} failed",
+        "perf_recent_log": "Recent log",
+        "settings_diagnostics": "Diagnostics",
+        "settings_profiling": "Profiling mode (slows the app down)",
+        "settings_profiling_label": "Writes CPU and memory profiles to {folder}, ready to attach to a ticket.",
         "language": "en_US"
     }
 }
@@ -7,12 +7,23 @@ import subprocess
 import datetime
 import logging
 import json
-import time
 import re
-import sounddevice as sd
-from typing import Optional, Tuple
+import time
+import threading
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
+
+from src import startup
+from src.constants import BASE_DIR
+from src.profiling import profiled
+from src.core import perf
+from src.core.catalog import audio_duration, record
+from src.core.resource_governor import get_governor
+from src.core.device_watcher import DeviceWatcher, get_sounddevice, refresh_portaudio
+from src.core.wav_repair import repair_wav
 
-from src.constants import BASE_DIR, SAMPLE_RATE
+if TYPE_CHECKING:
+    # NumPy, soundfile and PortAudio load on the first recording, not at startup
+    from src.core.capture_sources import CaptureSource
 
 logger = logging.getLogger(__name__)
 
@@ -25,20 +36,53 @@ class FFmpegRuntimeError(Exception):
     pass
 
 
+# Settings the engine mirrors from AppConfig; updates are pushed, never re-read from disk
+ENGINE_SETTINGS = (
+    "output_folder", "capture_backend", "channel_mode",
+    "loopback_device_guid", "mic_device_guid", "silence_warning_seconds"
+)
+
+
+def warm_up():
+    """Import the capture stack and initialise PortAudio ahead of the first recording."""
+    started = time.perf_counter()
+    import src.core.capture_sources  # noqa: F401
+    get_sounddevice()
+    logger.info(f"Capture stack loaded in {time.perf_counter() - started:.2f}s")
+
+
 class AudioEngine:
     
-    def __init__(self):
-        self._process: Optional[subprocess.Popen] = None
+    def __init__(self, config=None, source: Optional["CaptureSource"] = None):
+        self._settings = {}
+        if config is not None:
+            self._settings = {key: config.get(key) for key in ENGINE_SETTINGS}
+            config.subscribe(self._on_config_changed, keys=ENGINE_SETTINGS)
+        
+        # A fixed source (replay/synthetic) bypasses device discovery entirely
+        self.source = source
+        self._active_source: Optional["CaptureSource"] = None
+        self.silence_timeout = 10.0
+        self.silence_callback = None
+        self.failover_callback = None
+        self._watcher: Optional[DeviceWatcher] = None
+        self._failover_lock = threading.Lock()
+        self._segments = []
+        self._gaps = []
+        self._backend = "ffmpeg"
+        self._channel_mode = "mix"
         self.wav_path: Optional[str] = None
-        self._ffmpeg_path = self._find_ffmpeg()
+        with startup.timer.phase("_find_ffmpeg"):
+            self._ffmpeg_path = self._find_ffmpeg()
         
         if not self._ffmpeg_path:
-            raise RuntimeError(
-                "FFmpeg not found. Please run 'python utils/download_ffmpeg.py' "
-                "to download the required binary."
-            )
-        
-        logger.info(f"FFmpeg found at: {self._ffmpeg_path}")
+            if source is None:
+                raise RuntimeError(
+                    "FFmpeg not found. Please run 'python utils/download_ffmpeg.py' "
+                    "to download the required binary."
+                )
+        else:
+            logger.info(f"FFmpeg found at: {self._ffmpeg_path}")
     
     def _find_ffmpeg(self) -> Optional[str]:
         script_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -107,32 +151,24 @@ class AudioEngine:
             logger.error(f"Error enumerating FFmpeg devices: {e}")
             return []
     
-    def _load_device_guids_from_config(self):
-        try:
-            from src.constants import CONFIG_FILE
-            
-            if os.path.isfile(CONFIG_FILE):
-                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    loopback_guid = config.get('loopback_device_guid')
-                    mic_guid = config.get('mic_device_guid')
-                    
-                    if loopback_guid or mic_guid:
-                        logger.info(f"Loaded device GUIDs from config")
-                    
-                    return loopback_guid, mic_guid
-        except Exception as e:
-            pass
-        
-        return None, None
+    def _on_config_changed(self, changes: dict):
+        self._settings.update(changes)
+    
+    def _configured_device_guids(self):
+        return self._settings.get('loopback_device_guid'), self._settings.get('mic_device_guid')
     
-    def _discover_devices(self) -> Tuple[Optional[str], Optional[str]]:
+    def _discover_devices(self, use_config: bool = True) -> Tuple[Optional[str], Optional[str]]:
         try:
-            loopback_guid, mic_guid = self._load_device_guids_from_config()
+            loopback_guid, mic_guid = self._configured_device_guids() if use_config else (None, None)
             if loopback_guid:
                 logger.info(f"Using configured device GUIDs from settings")
                 return loopback_guid, mic_guid
             
+            sd = get_sounddevice()
+            if sd is None:
+                logger.error("sounddevice unavailable, cannot discover devices")
+                return None, None
+            
             devices = sd.query_devices()
             loopback_device = None
             mic_device = None
@@ -182,200 +218,420 @@ class AudioEngine:
             logger.error(f"Error discovering devices: {e}")
             return None, None
     
-    def _resolve_device_name(self, friendly_name: str) -> str:
+    def _device_listing(self) -> Callable[[], list]:
+        """
+        The dshow device list, taken at most once per call site: each listing
+        runs ffmpeg -list_devices, which must not happen several times per event.
+        """
+        devices = []
+        
+        def listing() -> list:
+            if not devices:
+                devices.append(self.get_ffmpeg_devices())
+            return devices[0]
+        
+        return listing
+    
+    def _resolve_device_name(self, friendly_name: str, listing: Optional[Callable[[], list]] = None) -> str:
         if not friendly_name:
             return friendly_name
-            
-        cmd = [self._ffmpeg_path, "-f", "dshow", "-list_devices", "true", "-i", "dummy"]
         
-        try:
-            res = subprocess.run(
-                cmd, 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE, 
-                text=True, 
-                encoding='utf-8', 
-                errors='replace',
-                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
-            )
-            output = res.stderr
-            lines = output.split('\n')
-            
-            # Exact match
-            for i, line in enumerate(lines):
-                if f'"{friendly_name}"' in line and ('(audio)' in line or '(video, audio)' in line):
-                    if i + 1 < len(lines) and "Alternative name" in lines[i+1]:
-                        match = re.search(r'Alternative name "(.*)"', lines[i+1])
-                        if match:
-                            alt_name = match.group(1)
-                            logger.info(f"Resolved device to GUID")
-                            return alt_name
-            
-            # Fuzzy match - first 20 chars
-            friendly_prefix = friendly_name[:20].lower()
-            
-            for i, line in enumerate(lines):
-                if '"' in line and ('(audio)' in line or '(video, audio)' in line):
-                    match_name = re.search(r'"([^"]+)"', line)
-                    if match_name:
-                        ffmpeg_device_name = match_name.group(1)
-                        ffmpeg_prefix = ffmpeg_device_name[:20].lower()
-                        
-                        if friendly_prefix == ffmpeg_prefix:
-                            if i + 1 < len(lines) and "Alternative name" in lines[i+1]:
-                                match_alt = re.search(r'Alternative name "(.*)"', lines[i+1])
-                                if match_alt:
-                                    alt_name = match_alt.group(1)
-                                    logger.info(f"Resolved device to GUID (fuzzy match)")
-                                    return alt_name
-            
-            # Substring match
-            for i, line in enumerate(lines):
-                if ('(audio)' in line or '(video, audio)' in line):
-                    match_name = re.search(r'"([^"]+)"', line)
-                    if match_name:
-                        ffmpeg_device_name = match_name.group(1)
-                        if friendly_name.lower() in ffmpeg_device_name.lower():
-                            if i + 1 < len(lines) and "Alternative name" in lines[i+1]:
-                                match_alt = re.search(r'Alternative name "(.*)"', lines[i+1])
-                                if match_alt:
-                                    alt_name = match_alt.group(1)
-                                    logger.info(f"Resolved device to GUID (substring match)")
-                                    return alt_name
-            
-            logger.warning(f"Could not resolve GUID for device, using original name")
-            return friendly_name
-            
-        except Exception as e:
-            logger.error(f"Error parsing FFmpeg device list: {e}")
-            return friendly_name
+        audio_devices = [
+            device for device in (listing or self.get_ffmpeg_devices)()
+            if device["type"] in ("audio", "video_audio")
+        ]
+        
+        # Exact match
+        for device in audio_devices:
+            if device["friendly_name"] == friendly_name:
+                logger.info(f"Resolved device to GUID")
+                return device["alternative_name"]
+        
+        # Fuzzy match - first 20 chars
+        friendly_prefix = friendly_name[:20].lower()
+        for device in audio_devices:
+            if device["friendly_name"][:20].lower() == friendly_prefix:
+                logger.info(f"Resolved device to GUID (fuzzy match)")
+                return device["alternative_name"]
+        
+        # Substring match
+        for device in audio_devices:
+            if friendly_name.lower() in device["friendly_name"].lower():
+                logger.info(f"Resolved device to GUID (substring match)")
+                return device["alternative_name"]
+        
+        logger.warning(f"Could not resolve GUID for device, using original name")
+        return friendly_name
 
+    @profiled("recording_start")
     def start(self) -> str:
-        from src.constants import CONFIG_FILE
-        output_base = BASE_DIR
-        try:
-            if os.path.isfile(CONFIG_FILE):
-                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    configured_folder = config.get('output_folder')
-                    if configured_folder:
-                        output_base = configured_folder
-                        logger.info(f"Using configured output folder: {output_base}")
-        except Exception:
-            pass
+        output_base = self._settings.get('output_folder') or BASE_DIR
+        if output_base != BASE_DIR:
+            logger.info(f"Using configured output folder: {output_base}")
+        
+        self._backend = self._settings.get('capture_backend') or "ffmpeg"
+        self._channel_mode = self._settings.get('channel_mode') or "mix"
+        self.silence_timeout = float(self._settings.get('silence_warning_seconds') or self.silence_timeout)
+        source = self.source or self._create_source(self._backend, self._channel_mode)
         
         ts = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         folder = os.path.join(output_base, f"Live_{ts}")
         os.makedirs(folder, exist_ok=True)
         self.wav_path = os.path.join(folder, "audio.wav")
+        self._segments = []
+        self._gaps = []
+        
+        self._start_segment(source, self.wav_path)
+        logger.info(f"Recording to: {self.wav_path}")
+        record(folder, kind="live", status="recording", audio_path=self.wav_path, devices=self._session_devices())
+        # Transcription running alongside backs off until stop()
+        get_governor().set_recording(True)
         
+        # Fixed sources (replay/synthetic) have no devices to lose
+        if self.source is None:
+            self._watcher = DeviceWatcher(
+                self._on_device_change,
+                can_refresh=lambda: not (self._active_source and self._active_source.holds_portaudio),
+                health_check=lambda: self._active_source is None or self._active_source.is_healthy
+            ).start()
+        
+        return self.wav_path
+    
+    def _start_segment(self, source: "CaptureSource", path: str):
+        from src.core.capture_sources import CaptureError
+        
+        source.silence_timeout = self.silence_timeout
+        source.on_silence = self.silence_callback
+        
+        started_at = time.monotonic()
+        try:
+            source.start(path)
+        except CaptureError as e:
+            raise FFmpegRuntimeError(str(e))
+        except Exception as e:
+            logger.error(f"Failed to start capture ({source.label}): {e}")
+            raise FFmpegRuntimeError(str(e))
+        
+        self._active_source = source
+        self._segments.append({
+            "path": path,
+            "started_at": started_at,
+            "stopped_at": None,
+            "devices": source.describe()
+        })
+    
+    def _stop_segment(self):
+        source = self._active_source
+        self._active_source = None
+        if source:
+            source.stop()
+        if self._segments and self._segments[-1]["stopped_at"] is None:
+            self._segments[-1]["stopped_at"] = time.monotonic()
+    
+    def _on_device_change(self, reason: str):
+        if not self._failover_lock.acquire(blocking=False):
+            return
+        try:
+            self._failover(reason)
+        finally:
+            self._failover_lock.release()
+    
+    def _failover(self, reason: str):
+        if self._watcher is None:
+            return
+        
+        # One dshow listing serves the comparison and the restart
+        listing = self._device_listing()
+        current = self._active_source
+        candidate = None
+        if current is not None and current.is_healthy and reason == "device_change":
+            # Only restart if the devices we would pick now differ from the running ones
+            try:
+                candidate = self._create_source(self._backend, self._channel_mode, validate=True, listing=listing)
+            except LoopbackNotFoundError:
+                candidate = None
+            if candidate is not None and candidate.describe() == current.describe():
+                return
+        
+        logger.warning(f"Restarting capture after {reason}")
+        # A source holding PortAudio kept the watcher from refreshing it, so the
+        # candidate may point at stale devices until PortAudio is refreshed here
+        source = None if candidate is None or current.holds_portaudio else candidate
+        self._stop_segment()
+        if source is None and get_sounddevice() is not None:
+            try:
+                refresh_portaudio()
+            except Exception as e:
+                logger.debug(f"PortAudio refresh failed: {e}")
+        
+        try:
+            if source is None:
+                source = self._create_source(self._backend, self._channel_mode, validate=True, listing=listing)
+            folder = os.path.dirname(self.wav_path)
+            path = os.path.join(folder, f"audio.part{len(self._segments) + 1}.wav")
+            self._start_segment(source, path)
+        except (LoopbackNotFoundError, FFmpegRuntimeError) as e:
+            # No usable device right now: the watcher retries on the next change
+            logger.error(f"Capture failover failed, recording paused: {e}")
+            if self.failover_callback:
+                self.failover_callback(None)
+            return
+        
+        logger.info(f"Capture resumed on {source.describe()}")
+        record(folder, devices=self._session_devices())
+        if self.failover_callback:
+            self.failover_callback(source.describe())
+    
+    def _session_devices(self) -> list:
+        devices = []
+        for segment in self._segments:
+            if segment["devices"] not in devices:
+                devices.append(segment["devices"])
+        return devices
+    
+    def _devices_present(self, backend: str, loopback: str, mic: Optional[str],
+                         listing: Callable[[], list]) -> bool:
+        if backend == "sounddevice":
+            return self._resolve_sd_device(loopback, listing) is not None and \
+                (not mic or self._resolve_sd_device(mic, listing) is not None)
+        
+        available = set()
+        for device in listing():
+            available.add(device["alternative_name"])
+            available.add(device["friendly_name"])
+        return loopback in available and (not mic or mic in available)
+    
+    def _create_source(self, backend: str, channel_mode: str, validate: bool = False,
+                       listing: Optional[Callable[[], list]] = None) -> "CaptureSource":
+        from src.core.capture_sources import DshowFFmpegSource, create_test_source
+        
+        if backend.startswith("synthetic") or backend.startswith("replay:"):
+            return create_test_source(backend, channel_mode=channel_mode)
+        
+        listing = listing or self._device_listing()
         loopback, mic = self._discover_devices()
+        if validate and loopback and not self._devices_present(backend, loopback, mic, listing):
+            # Configured device is gone (unplugged headset): fall back to auto-detection
+            logger.warning("Configured audio device unavailable, falling back to auto-detect")
+            loopback, mic = self._discover_devices(use_config=False)
         
         if not loopback:
             raise LoopbackNotFoundError()
-            
-        if loopback and loopback.startswith('@device_cm_'):
+        
+        if backend == "sounddevice":
+            return self._create_sounddevice_source(loopback, mic, channel_mode, listing)
+        
+        if loopback.startswith('@device_cm_'):
             loopback_arg = loopback
         else:
-            loopback_arg = self._resolve_device_name(loopback)
+            loopback_arg = self._resolve_device_name(loopback, listing)
         
         if mic:
             if mic.startswith('@device_cm_'):
                 mic_arg = mic
             else:
-                mic_arg = self._resolve_device_name(mic)
+                mic_arg = self._resolve_device_name(mic, listing)
+            logger.info(f"Starting dual-channel recording: {loopback} + {mic}")
         else:
             mic_arg = None
+            logger.info(f"Starting recording without microphone")
         
+        return DshowFFmpegSource(self._ffmpeg_path, loopback_arg, mic_arg)
+    
+    def _resolve_sd_device(self, name: str, listing: Optional[Callable[[], list]] = None) -> Optional[int]:
+        if name.startswith('@device_cm_'):
+            matches = [
+                d["friendly_name"] for d in (listing or self.get_ffmpeg_devices)() if d["alternative_name"] == name
+            ]
+            if not matches:
+                return None
+            name = matches[0]
         
-        cmd = [self._ffmpeg_path]
-        
-        if mic:
-            logger.info(f"Starting dual-channel recording: {loopback} + {mic}")
-            logger.debug(f"  → Loopback GUID/Name: {loopback_arg}")
-            logger.debug(f"  → Mic GUID/Name: {mic_arg}")
-            
-            cmd.extend([
-                "-f", "dshow",
-                "-i", f"audio={loopback_arg}",
-                "-f", "dshow",
-                "-i", f"audio={mic_arg}",
-                # Use amerge + pan for better audio mixing control
-                # This ensures both inputs are heard at balanced levels
-                "-filter_complex",
-                "[0:a]volume=0.9[a0];[1:a]volume=1.2[a1];[a0][a1]amerge=inputs=2[merged];[merged]pan=stereo|c0<c0+c2|c1<c1+c3[out]",
-                "-map", "[out]",
-                "-ar", str(SAMPLE_RATE),
-                "-ac", "2",
-                "-y",
-                self.wav_path
-            ])
-        else:
-            logger.info(f"Starting recording without microphone")
-            cmd.extend([
-                "-f", "dshow",
-                "-i", f"audio={loopback_arg}",
-                "-ar", str(SAMPLE_RATE),
-                "-ac", "2",
-                "-y",
-                self.wav_path
-            ])
+        # MME truncates device names to 31 characters, so fall back to a prefix match
+        lowered = name.lower()
+        prefix_match = None
+        sd = get_sounddevice()
+        if sd is None:
+            return None
+        for index, device in enumerate(sd.query_devices()):
+            if device['max_input_channels'] == 0:
+                continue
+            device_lower = device['name'].lower()
+            if device_lower == lowered:
+                return index
+            if prefix_match is None and (lowered.startswith(device_lower) or device_lower.startswith(lowered)):
+                prefix_match = index
+        return prefix_match
+    
+    def _create_sounddevice_source(self, loopback: str, mic: Optional[str], channel_mode: str,
+                                   listing: Callable[[], list]) -> "CaptureSource":
+        from src.core.capture_sources import SoundDeviceSource
         
-        try:
-            self._process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
-            )
-            logger.info(f"FFmpeg process started (PID: {self._process.pid})")
-            logger.info(f"Recording to: {self.wav_path}")
-            
-            time.sleep(0.5)
-            if self._process.poll() is not None:
-                _, stderr_output = self._process.communicate()
-                error_msg = stderr_output.decode('utf-8', errors='replace') if stderr_output else "Unknown error"
-                logger.error(f"FFmpeg process died immediately. Exit code: {self._process.returncode}")
-                logger.error(f"FFmpeg stderr: {error_msg}")
-                raise FFmpegRuntimeError(
-                    f"FFmpeg failed to start recording. Check the log file for details."
-                )
-            
-        except FFmpegRuntimeError:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to start FFmpeg process: {e}")
-            raise FFmpegRuntimeError(str(e))
+        devices = []
+        for source_name, device_name in (("loopback", loopback), ("mic", mic)):
+            if not device_name:
+                continue
+            device = self._resolve_sd_device(device_name, listing)
+            if device is None:
+                if source_name == "loopback":
+                    raise LoopbackNotFoundError()
+                logger.warning(f"Microphone not available to sounddevice, recording without it")
+                continue
+            devices.append((source_name, device))
         
-        return self.wav_path
+        return SoundDeviceSource(devices, channel_mode=channel_mode)
     
+    @profiled("recording_stop")
     def stop(self) -> str:
-        if self._process and self._process.poll() is None:
-            try:
-                self._process.communicate(input=b'q', timeout=5)
-                logger.info("FFmpeg process stopped gracefully")
-            except subprocess.TimeoutExpired:
-                logger.warning("FFmpeg did not stop gracefully, terminating...")
-                self._process.terminate()
-                try:
-                    self._process.wait(timeout=2)
-                except subprocess.TimeoutExpired:
-                    self._process.kill()
-                    logger.error("FFmpeg process killed forcefully")
-            except Exception as e:
-                logger.error(f"Error stopping FFmpeg: {e}")
-                self._process.kill()
+        if self._watcher:
+            self._watcher.stop()
+            self._watcher = None
+        get_governor().set_recording(False)
+        
+        # Last capture counters of the running source, before it is torn down
+        capture_stats = self.get_capture_stats() or {}
+        
+        stage = time.perf_counter()
+        with self._failover_lock:
+            self._stop_segment()
+        stop_s = time.perf_counter() - stage
+        
+        stage = time.perf_counter()
+        if len(self._segments) > 1:
+            self._stitch_segments()
+        stitch_s = time.perf_counter() - stage
         
+        folder = os.path.dirname(self.wav_path) if self.wav_path else None
+        job = dict(
+            folder=os.path.basename(folder or ""), channel_mode=self._channel_mode,
+            backend=self.source.label if self.source else self._backend,
+            segments=len(self._segments), gap_seconds=sum(gap["duration"] for gap in self._gaps),
+            stop_s=stop_s, stitch_s=stitch_s, wall_seconds=capture_stats.get("wall_time"),
+            dropped_frames=capture_stats.get("dropped_frames"), overflows=capture_stats.get("overflows"),
+            callback_max_us=capture_stats.get("callback_max_us")
+        )
         if not self.wav_path or not os.path.exists(self.wav_path):
+            if folder:
+                record(folder, status="failed", error="Output file does not exist")
+            perf.write_record("recording", status="failed", error="Output file does not exist", **job)
             raise FFmpegRuntimeError(
                 f"Recording failed: Output file does not exist."
             )
         
         file_size = os.path.getsize(self.wav_path)
         if file_size == 0:
+            record(folder, status="failed", error="Output file is empty")
+            perf.write_record("recording", status="failed", error="Output file is empty", **job)
             raise FFmpegRuntimeError(
                 f"Recording failed: Output file is empty."
             )
         
         logger.info(f"Recording stopped successfully. File size: {file_size} bytes")
+        duration = audio_duration(self.wav_path)
+        record(folder, status="recorded", size=file_size, duration=duration)
+        perf.write_record("recording", status="done", audio_seconds=duration, size=file_size, **job)
         return self.wav_path
+    
+    def _stitch_segments(self):
+        """
+        Join the segments of a recording that failed over into one continuous
+        audio.wav, filling the time between segments with silence. Gaps are
+        written to session.json next to the audio.
+        """
+        try:
+            import numpy as np
+            import soundfile as sf
+        except ImportError:
+            logger.error("soundfile unavailable, segments left unmerged")
+            return
+        
+        folder = os.path.dirname(self.wav_path)
+        first_part = os.path.join(folder, "audio.part1.wav")
+        os.replace(self.wav_path, first_part)
+        self._segments[0]["path"] = first_part
+        
+        timeline = 0.0
+        self._gaps = []
+        previous_end = None
+        
+        with sf.SoundFile(first_part) as probe:
+            sample_rate, channels = probe.samplerate, probe.channels
+        
+        silence = np.zeros((sample_rate, channels), dtype=np.float32)
+        with sf.SoundFile(self.wav_path, mode="w", samplerate=sample_rate, channels=channels,
+                          subtype="PCM_16", format="WAV") as out:
+            for segment in self._segments:
+                if not os.path.isfile(segment["path"]) or os.path.getsize(segment["path"]) <= 44:
+                    continue
+                repair_wav(segment["path"])
+                
+                if previous_end is not None:
+                    gap = max(0.0, segment["started_at"] - previous_end)
+                    self._gaps.append({"offset": round(timeline, 3), "duration": round(gap, 3)})
+                    gap_frames = int(gap * sample_rate)
+                    while gap_frames > 0:
+                        frames = min(gap_frames, sample_rate)
+                        out.write(silence[:frames])
+                        gap_frames -= frames
+                    timeline += gap
+                
+                segment["offset"] = round(timeline, 3)
+                frames_written = 0
+                for block in sf.blocks(segment["path"], blocksize=sample_rate * 10, dtype="float32", always_2d=True):
+                    out.write(block[:, :channels])
+                    frames_written += block.shape[0]
+                duration = frames_written / sample_rate
+                timeline += duration
+                previous_end = segment["started_at"] + duration
+        
+        for segment in self._segments:
+            try:
+                os.remove(segment["path"])
+            except OSError:
+                pass
+        
+        metadata = {
+            "segments": [
+                {"devices": segment["devices"], "offset": segment.get("offset")} for segment in self._segments
+            ],
+            "gaps": self._gaps,
+            "duration": round(timeline, 3)
+        }
+        with open(os.path.join(folder, "session.json"), "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        
+        total_gap = sum(gap["duration"] for gap in self._gaps)
+        logger.info(f"Merged {len(self._segments)} capture segments, {total_gap:.1f}s of gaps recorded")
+    
+    @property
+    def ffmpeg_path(self) -> Optional[str]:
+        return self._ffmpeg_path
+    
+    @property
+    def is_capturing(self) -> bool:
+        return self._active_source is not None and self._active_source.is_running
+    
+    @property
+    def gaps(self) -> list:
+        return list(self._gaps)
+    
+    def get_capture_stats(self) -> Optional[dict]:
+        if not self._active_source:
+            return None
+        stats = self._active_source.get_stats()
+        if stats and len(self._segments) > 1:
+            # Report the position on the whole timeline, not within the current segment
+            stats = dict(stats)
+            stats["capture_time"] += self._segments[-1]["started_at"] - self._segments[0]["started_at"]
+            stats["segments"] = len(self._segments)
+        return stats
+    
+    def get_levels(self) -> dict:
+        if not self._active_source:
+            return {}
+        return self._active_source.get_levels()
+    
+    def get_capture_log(self, count: Optional[int] = None) -> list:
+        if not self._active_source:
+            return []
+        return self._active_source.get_log(count)
@@ -0,0 +1,568 @@
+import sys
+import time
+import logging
+from abc import ABC, abstractmethod
+import threading
+import subprocess
+from typing import Dict, List, Optional
+
+import numpy as np
+
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None
+
+from src.constants import SAMPLE_RATE, CHANNELS
+from src.core.ffmpeg_monitor import FFmpegStderrMonitor
+from src.core.level_meter import LevelMeter, METER_SAMPLE_RATE
+from src.core.stream_capture import StreamCapture, RING_SECONDS, default_stream_factory
+
+logger = logging.getLogger(__name__)
+
+
+class CaptureError(Exception):
+    pass
+
+
+class CaptureSource(ABC):
+    """
+    Records one session into a WAV file. Sources are reusable: every start()
+    begins a new recording at the given path.
+    """
+
+    label = "source"
+
+    def __init__(self):
+        self.silence_timeout = 10.0
+        self.on_silence = None
+        self._meter: Optional[LevelMeter] = None
+
+    @abstractmethod
+    def start(self, wav_path: str):
+        """Begin a new recording into `wav_path`."""
+
+    @abstractmethod
+    def stop(self):
+        """Finish the recording and close its file."""
+
+    @property
+    def is_running(self) -> bool:
+        return False
+
+    @property
+    def is_finished(self) -> bool:
+        """True when a finite source has produced all of its audio."""
+        return False
+
+    @property
+    def is_healthy(self) -> bool:
+        return self.is_running
+
+    @property
+    def holds_portaudio(self) -> bool:
+        """True if the source keeps PortAudio streams open while recording."""
+        return False
+
+    def get_stats(self) -> Optional[dict]:
+        return None
+
+    def get_levels(self) -> dict:
+        if not self._meter or not self.is_running:
+            return {}
+        return self._meter.get_levels()
+
+    def get_log(self, count: Optional[int] = None) -> list:
+        return []
+
+    def describe(self) -> dict:
+        return {"source": self.label}
+
+    def _create_meter(self, sources: List[str], sample_rate: int) -> LevelMeter:
+        self._meter = LevelMeter(
+            sources,
+            sample_rate=sample_rate,
+            silence_timeout=self.silence_timeout,
+            on_silence=self.on_silence
+        )
+        return self._meter
+
+
+# --- FFMPEG / DIRECTSHOW ---
+
+class DshowFFmpegSource(CaptureSource):
+    """Windows capture through an ffmpeg subprocess reading DirectShow devices."""
+
+    label = "dshow"
+
+    def __init__(self, ffmpeg_path: str, loopback_arg: str, mic_arg: Optional[str] = None,
+                 sample_rate: int = SAMPLE_RATE):
+        super().__init__()
+        self.ffmpeg_path = ffmpeg_path
+        self.loopback_arg = loopback_arg
+        self.mic_arg = mic_arg
+        self.sample_rate = sample_rate
+        self._process: Optional[subprocess.Popen] = None
+        self._stderr_monitor: Optional[FFmpegStderrMonitor] = None
+
+    def build_command(self, wav_path: str) -> list:
+        cmd = [self.ffmpeg_path]
+        meter_fmt = f"aformat=sample_fmts=s16:sample_rates={METER_SAMPLE_RATE}:channel_layouts=mono"
+
+        if self.mic_arg:
+            cmd.extend([
+                "-f", "dshow",
+                "-i", f"audio={self.loopback_arg}",
+                "-f", "dshow",
+                "-i", f"audio={self.mic_arg}",
+                # Use amerge + pan for better audio mixing control
+                # This ensures both inputs are heard at balanced levels
+                # A low-rate mono tap of each input feeds the level meters
+                "-filter_complex",
+                "[0:a]asplit=2[l0][l1];[1:a]asplit=2[m0][m1];"
+                "[l0]volume=0.9[a0];[m0]volume=1.2[a1];[a0][a1]amerge=inputs=2[merged];[merged]pan=stereo|c0<c0+c2|c1<c1+c3[out];"
+                f"[l1]{meter_fmt}[lm];[m1]{meter_fmt}[mm];[lm][mm]amerge=inputs=2[meter]",
+            ])
+        else:
+            cmd.extend([
+                "-f", "dshow",
+                "-i", f"audio={self.loopback_arg}",
+                "-filter_complex",
+                f"[0:a]asplit=2[out][l1];[l1]{meter_fmt}[meter]",
+            ])
+
+        cmd.extend([
+            "-map", "[out]",
+            "-ar", str(self.sample_rate),
+            "-ac", "2",
+            "-y",
+            wav_path,
+            "-map", "[meter]", "-f", "s16le", "pipe:1"
+        ])
+        return cmd
+
+    def start(self, wav_path: str):
+        cmd = self.build_command(wav_path)
+        if self.mic_arg:
+            logger.debug(f"  → Loopback GUID/Name: {self.loopback_arg}")
+            logger.debug(f"  → Mic GUID/Name: {self.mic_arg}")
+
+        self._process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+        )
+        # Keep stderr flowing, otherwise long sessions stall on a full pipe
+        self._stderr_monitor = FFmpegStderrMonitor(self._process.stderr).start()
+        meter = self._create_meter(["loopback", "mic"] if self.mic_arg else ["loopback"], METER_SAMPLE_RATE)
+        meter.attach_pcm_stream(self._process.stdout)
+        logger.info(f"FFmpeg process started (PID: {self._process.pid})")
+
+        time.sleep(0.5)
+        if self._process.poll() is not None:
+            self._stderr_monitor.join(timeout=2)
+            error_msg = "\n".join(self._stderr_monitor.get_recent_lines(30)) or "Unknown error"
+            logger.error(f"FFmpeg process died immediately. Exit code: {self._process.returncode}")
+            logger.error(f"FFmpeg stderr: {error_msg}")
+            raise CaptureError("FFmpeg failed to start recording. Check the log file for details.")
+
+    def stop(self):
+        if self._process and self._process.poll() is None:
+            try:
+                # 'q' on stdin lets ffmpeg finalize the WAV header before exiting
+                self._process.stdin.write(b'q')
+                self._process.stdin.flush()
+                self._process.stdin.close()
+                self._process.wait(timeout=5)
+                logger.info("FFmpeg process stopped gracefully")
+            except subprocess.TimeoutExpired:
+                logger.warning("FFmpeg did not stop gracefully, terminating...")
+                self._process.terminate()
+                try:
+                    self._process.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+                    logger.error("FFmpeg process killed forcefully")
+            except Exception as e:
+                logger.error(f"Error stopping FFmpeg: {e}")
+                self._process.kill()
+
+        if self._stderr_monitor:
+            self._stderr_monitor.join(timeout=2)
+            stats = self._stderr_monitor.get_stats()
+            logger.info(
+                f"Capture stats: {stats['bytes_written']} bytes, "
+                f"{stats['capture_time']:.1f}s captured in {stats['wall_time']:.1f}s "
+                f"(drift {stats['drift']:+.2f}s)"
+            )
+
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process else None
+
+    def get_stats(self) -> Optional[dict]:
+        if not self._stderr_monitor:
+            return None
+        return self._stderr_monitor.get_stats()
+
+    def get_log(self, count: Optional[int] = None) -> list:
+        if not self._stderr_monitor:
+            return []
+        return self._stderr_monitor.get_recent_lines(count)
+
+    def describe(self) -> dict:
+        return {"source": self.label, "loopback": self.loopback_arg, "mic": self.mic_arg}
+
+
+# --- IN-PROCESS STREAMS ---
+
+class StreamSource(CaptureSource):
+    """Base for sources that feed StreamCapture through callback streams."""
+
+    speed = 1.0
+
+    def __init__(self, channel_mode: str = "mix", sample_rate: int = SAMPLE_RATE):
+        super().__init__()
+        self.channel_mode = channel_mode
+        self.sample_rate = sample_rate
+        self._capture: Optional[StreamCapture] = None
+        self._streams = []
+
+    @abstractmethod
+    def _sources(self) -> List[tuple]:
+        """(name, device) or (name, device, channels), one per captured input."""
+
+    @abstractmethod
+    def _stream_factory(self, **kwargs):
+        """Open one input stream; takes sounddevice.InputStream's keyword arguments."""
+
+    def _tracked_factory(self, **kwargs):
+        stream = self._stream_factory(**kwargs)
+        self._streams.append(stream)
+        return stream
+
+    def start(self, wav_path: str):
+        sources = self._sources()
+        self._streams = []
+        meter = self._create_meter([source[0] for source in sources], self.sample_rate)
+        self._capture = StreamCapture(
+            wav_path, sources,
+            channel_mode=self.channel_mode,
+            sample_rate=self.sample_rate,
+            stream_factory=self._tracked_factory,
+            meter=meter,
+            ring_seconds=RING_SECONDS * max(1.0, self.speed)
+        ).start()
+
+    def stop(self):
+        if not self._capture:
+            return
+        self._capture.stop()
+        stats = self._capture.get_stats()
+        logger.info(
+            f"Stream capture stats: {stats['capture_time']:.1f}s in {stats['wall_time']:.1f}s, "
+            f"padded {stats['padded_frames']} / dropped {stats['dropped_frames']} frames, "
+            f"callback avg {stats['callback_avg_us']:.0f}us max {stats['callback_max_us']:.0f}us"
+        )
+
+    @property
+    def is_running(self) -> bool:
+        return self._capture is not None and self._capture.is_running
+
+    @property
+    def is_healthy(self) -> bool:
+        return self.is_running and (self._capture.streams_active or self.is_finished)
+
+    @property
+    def is_finished(self) -> bool:
+        return bool(self._streams) and all(getattr(s, "finished", False) for s in self._streams)
+
+    def wait_finished(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.is_finished:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def get_stats(self) -> Optional[dict]:
+        return self._capture.get_stats() if self._capture else None
+
+
+class SoundDeviceSource(StreamSource):
+    """Live devices opened through PortAudio (sounddevice)."""
+
+    label = "sounddevice"
+    holds_portaudio = True
+
+    def __init__(self, devices: List[tuple], channel_mode: str = "mix", sample_rate: int = SAMPLE_RATE):
+        super().__init__(channel_mode, sample_rate)
+        self.devices = devices
+
+    def _sources(self):
+        # A mono headset or array mic rejects a stereo stream; StreamCapture upmixes it
+        return [(name, device, self._input_channels(device)) for name, device in self.devices]
+
+    @staticmethod
+    def _input_channels(device) -> int:
+        try:
+            import sounddevice as sd
+            return max(1, min(CHANNELS, sd.query_devices(device)["max_input_channels"]))
+        except Exception as e:
+            logger.debug(f"Could not query channels of device {device}: {e}")
+            return CHANNELS
+
+    def _stream_factory(self, **kwargs):
+        return default_stream_factory(**kwargs)
+
+    def describe(self) -> dict:
+        return {"source": self.label, **{name: device for name, device in self.devices}}
+
+
+class _PacedInputStream(ABC):
+    """
+    Minimal stand-in for sounddevice.InputStream that produces blocks on its own
+    thread, paced at `speed` times real time.
+    """
+
+    def __init__(self, device, samplerate, channels, dtype, blocksize, callback, speed=1.0):
+        self.device = device
+        self.samplerate = samplerate
+        self.channels = channels
+        self.blocksize = blocksize or 1024
+        self.callback = callback
+        self.speed = speed
+        self.finished = False
+        self.position = 0
+        self._block = np.zeros((self.blocksize, channels), dtype=np.float32)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"paced-stream-{device}", daemon=True)
+
+    @abstractmethod
+    def _fill(self, block: np.ndarray) -> int:
+        """Write the next frames into `block`; returns how many, 0 at the end."""
+
+    def _run(self):
+        period = self.blocksize / self.samplerate / self.speed
+        next_at = time.monotonic()
+        while not self._stop.is_set():
+            frames = self._fill(self._block)
+            if frames <= 0:
+                self.finished = True
+                return
+            now = time.monotonic()
+            info = _TimeInfo(now, now - period)
+            self.callback(self._block[:frames], frames, info, None)
+            self.position += frames
+            next_at += period
+            delay = next_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -1.0:
+                # Fell far behind (debugger, suspend): don't try to catch up in a burst
+                next_at = time.monotonic()
+
+    @property
+    def active(self) -> bool:
+        return self._thread.is_alive()
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=2)
+
+    def close(self):
+        pass
+
+
+class _TimeInfo:
+    __slots__ = ("currentTime", "inputBufferAdcTime")
+
+    def __init__(self, current, adc):
+        self.currentTime = current
+        self.inputBufferAdcTime = adc
+
+
+class ReplayInputStream(_PacedInputStream):
+    """Plays an audio file (any format soundfile reads) as if it were a device."""
+
+    def __init__(self, device, samplerate, channels, dtype, blocksize, callback, speed=1.0, loop=False):
+        super().__init__(device, samplerate, channels, dtype, blocksize, callback, speed)
+        self.loop = loop
+        self._file = sf.SoundFile(device)
+        if self._file.samplerate != samplerate:
+            raise CaptureError(
+                f"Replay file is {self._file.samplerate} Hz, capture runs at {samplerate} Hz"
+            )
+        self._read_buf = np.zeros((self.blocksize, self._file.channels), dtype=np.float32)
+
+    def _fill(self, block):
+        frames = self._file.read(self.blocksize, dtype="float32", out=self._read_buf, fill_value=None).shape[0]
+        if frames == 0 and self.loop:
+            self._file.seek(0)
+            frames = self._file.read(self.blocksize, dtype="float32", out=self._read_buf, fill_value=None).shape[0]
+        if frames == 0:
+            return 0
+        source = self._read_buf[:frames]
+        if source.shape[1] >= self.channels:
+            block[:frames] = source[:, :self.channels]
+        else:
+            block[:frames] = source[:, :1]
+        return frames
+
+    def close(self):
+        self._file.close()
+
+
+class SyntheticInputStream(_PacedInputStream):
+    """
+    Deterministic test signal: "tone" (440 Hz sine), "noise" (white noise) or
+    "speech" (harmonic voice with a wandering pitch, ~4 Hz syllable envelope
+    and random pauses), optionally limited to `duration` seconds.
+    """
+
+    def __init__(self, device, samplerate, channels, dtype, blocksize, callback,
+                 speed=1.0, duration=None, seed=0, amplitude=0.3):
+        super().__init__(device, samplerate, channels, dtype, blocksize, callback, speed)
+        self.signal = device
+        self.amplitude = amplitude
+        self.total_frames = int(duration * samplerate) if duration else None
+        self._rng = np.random.default_rng(seed)
+        self._phase = 0.0
+        self._talking = True
+        self._next_switch = 0
+        self._t = np.zeros(self.blocksize, dtype=np.float64)
+        self._work = np.zeros(self.blocksize, dtype=np.float64)
+        self._mono = np.zeros(self.blocksize, dtype=np.float32)
+
+    def _fill(self, block):
+        frames = self.blocksize
+        if self.total_frames is not None:
+            frames = min(frames, self.total_frames - self.position)
+            if frames <= 0:
+                return 0
+
+        t = self._t[:frames]
+        np.add(np.arange(frames), self.position, out=t)
+        t /= self.samplerate
+        mono = self._mono[:frames]
+
+        if self.signal == "noise":
+            mono[:] = self._rng.standard_normal(frames).astype(np.float32) * (self.amplitude / 3)
+        elif self.signal == "speech":
+            self._fill_speech(t, mono)
+        else:
+            np.sin(2 * np.pi * 440.0 * t, out=self._work[:frames])
+            mono[:] = self._work[:frames] * self.amplitude
+
+        block[:frames] = mono[:, None]
+        return frames
+
+    def _fill_speech(self, t, mono):
+        frames = t.shape[0]
+        work = self._work[:frames]
+
+        # Pitch wanders between ~100 and ~220 Hz; integrate it to get a continuous phase
+        f0 = 160.0 + 50.0 * np.sin(2 * np.pi * 0.3 * t) + 15.0 * np.sin(2 * np.pi * 1.7 * t)
+        phase = self._phase + 2 * np.pi * np.cumsum(f0) / self.samplerate
+        self._phase = float(phase[-1] % (2 * np.pi))
+
+        work.fill(0.0)
+        for harmonic in range(1, 9):
+            work += np.sin(harmonic * phase) / harmonic
+
+        # Syllables at ~4 Hz, utterances of 1-4 s separated by 0.3-1.5 s pauses
+        envelope = np.sin(2 * np.pi * 4.0 * t) ** 2
+        if self.position >= self._next_switch:
+            self._talking = not self._talking
+            length = self._rng.uniform(1.0, 4.0) if self._talking else self._rng.uniform(0.3, 1.5)
+            self._next_switch = self.position + int(length * self.samplerate)
+        if not self._talking:
+            envelope *= 0.0
+
+        work *= envelope * (self.amplitude / 2.2)
+        work += self._rng.standard_normal(frames) * 0.002
+        mono[:] = work
+
+
+class FileReplaySource(StreamSource):
+    """
+    Replays audio files as the loopback (and optionally mic) input, in real
+    time or `speed` times faster. Files must already be at the capture rate.
+    """
+
+    label = "replay"
+
+    def __init__(self, loopback_path: str, mic_path: Optional[str] = None, speed: float = 1.0,
+                 loop: bool = False, channel_mode: str = "mix", sample_rate: int = SAMPLE_RATE):
+        super().__init__(channel_mode, sample_rate)
+        if sf is None:
+            raise CaptureError("Missing dependency: soundfile")
+        self.paths: Dict[str, str] = {"loopback": loopback_path}
+        if mic_path:
+            self.paths["mic"] = mic_path
+        self.speed = speed
+        self.loop = loop
+
+    def _sources(self):
+        return list(self.paths.items())
+
+    def _stream_factory(self, **kwargs):
+        return ReplayInputStream(speed=self.speed, loop=self.loop, **kwargs)
+
+    def describe(self) -> dict:
+        return {"source": self.label, "speed": self.speed, **self.paths}
+
+
+class SyntheticSource(StreamSource):
+    """Generated loopback/mic signals for deterministic recordings of any length."""
+
+    label = "synthetic"
+
+    def __init__(self, loopback: str = "speech", mic: Optional[str] = "tone",
+                 duration: Optional[float] = None, speed: float = 1.0, seed: int = 0,
+                 channel_mode: str = "mix", sample_rate: int = SAMPLE_RATE):
+        super().__init__(channel_mode, sample_rate)
+        self.signals: Dict[str, str] = {"loopback": loopback}
+        if mic:
+            self.signals["mic"] = mic
+        self.duration = duration
+        self.speed = speed
+        self.seed = seed
+
+    def _sources(self):
+        return list(self.signals.items())
+
+    def _stream_factory(self, **kwargs):
+        # Offset the seed per source so loopback and mic are not identical
+        seed = self.seed + len(self._streams)
+        return SyntheticInputStream(speed=self.speed, duration=self.duration, seed=seed, **kwargs)
+
+    def describe(self) -> dict:
+        return {"source": self.label, "duration": self.duration, "speed": self.speed,
+                "seed": self.seed, **self.signals}
+
+
+def create_test_source(spec: str, **kwargs) -> CaptureSource:
+    """
+    Build a non-device source from a short spec, e.g. "synthetic",
+    "synthetic:noise", or "replay:C:/path/meeting.wav".
+    """
+    kind, _, arg = spec.partition(":")
+    if kind == "synthetic":
+        return SyntheticSource(loopback=arg or "speech", **kwargs)
+    if kind == "replay":
+        if not arg:
+            raise ValueError("Replay source needs a file path: replay:<path>")
+        return FileReplaySource(arg, **kwargs)
+    raise ValueError(f"Unknown capture source: {spec}")
+
@@ -0,0 +1,295 @@
+import os
+import json
+import time
+import glob
+import wave
+import sqlite3
+import logging
+import datetime
+import threading
+from contextlib import closing
+from typing import List, Optional
+
+from src.constants import CATALOG_DB_FILE
+
+logger = logging.getLogger(__name__)
+
+FOLDER_KINDS = {"Live": "live", "Import": "import"}
+FOLDER_TIME_FORMAT = "%Y-%m-%d_%H-%M-%S"
+FOLDER_TIME_LENGTH = len("2000-01-01_00-00-00")
+AUDIO_EXTENSIONS = (".wav", ".opus", ".mp3", ".m4a", ".ogg", ".flac")
+REFERENCE_FILE = "source.json"  # written by ImportJob when the audio stays where it was
+SESSION_FILE = "session.json"
+
+# recording -> recorded -> transcribing -> done | failed; interrupted when the app died mid-way
+STATUSES = ("recording", "recorded", "transcribing", "done", "failed", "interrupted")
+ACTIVE_STATUSES = ("recording", "transcribing")
+JSON_FIELDS = ("devices", "params")
+FIELDS = (
+    "kind", "created_at", "status", "audio_path", "txt_path", "duration", "size",
+    "devices", "model", "params", "transcribe_seconds", "rtf", "error"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS recordings (
+    folder TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    status TEXT NOT NULL,
+    audio_path TEXT,
+    txt_path TEXT,
+    duration REAL,
+    size INTEGER,
+    devices TEXT,
+    model TEXT,
+    params TEXT,
+    transcribe_seconds REAL,
+    rtf REAL,
+    error TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS recordings_created ON recordings(created_at);
+CREATE INDEX IF NOT EXISTS recordings_status ON recordings(status);
+"""
+
+
+def parse_folder(folder: str) -> Optional[tuple]:
+    """(kind, created_at) from a Live_<ts>/Import_<ts>[_n] folder name, None for anything else."""
+    prefix, _, stamp = os.path.basename(os.path.normpath(folder)).partition("_")
+    if prefix not in FOLDER_KINDS:
+        return None
+    try:
+        created = datetime.datetime.strptime(stamp[:FOLDER_TIME_LENGTH], FOLDER_TIME_FORMAT)
+    except ValueError:
+        return None
+    return FOLDER_KINDS[prefix], created.isoformat(sep=" ")
+
+
+def audio_duration(path: str) -> Optional[float]:
+    """Duration of a PCM WAV from its header alone; None for other formats."""
+    try:
+        with closing(wave.open(path, "rb")) as w:
+            return w.getnframes() / float(w.getframerate())
+    except (OSError, EOFError, wave.Error):
+        return None
+
+
+def _find_audio(folder: str) -> Optional[str]:
+    reference = os.path.join(folder, REFERENCE_FILE)
+    if os.path.isfile(reference):
+        try:
+            with open(reference, encoding="utf-8") as f:
+                return json.load(f).get("source")
+        except (OSError, ValueError):
+            pass
+    for name in sorted(os.listdir(folder)):
+        if name.lower().endswith(AUDIO_EXTENSIONS) and ".part" not in name:
+            return os.path.join(folder, name)
+    return None
+
+
+class Catalog:
+    """
+    One row per recording folder, keyed by its path, written by the engine and
+    the transcriber as a session moves along. Reading or updating a session is a
+    primary-key lookup; "hours this month" and "which ones failed" use the
+    created_at and status indexes instead of walking the output folders.
+    """
+
+    def __init__(self, db_path: str = CATALOG_DB_FILE):
+        self.db_path = db_path
+        self._write_lock = threading.Lock()
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def _row(row: sqlite3.Row) -> dict:
+        record = dict(row)
+        for key in JSON_FIELDS:
+            if record.get(key):
+                record[key] = json.loads(record[key])
+        return record
+
+    def update(self, folder: str, **fields):
+        """Create or update the record of folder; only the given fields change."""
+        unknown = set(fields) - set(FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown catalog fields: {sorted(unknown)}")
+        if fields.get("status") not in (None,) + STATUSES:
+            raise ValueError(f"Unknown status: {fields['status']}")
+
+        folder = os.path.abspath(folder)
+        for key in JSON_FIELDS:
+            if key in fields and fields[key] is not None:
+                fields[key] = json.dumps(fields[key], ensure_ascii=False)
+        fields["updated_at"] = time.time()
+
+        with self._write_lock, closing(self._connect()) as conn, conn:
+            if conn.execute("SELECT 1 FROM recordings WHERE folder = ?", (folder,)).fetchone():
+                assignments = ", ".join(f"{key} = ?" for key in fields)
+                conn.execute(f"UPDATE recordings SET {assignments} WHERE folder = ?", (*fields.values(), folder))
+                return
+
+            parsed = parse_folder(folder)
+            fields.setdefault("kind", parsed[0] if parsed else "import")
+            fields.setdefault("created_at", parsed[1] if parsed else datetime.datetime.now().isoformat(sep=" ", timespec="seconds"))
+            fields.setdefault("status", "recorded")
+            columns = ", ".join(("folder",) + tuple(fields))
+            placeholders = ", ".join("?" * (len(fields) + 1))
+            conn.execute(f"INSERT INTO recordings ({columns}) VALUES ({placeholders})", (folder, *fields.values()))
+
+    def get(self, folder: str) -> Optional[dict]:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM recordings WHERE folder = ?", (os.path.abspath(folder),)).fetchone()
+        return self._row(row) if row else None
+
+    def remove(self, folder: str):
+        with self._write_lock, closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM recordings WHERE folder = ?", (os.path.abspath(folder),))
+
+    def query(self, status: Optional[str] = None, since: Optional[str] = None,
+              until: Optional[str] = None, limit: Optional[int] = None) -> List[dict]:
+        """Records newest first; since/until compare against created_at ("2026-10-01")."""
+        sql, args = self._where(status, since, until)
+        sql = f"SELECT * FROM recordings{sql} ORDER BY created_at DESC"
+        if limit:
+            sql += " LIMIT ?"
+            args.append(limit)
+        with closing(self._connect()) as conn:
+            return [self._row(row) for row in conn.execute(sql, args)]
+
+    def totals(self, since: Optional[str] = None, until: Optional[str] = None) -> dict:
+        """Count, hours, bytes and transcription time of the records in a period."""
+        sql, args = self._where(None, since, until)
+        with closing(self._connect()) as conn:
+            count, seconds, size, transcribe = conn.execute(
+                "SELECT COUNT(*), TOTAL(duration), TOTAL(size), TOTAL(transcribe_seconds) "
+                f"FROM recordings{sql}", args
+            ).fetchone()
+            statuses = dict(conn.execute(f"SELECT status, COUNT(*) FROM recordings{sql} GROUP BY status", args).fetchall())
+        return {
+            "recordings": count,
+            "hours": seconds / 3600,
+            "size": int(size),
+            "transcribe_seconds": transcribe,
+            "statuses": statuses,
+        }
+
+    @staticmethod
+    def _where(status, since, until):
+        clauses, args = [], []
+        if status:
+            clauses.append("status = ?")
+            args.append(status)
+        if since:
+            clauses.append("created_at >= ?")
+            args.append(since)
+        if until:
+            clauses.append("created_at < ?")
+            args.append(until)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), args
+
+    def reconcile(self, output_base: str, stale_before: Optional[float] = None) -> dict:
+        """
+        Catalog Live_*/Import_* folders that have no record (copied in, or made by an
+        older version), drop records whose folder is gone, and mark sessions still
+        "recording"/"transcribing" since before stale_before as interrupted.
+        """
+        with closing(self._connect()) as conn:
+            known = {row["folder"] for row in conn.execute("SELECT folder FROM recordings")}
+
+        counts = {"added": 0, "removed": 0, "interrupted": 0}
+        found = set()
+        for pattern in ("Live_*", "Import_*"):
+            for folder in glob.glob(os.path.join(output_base, pattern)):
+                folder = os.path.abspath(folder)
+                if not os.path.isdir(folder) or parse_folder(folder) is None:
+                    continue
+                found.add(folder)
+                if folder in known:
+                    continue
+                try:
+                    self.update(folder, **self.describe_folder(folder))
+                    counts["added"] += 1
+                except (OSError, ValueError, sqlite3.Error) as e:
+                    logger.warning(f"Could not catalog {folder}: {e}")
+
+        for folder in known - found:
+            if not os.path.isdir(folder):
+                self.remove(folder)
+                counts["removed"] += 1
+
+        if stale_before is not None:
+            with self._write_lock, closing(self._connect()) as conn, conn:
+                cursor = conn.execute(
+                    f"UPDATE recordings SET status = 'interrupted', updated_at = ? "
+                    f"WHERE status IN ({', '.join('?' * len(ACTIVE_STATUSES))}) AND updated_at < ?",
+                    (time.time(), *ACTIVE_STATUSES, stale_before)
+                )
+                counts["interrupted"] = cursor.rowcount
+
+        if any(counts.values()):
+            logger.info(f"Catalog reconciled: {counts}")
+        return counts
+
+    @staticmethod
+    def describe_folder(folder: str) -> dict:
+        """Best-effort record of a folder from what is on disk."""
+        audio_path = _find_audio(folder)
+        txt_paths = sorted(glob.glob(os.path.join(folder, "*.txt")))
+        fields = {"audio_path": audio_path, "txt_path": txt_paths[0] if txt_paths else None}
+
+        if txt_paths:
+            fields["status"] = "done"
+        elif audio_path and os.path.isfile(audio_path):
+            fields["status"] = "interrupted"
+        else:
+            fields["status"] = "failed"
+
+        if audio_path and os.path.isfile(audio_path):
+            fields["size"] = os.path.getsize(audio_path)
+            fields["duration"] = audio_duration(audio_path)
+
+        session = os.path.join(folder, SESSION_FILE)
+        if os.path.isfile(session):
+            try:
+                with open(session, encoding="utf-8") as f:
+                    metadata = json.load(f)
+                fields["devices"] = [segment["devices"] for segment in metadata.get("segments", [])]
+                fields["duration"] = metadata.get("duration", fields.get("duration"))
+            except (OSError, ValueError, KeyError):
+                pass
+        return fields
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+def get_catalog() -> Catalog:
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = Catalog()
+    return _catalog
+
+
+def record(folder: str, **fields):
+    """Update the catalog from the engine or transcriber; failures never reach the caller."""
+    try:
+        get_catalog().update(folder, **fields)
+    except Exception as e:
+        logger.warning(f"Could not update catalog for {folder}: {e}")
+
+
+def reconcile_catalog(output_base: str, stale_before: Optional[float] = None):
+    """Background pass at startup: catalog folders created outside the app."""
+    try:
+        get_catalog().reconcile(output_base, stale_before)
+    except Exception as e:
+        logger.warning(f"Catalog reconciliation failed: {e}")
@@ -0,0 +1,140 @@
+import sys
+import time
+import logging
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = 0.25
+# Without a cheap OS device counter, PortAudio has to be re-enumerated; do it less often
+PORTAUDIO_REFRESH_INTERVAL = 2.0
+SETTLE_DELAY = 0.2
+
+_sounddevice = None
+
+
+def get_sounddevice():
+    """
+    Import sounddevice on first use. Loading it initialises PortAudio, which
+    enumerates every audio device, so it is kept off the startup path.
+    Returns None if sounddevice or the PortAudio library is unavailable.
+    """
+    global _sounddevice
+    if _sounddevice is None:
+        try:
+            import sounddevice
+            _sounddevice = sounddevice
+        except (ImportError, OSError):
+            # OSError: PortAudio library missing (e.g. headless Linux CI)
+            _sounddevice = False
+    return _sounddevice or None
+
+
+def _windows_device_count() -> Optional[int]:
+    try:
+        import ctypes
+        winmm = ctypes.windll.winmm
+        return winmm.waveInGetNumDevs() + winmm.waveOutGetNumDevs()
+    except Exception:
+        return None
+
+
+def refresh_portaudio():
+    # PortAudio enumerates devices once at initialisation
+    sd = get_sounddevice()
+    if sd is None:
+        return
+    sd._terminate()
+    sd._initialize()
+
+
+def input_device_signature() -> tuple:
+    sd = get_sounddevice()
+    if sd is None:
+        return ()
+    devices = tuple(
+        (device['name'], device['max_input_channels'], device['hostapi'])
+        for device in sd.query_devices()
+        if device['max_input_channels'] > 0
+    )
+    try:
+        default_input = sd.default.device[0]
+    except Exception:
+        default_input = None
+    return devices, default_input
+
+
+class DeviceWatcher:
+    """
+    Watches for audio device changes while a recording is active and for the
+    capture source dying, and reports both through `on_change(reason)`.
+
+    On Windows the winmm device count is checked every POLL_INTERVAL (a few
+    microseconds); PortAudio is only re-enumerated once the count moves. Elsewhere
+    PortAudio is refreshed every PORTAUDIO_REFRESH_INTERVAL. `can_refresh` must
+    return False while PortAudio streams are open, since a refresh closes them.
+    """
+
+    def __init__(self, on_change: Callable[[str], None],
+                 can_refresh: Callable[[], bool] = lambda: True,
+                 health_check: Optional[Callable[[], bool]] = None):
+        self.on_change = on_change
+        self.can_refresh = can_refresh
+        self.health_check = health_check
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._use_counter = sys.platform == "win32" and _windows_device_count() is not None
+        self._last_count = _windows_device_count() if self._use_counter else None
+        self._last_signature = self._signature(refresh=False)
+        self._last_refresh = time.monotonic()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="device-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+
+    def _signature(self, refresh: bool) -> tuple:
+        try:
+            if refresh and self.can_refresh():
+                refresh_portaudio()
+            return input_device_signature()
+        except Exception as e:
+            logger.debug(f"Device enumeration failed: {e}")
+            return ()
+
+    def _devices_changed(self) -> bool:
+        now = time.monotonic()
+        if self._use_counter:
+            count = _windows_device_count()
+            if count == self._last_count:
+                return False
+            self._last_count = count
+        elif now - self._last_refresh < PORTAUDIO_REFRESH_INTERVAL:
+            return False
+
+        # Let the OS finish (un)registering all endpoints of the device
+        time.sleep(SETTLE_DELAY)
+        self._last_refresh = time.monotonic()
+        signature = self._signature(refresh=True)
+        if signature == self._last_signature:
+            return False
+        self._last_signature = signature
+        return True
+
+    def _run(self):
+        while not self._stop.wait(POLL_INTERVAL):
+            try:
+                if self._devices_changed():
+                    logger.info("Audio device change detected")
+                    self.on_change("device_change")
+                elif self.health_check and not self.health_check():
+                    logger.warning("Capture source stopped unexpectedly")
+                    self.on_change("source_lost")
+            except Exception as e:
+                logger.error(f"Device watcher error: {e}")
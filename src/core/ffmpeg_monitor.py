@@ -0,0 +1,123 @@
+import re
+import time
+import logging
+import threading
+from collections import deque
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+# ffmpeg status line: "size=    1024kB time=00:00:05.46 bitrate=1536.0kbits/s speed=   1x"
+_PROGRESS_RE = re.compile(
+    r"size=\s*(?P<size>\d+(?:\.\d+)?)\s*(?P<unit>[kKMG]i?B|B)\s+"
+    r"time=\s*(?P<time>-?\d+:\d{2}:\d{2}(?:\.\d+)?)"
+    r"(?:\s+bitrate=\s*(?P<bitrate>[\d.]+)\s*kbits/s)?"
+)
+
+_UNIT_FACTORS = {
+    "B": 1,
+    "kB": 1024, "KB": 1024, "KiB": 1024,
+    "MB": 1024 ** 2, "MiB": 1024 ** 2,
+    "GB": 1024 ** 3, "GiB": 1024 ** 3,
+}
+
+
+def parse_progress_line(line: str) -> Optional[dict]:
+    match = _PROGRESS_RE.search(line)
+    if not match:
+        return None
+
+    size = float(match.group("size")) * _UNIT_FACTORS.get(match.group("unit"), 1)
+
+    hours, minutes, seconds = match.group("time").lstrip("-").split(":")
+    capture_time = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+    bitrate = match.group("bitrate")
+    return {
+        "bytes_written": int(size),
+        "capture_time": capture_time,
+        "bitrate_kbps": float(bitrate) if bitrate else None,
+    }
+
+
+class FFmpegStderrMonitor:
+    """
+    Drains an ffmpeg stderr pipe on a background thread so the encoder never
+    blocks on a full pipe, keeping the last lines and the latest progress stats.
+    """
+
+    def __init__(self, stream, max_lines: int = 200, name: str = "ffmpeg-stderr"):
+        self._stream = stream
+        self._lines = deque(maxlen=max_lines)
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._stats = {
+            "bytes_written": 0,
+            "capture_time": 0.0,
+            "bitrate_kbps": None,
+            "wall_time": 0.0,
+            "drift": 0.0,
+            "updated_at": None,
+        }
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self):
+        self._started_at = time.monotonic()
+        self._thread.start()
+        return self
+
+    def join(self, timeout: Optional[float] = None):
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def _run(self):
+        pending = b""
+        try:
+            while True:
+                chunk = self._stream.read1(4096) if hasattr(self._stream, "read1") else self._stream.read(4096)
+                if not chunk:
+                    break
+                pending += chunk
+                # Progress lines are terminated by '\r', regular log lines by '\n'
+                parts = re.split(rb"[\r\n]+", pending)
+                pending = parts.pop()
+                for raw in parts:
+                    if raw:
+                        self._handle_line(raw.decode("utf-8", errors="replace"))
+        except (OSError, ValueError) as e:
+            logger.debug(f"FFmpeg stderr drain ended: {e}")
+        finally:
+            if pending:
+                self._handle_line(pending.decode("utf-8", errors="replace"))
+
+    def _handle_line(self, line: str):
+        line = line.strip()
+        if not line:
+            return
+
+        progress = parse_progress_line(line)
+        with self._lock:
+            if progress:
+                wall_time = time.monotonic() - self._started_at
+                self._stats.update(progress)
+                self._stats["wall_time"] = wall_time
+                self._stats["drift"] = wall_time - progress["capture_time"]
+                self._stats["updated_at"] = time.time()
+                # Keep only the latest progress line in the ring
+                if self._lines and self._lines[-1].startswith("size="):
+                    self._lines[-1] = line
+                    return
+            self._lines.append(line)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        if stats["updated_at"] is None:
+            stats["wall_time"] = time.monotonic() - self._started_at
+        return stats
+
+    def get_recent_lines(self, count: Optional[int] = None) -> list:
+        with self._lock:
+            lines = list(self._lines)
+        return lines[-count:] if count else lines
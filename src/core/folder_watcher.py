@@ -0,0 +1,338 @@
+import os
+import sys
+import time
+import sqlite3
+import logging
+import threading
+from contextlib import closing
+from typing import Callable, Dict, List, Optional
+
+from src.constants import BASE_DIR, INGEST_LEDGER_FILE
+from src.core.catalog import AUDIO_EXTENSIONS
+from src.core.importer import ImportJob
+from src.core.transcriber import transcription_worker
+
+logger = logging.getLogger(__name__)
+
+WATCH_SETTINGS = ("watch_folders", "watch_stable_seconds")
+DEFAULT_STABLE_SECONDS = 10.0
+POLL_INTERVAL = 5.0  # stat-cache scan when the OS gives no change notifications
+NOTIFY_POLL_INTERVAL = 60.0  # safety scan with notifications (network shares can miss some)
+PENDING_INTERVAL = 1.0  # while files are settling or waiting for a free slot
+MAX_ATTEMPTS = 3  # a file whose ingestion crashed the app is retried this many times
+
+# Windows change notifications
+FILE_NOTIFY_CHANGE_FILE_NAME = 0x001
+FILE_NOTIFY_CHANGE_SIZE = 0x008
+FILE_NOTIFY_CHANGE_LAST_WRITE = 0x010
+WAIT_TIMEOUT = 0x102
+MAXIMUM_WAIT_OBJECTS = 64
+
+LEDGER_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingested (
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 1,
+    txt_path TEXT,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (path, size, mtime)
+);
+"""
+
+
+class IngestLedger:
+    """
+    Every watched file ever picked up, keyed by (path, size, mtime): a file is
+    claimed before it is processed, so it is never ingested twice, across
+    restarts too. Replacing a file with new content makes it a new entry.
+    """
+
+    def __init__(self, db_path: str = INGEST_LEDGER_FILE):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            conn.executescript(LEDGER_SCHEMA)
+
+    def claim(self, key: tuple) -> bool:
+        """True if the caller should process the file now."""
+        with self._lock, closing(sqlite3.connect(self.db_path, timeout=10)) as conn, conn:
+            row = conn.execute(
+                "SELECT status, attempts FROM ingested WHERE path = ? AND size = ? AND mtime = ?", key
+            ).fetchone()
+            if row is None:
+                conn.execute(
+                    "INSERT INTO ingested (path, size, mtime, status, updated_at) VALUES (?, ?, ?, 'queued', ?)",
+                    (*key, time.time())
+                )
+                return True
+            status, attempts = row
+            # Still "queued" from an earlier run: that run died while processing it
+            if status == "queued" and attempts < MAX_ATTEMPTS:
+                conn.execute(
+                    "UPDATE ingested SET attempts = attempts + 1, updated_at = ? WHERE path = ? AND size = ? AND mtime = ?",
+                    (time.time(), *key)
+                )
+                return True
+            return False
+
+    def finish(self, key: tuple, status: str, txt_path: Optional[str] = None, error: Optional[str] = None):
+        with self._lock, closing(sqlite3.connect(self.db_path, timeout=10)) as conn, conn:
+            conn.execute(
+                "UPDATE ingested SET status = ?, txt_path = ?, error = ?, updated_at = ? "
+                "WHERE path = ? AND size = ? AND mtime = ?",
+                (status, txt_path, error, time.time(), *key)
+            )
+
+
+def ingest_file(path: str, config) -> str:
+    """Import and transcribe one file like the import button does; returns the transcript path."""
+    output_base = config.get("output_folder") or BASE_DIR
+    job = ImportJob(path, output_base, config.get("import_mode") or "auto").start()
+
+    # Progress stays here: a watched file must not pop the transcript open like a manual import
+    result = _Result()
+    transcription_worker(job.transcribe_path, result, config, True, job.txt_path)
+    job.wait()
+
+    if result.message is None:
+        raise RuntimeError("Transcription did not finish")
+    msg_type, data = result.message
+    if msg_type == "error":
+        raise RuntimeError(data)
+    return data
+
+
+class _Result:
+    """Stands in for the GUI queue: drops progress and keeps how the transcription ended."""
+
+    def __init__(self):
+        self.message = None
+
+    def put(self, message: tuple):
+        if message[0] in ("done", "error"):
+            self.message = message
+
+
+class _WatchedFolder:
+    def __init__(self, path: str, limit: int):
+        self.path = path
+        self.limit = max(1, limit)
+        self.active = 0
+        self.lock = threading.Lock()
+        # path -> (size, mtime_ns, unchanged_since, handled)
+        self.files: Dict[str, tuple] = {}
+        self.handle = None
+
+
+class FolderWatcher:
+    """
+    Picks up audio files dropped into the configured watch folders and
+    transcribes each one once its size and mtime have not changed for
+    watch_stable_seconds. On Windows a change notification triggers the scan;
+    elsewhere (or if notifications fail) the folders are polled, and only
+    entries whose stat changed are looked at again.
+
+    watch_folders is a list of {"path": ..., "concurrency": n}; n is how many
+    files of the folder are taken in at once. Each is imported (copied or
+    linked) right away, but transcriptions run one at a time in the worker,
+    so n > 1 gets the next files copied while one transcribes. Nothing new
+    starts while `is_busy()`.
+    """
+
+    def __init__(self, config, is_busy: Callable[[], bool] = lambda: False,
+                 on_event: Optional[Callable[[str, dict], None]] = None,
+                 ledger: Optional[IngestLedger] = None, ingest: Callable = ingest_file):
+        self.cfg = config
+        self.is_busy = is_busy
+        self.on_event = on_event
+        self.ledger = ledger or IngestLedger()
+        self.ingest = ingest
+        self.folders: List[_WatchedFolder] = []
+        self._stopped = threading.Event()
+        self._reload = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        config.subscribe(self._on_config_changed, keys=WATCH_SETTINGS)
+
+    def _on_config_changed(self, changes: dict):
+        self._reload.set()
+
+    def start(self) -> "FolderWatcher":
+        self._thread = threading.Thread(target=self._run, name="folder-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+
+    def _load_folders(self):
+        self._close_handles()
+        previous = {folder.path: folder for folder in self.folders}
+        self.folders = []
+        for entry in self.cfg.get("watch_folders") or []:
+            if isinstance(entry, str):
+                entry = {"path": entry}
+            path = os.path.abspath(entry.get("path") or "")
+            if not os.path.isdir(path):
+                logger.warning(f"Watch folder not found: {path}")
+                continue
+            folder = previous.get(path) or _WatchedFolder(path, 1)
+            folder.limit = max(1, int(entry.get("concurrency") or 1))
+            folder.handle = _open_notification(path)
+            self.folders.append(folder)
+        if self.folders:
+            logger.info(f"Watching {len(self.folders)} folder(s)")
+
+    def _close_handles(self):
+        for folder in self.folders:
+            if folder.handle is not None:
+                _close_notification(folder.handle)
+                folder.handle = None
+
+    def _stable_seconds(self) -> float:
+        try:
+            return float(self.cfg.get("watch_stable_seconds") or DEFAULT_STABLE_SECONDS)
+        except (TypeError, ValueError):
+            return DEFAULT_STABLE_SECONDS
+
+    def _run(self):
+        self._load_folders()
+        while not self._stopped.is_set():
+            if self._reload.is_set():
+                self._reload.clear()
+                self._load_folders()
+
+            pending = False
+            for folder in self.folders:
+                pending |= self.scan(folder)
+
+            notified = [folder for folder in self.folders if folder.handle is not None]
+            if pending:
+                timeout = PENDING_INTERVAL
+            elif notified and len(notified) == len(self.folders):
+                timeout = NOTIFY_POLL_INTERVAL
+            else:
+                timeout = POLL_INTERVAL
+            self._wait(notified, timeout)
+        self._close_handles()
+
+    def _wait(self, notified: List[_WatchedFolder], timeout: float):
+        if not notified:
+            self._stopped.wait(timeout)
+            return
+        # Wake at least every POLL_INTERVAL to notice stop() and config changes
+        _wait_notifications([folder.handle for folder in notified[:MAXIMUM_WAIT_OBJECTS]],
+                            min(timeout, POLL_INTERVAL))
+
+    def scan(self, folder: _WatchedFolder) -> bool:
+        """Update the stat cache of a folder and start ready files; True while any are pending."""
+        now = time.monotonic()
+        stable_seconds = self._stable_seconds()
+        pending = False
+        seen = set()
+        try:
+            entries = list(os.scandir(folder.path))
+        except OSError as e:
+            logger.debug(f"Cannot scan {folder.path}: {e}")
+            return False
+
+        for entry in entries:
+            if not entry.name.lower().endswith(AUDIO_EXTENSIONS):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            seen.add(entry.path)
+
+            cached = folder.files.get(entry.path)
+            if cached is None or cached[:2] != (stat.st_size, stat.st_mtime_ns):
+                folder.files[entry.path] = (stat.st_size, stat.st_mtime_ns, now, False)
+                pending = True
+                continue
+            if cached[3]:
+                continue
+            if now - cached[2] < stable_seconds or folder.active >= folder.limit or self.is_busy() \
+                    or not _readable(entry.path):
+                pending = True
+                continue
+
+            folder.files[entry.path] = cached[:3] + (True,)
+            key = (entry.path, stat.st_size, stat.st_mtime_ns)
+            if self.ledger.claim(key):
+                with folder.lock:
+                    folder.active += 1
+                threading.Thread(target=self._process, args=(folder, key), daemon=True).start()
+
+        # Forget deleted files, so a new file with the same name is picked up
+        for path in list(folder.files):
+            if path not in seen:
+                del folder.files[path]
+        return pending or folder.active > 0
+
+    def _process(self, folder: _WatchedFolder, key: tuple):
+        path = key[0]
+        logger.info(f"Ingesting watched file {path}")
+        try:
+            txt_path = self.ingest(path, self.cfg)
+            self.ledger.finish(key, "done", txt_path=txt_path)
+            self._emit("watch_done", {"source": path, "txt_path": txt_path})
+        except Exception as e:
+            logger.error(f"Ingesting {path} failed: {e}")
+            self.ledger.finish(key, "failed", error=str(e))
+            self._emit("watch_failed", {"source": path, "error": str(e)})
+        finally:
+            with folder.lock:
+                folder.active -= 1
+
+    def _emit(self, kind: str, data: dict):
+        if self.on_event:
+            self.on_event(kind, data)
+
+
+def _readable(path: str) -> bool:
+    # On Windows a file still open for writing by the tool dropping it cannot be opened
+    try:
+        with open(path, "rb"):
+            return True
+    except OSError:
+        return False
+
+
+def _open_notification(path: str):
+    if sys.platform != "win32":
+        return None
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        kernel32.FindFirstChangeNotificationW.restype = ctypes.c_void_p
+        handle = kernel32.FindFirstChangeNotificationW(
+            path, False,
+            FILE_NOTIFY_CHANGE_FILE_NAME | FILE_NOTIFY_CHANGE_SIZE | FILE_NOTIFY_CHANGE_LAST_WRITE
+        )
+        if handle in (None, ctypes.c_void_p(-1).value):
+            logger.warning(f"No change notifications for {path}, polling it")
+            return None
+        return handle
+    except Exception as e:
+        logger.warning(f"No change notifications for {path}, polling it: {e}")
+        return None
+
+
+def _close_notification(handle):
+    import ctypes
+    ctypes.windll.kernel32.FindCloseChangeNotification(ctypes.c_void_p(handle))
+
+
+def _wait_notifications(handles: list, timeout: float):
+    import ctypes
+    kernel32 = ctypes.windll.kernel32
+    array = (ctypes.c_void_p * len(handles))(*handles)
+    result = kernel32.WaitForMultipleObjects(len(handles), array, False, int(timeout * 1000))
+    if result != WAIT_TIMEOUT and 0 <= result < len(handles):
+        # Re-arm the signalled handle; the caller rescans every folder anyway
+        kernel32.FindNextChangeNotification(ctypes.c_void_p(handles[result]))
@@ -0,0 +1,161 @@
+import os
+import json
+import shutil
+import logging
+import datetime
+import threading
+from typing import Callable, Optional
+
+from src.core.catalog import REFERENCE_FILE, record
+
+logger = logging.getLogger(__name__)
+
+IMPORT_MODES = ("auto", "copy", "reference")
+COPY_CHUNK = 8 * 1024 * 1024
+PROGRESS_STEP = 0.01  # report copy progress every 1 %
+
+
+def same_volume(path: str, folder: str) -> bool:
+    try:
+        return os.stat(path).st_dev == os.stat(folder).st_dev
+    except OSError:
+        return False
+
+
+class ImportJob:
+    """
+    Brings an audio file into an Import_<timestamp> folder without blocking the
+    caller, and without making transcription wait for it:
+
+    - "reference": nothing is copied; source.json records where the audio lives
+    - "auto": hardlink when source and folder share a volume, otherwise copy
+    - "copy": always copy
+
+    Copies run on a background thread in COPY_CHUNK pieces with progress reports.
+    Transcription reads the source file, so it can run while the copy is still
+    going (the second read is mostly served from the OS cache).
+    """
+
+    def __init__(self, source: str, output_base: str, mode: str = "auto",
+                 on_progress: Optional[Callable[[float], None]] = None,
+                 on_done: Optional[Callable[[Optional[str]], None]] = None):
+        self.source = os.path.abspath(source)
+        self.mode = mode if mode in IMPORT_MODES else "auto"
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.method: Optional[str] = None
+        self.error: Optional[str] = None
+        self._thread: Optional[threading.Thread] = None
+
+        ts = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        self._set_folder(os.path.join(output_base, f"Import_{ts}"))
+
+    def _set_folder(self, folder: str):
+        self.folder = folder
+        name = os.path.basename(self.source)
+        self.audio_path = os.path.join(self.folder, name)
+        # The transcript always lands in the import folder, whatever happens to the audio
+        self.txt_path = os.path.join(self.folder, os.path.splitext(name)[0] + ".txt")
+
+    def _create_folder(self):
+        # Watch-folder imports can start within the same second: Import_<ts>_2, _3...
+        base, attempt = self.folder, 1
+        while True:
+            try:
+                os.makedirs(self.folder)
+                return
+            except FileExistsError:
+                attempt += 1
+                self._set_folder(f"{base}_{attempt}")
+
+    @property
+    def transcribe_path(self) -> str:
+        return self.source
+
+    def start(self) -> "ImportJob":
+        if not os.path.isfile(self.source):
+            raise FileNotFoundError(self.source)
+        self._create_folder()
+
+        if self.mode == "reference":
+            self.method = "reference"
+            self._write_reference()
+            self._finish()
+        elif self.mode == "auto" and same_volume(self.source, self.folder) and self._try_hardlink():
+            self.method = "hardlink"
+            self._finish()
+        else:
+            self.method = "copy"
+            self._thread = threading.Thread(target=self._copy, name="import-copy", daemon=True)
+            self._thread.start()
+
+        logger.info(f"Importing {self.source} ({self.method})")
+        record(
+            self.folder, kind="import", status="recorded", size=os.path.getsize(self.source),
+            audio_path=self.source if self.method == "reference" else self.audio_path
+        )
+        return self
+
+    def _try_hardlink(self) -> bool:
+        try:
+            os.link(self.source, self.audio_path)
+            return True
+        except OSError as e:
+            # FAT/exFAT, network shares and some cloud folders have no hardlinks
+            logger.debug(f"Hardlink failed, copying instead: {e}")
+            return False
+
+    def _write_reference(self):
+        stat = os.stat(self.source)
+        info = {"source": self.source, "size": stat.st_size, "mtime": stat.st_mtime}
+        with open(os.path.join(self.folder, REFERENCE_FILE), "w", encoding="utf-8") as f:
+            json.dump(info, f, indent=2, ensure_ascii=False)
+
+    def _copy(self):
+        part_path = self.audio_path + ".part"
+        try:
+            total = os.path.getsize(self.source) or 1
+            copied = 0
+            next_report = PROGRESS_STEP
+            buffer = bytearray(COPY_CHUNK)
+            view = memoryview(buffer)
+            with open(self.source, "rb") as src, open(part_path, "wb") as dst:
+                while True:
+                    read = src.readinto(buffer)
+                    if not read:
+                        break
+                    dst.write(view[:read])
+                    copied += read
+                    if self.on_progress and copied / total >= next_report:
+                        self.on_progress(min(100.0, copied * 100 / total))
+                        next_report = copied / total + PROGRESS_STEP
+            shutil.copystat(self.source, part_path)
+            os.replace(part_path, self.audio_path)
+        except OSError as e:
+            self.error = str(e)
+            logger.error(f"Import copy of {self.source} failed: {e}")
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+            # Transcription still works from the source, so record where it came from
+            try:
+                self._write_reference()
+            except OSError:
+                pass
+            record(self.folder, audio_path=self.source)
+        self._finish()
+
+    def _finish(self):
+        if self.on_done:
+            self.on_done(self.error)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        if self._thread:
+            self._thread.join(timeout)
+            return not self._thread.is_alive()
+        return True
+
+    @property
+    def is_copying(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
@@ -0,0 +1,146 @@
+import math
+import time
+import logging
+import threading
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from src.constants import METER_RATE_HZ
+
+logger = logging.getLogger(__name__)
+
+# Sample rate of the low-resolution metering tap (one mono channel per source)
+METER_SAMPLE_RATE = 8000
+
+# A couple of LSBs of 16-bit PCM: anything quieter is treated as digital silence
+SILENCE_PEAK = 2.0 / 32768.0
+FLOOR_DB = -90.0
+
+
+def to_db(value: float) -> float:
+    if value <= 0:
+        return FLOOR_DB
+    return max(FLOOR_DB, 20.0 * math.log10(value))
+
+
+class LevelMeter:
+    """
+    Per-source RMS/peak meter. Blocks of shape (frames, sources) are folded
+    into fixed windows (METER_RATE_HZ per second) and published as a snapshot
+    that the UI can poll without locking the audio path for long.
+    """
+
+    def __init__(self, sources: Sequence[str], sample_rate: int = METER_SAMPLE_RATE,
+                 silence_timeout: float = 10.0,
+                 on_silence: Optional[Callable[[str], None]] = None):
+        self.sources = list(sources)
+        self.sample_rate = sample_rate
+        self.silence_timeout = silence_timeout
+        self.on_silence = on_silence
+
+        channels = len(self.sources)
+        self._window_frames = max(1, sample_rate // METER_RATE_HZ)
+        self._sumsq = np.zeros(channels, dtype=np.float64)
+        self._peak = np.zeros(channels, dtype=np.float32)
+        self._block_peak = np.zeros(channels, dtype=np.float32)
+        self._frames = 0
+
+        self._lock = threading.Lock()
+        now = time.monotonic()
+        self._last_sound = [now] * channels
+        self._warned = [False] * channels
+        self._levels = {
+            name: {"rms_db": FLOOR_DB, "peak_db": FLOOR_DB, "silent_for": 0.0, "silent": False}
+            for name in self.sources
+        }
+
+    def process(self, block: np.ndarray):
+        """Feed float32 samples in [-1, 1] with one column per source."""
+        frames = block.shape[0]
+        if frames == 0:
+            return
+
+        self._sumsq += np.einsum("ij,ij->j", block, block, dtype=np.float64)
+        np.abs(block).max(axis=0, out=self._block_peak)
+        np.maximum(self._peak, self._block_peak, out=self._peak)
+        self._frames += frames
+
+        if self._frames >= self._window_frames:
+            self._publish()
+
+    def process_int16(self, block: np.ndarray):
+        self.process(block.astype(np.float32) * (1.0 / 32768.0))
+
+    def _publish(self):
+        rms = np.sqrt(self._sumsq / self._frames)
+        peak = self._peak.copy()
+        self._sumsq.fill(0.0)
+        self._peak.fill(0.0)
+        self._frames = 0
+
+        now = time.monotonic()
+        silenced = []
+        with self._lock:
+            for i, name in enumerate(self.sources):
+                if peak[i] > SILENCE_PEAK:
+                    self._last_sound[i] = now
+                    self._warned[i] = False
+                silent_for = now - self._last_sound[i]
+                is_silent = silent_for >= self.silence_timeout
+                self._levels[name] = {
+                    "rms_db": to_db(float(rms[i])),
+                    "peak_db": to_db(float(peak[i])),
+                    "silent_for": silent_for,
+                    "silent": is_silent,
+                }
+                if is_silent and not self._warned[i]:
+                    self._warned[i] = True
+                    silenced.append(name)
+
+        for name in silenced:
+            logger.warning(f"Source '{name}' has been digitally silent for {self.silence_timeout:.0f}s")
+            if self.on_silence:
+                try:
+                    self.on_silence(name)
+                except Exception as e:
+                    logger.error(f"Silence callback failed: {e}")
+
+    def get_levels(self) -> dict:
+        with self._lock:
+            return {name: dict(level) for name, level in self._levels.items()}
+
+    def attach_pcm_stream(self, stream, name: str = "level-meter") -> threading.Thread:
+        """Read interleaved s16le PCM (one channel per source) from a pipe until EOF."""
+        block_bytes = self._window_frames * len(self.sources) * 2
+
+        frame_bytes = 2 * len(self.sources)
+
+        def run():
+            # Keep reading until EOF whatever happens to a chunk: if this thread stopped,
+            # ffmpeg would block on a full stdout pipe and the capture would stall
+            pending = b""
+            failed = False
+            while True:
+                try:
+                    data = stream.read(block_bytes)
+                except (OSError, ValueError) as e:
+                    logger.debug(f"Meter stream ended: {e}")
+                    return
+                if not data:
+                    return
+                try:
+                    # A short read can end mid-frame; keep the tail for the next chunk
+                    data = pending + data
+                    usable = len(data) - len(data) % frame_bytes
+                    pending = data[usable:]
+                    samples = np.frombuffer(data[:usable], dtype="<i2")
+                    self.process_int16(samples.reshape(-1, len(self.sources)))
+                except Exception as e:
+                    if not failed:
+                        logger.error(f"Level meter failed on a chunk, still draining the stream: {e}")
+                        failed = True
+
+        thread = threading.Thread(target=run, name=name, daemon=True)
+        thread.start()
+        return thread
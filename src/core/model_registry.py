@@ -0,0 +1,179 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from src.constants import MODELS_DIR, MODEL_CHECKS_FILE
+from src.utils import get_resource_path
+
+logger = logging.getLogger(__name__)
+
+BUNDLED_MODELS = "models"  # next to bin/ in the app folder
+MANIFEST_FILE = "manifest.json"
+# Without tokenizer.json faster-whisper fetches a tokenizer from the hub
+REQUIRED_FILES = ("model.bin", "config.json", "tokenizer.json")
+VOCABULARY_FILES = ("vocabulary.txt", "vocabulary.json")
+HASH_CHUNK = 1024 * 1024
+
+
+class ModelError(Exception):
+    pass
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _check_complete(model_dir: str, files):
+    missing = [required for required in REQUIRED_FILES if required not in files]
+    if not any(vocabulary in files for vocabulary in VOCABULARY_FILES):
+        missing.append(" or ".join(VOCABULARY_FILES))
+    if missing:
+        raise ModelError(f"{model_dir} is not a faster-whisper model: missing {', '.join(missing)}")
+
+
+def write_manifest(model_dir: str, name: str, source: Optional[str] = None) -> dict:
+    """Hash every model file into manifest.json; used by utils/download_model.py too."""
+    files = {}
+    for entry in sorted(os.listdir(model_dir)):
+        path = os.path.join(model_dir, entry)
+        if entry == MANIFEST_FILE or not os.path.isfile(path):
+            continue
+        files[entry] = {"size": os.path.getsize(path), "sha256": file_sha256(path)}
+    manifest = {"name": name, "source": source, "files": files}
+    _check_complete(model_dir, files)
+    tmp_path = os.path.join(model_dir, MANIFEST_FILE + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(model_dir, MANIFEST_FILE))
+    return manifest
+
+
+class ModelRegistry:
+    """
+    Resolves a model name ("small") to a verified CTranslate2 model folder on
+    disk, never to a hub download. Looks in the user's models folder first (so
+    a model can be replaced without reinstalling), then in the app's bundled
+    models/ folder.
+
+    Each folder carries a manifest.json with the size and SHA-256 of every
+    file. The hashes are checked once; the result is cached in
+    MODEL_CHECKS_FILE against each file's size and mtime, so later lookups
+    only stat a handful of files. A user-provided folder without a manifest
+    gets one written on first use.
+    """
+
+    def __init__(self, search_dirs: Optional[List[str]] = None, checks_file: str = MODEL_CHECKS_FILE):
+        self.search_dirs = search_dirs or [MODELS_DIR, get_resource_path(BUNDLED_MODELS)]
+        self.checks_file = checks_file
+        self._lock = threading.Lock()
+        self._checks: Optional[Dict[str, dict]] = None
+
+    def candidates(self, name: str) -> List[str]:
+        return [os.path.join(folder, name) for folder in self.search_dirs]
+
+    def resolve(self, name: str) -> str:
+        """The verified folder for `name`; raises ModelError with what to do when there is none."""
+        if not name or os.sep in name or (os.altsep and os.altsep in name) or name.startswith("."):
+            raise ModelError(f"Invalid model name: {name!r}")
+        with self._lock:
+            for model_dir in self.candidates(name):
+                if os.path.isdir(model_dir):
+                    self._verify(name, model_dir)
+                    return model_dir
+        raise ModelError(
+            f"Model '{name}' is not installed. Looked in: {', '.join(self.candidates(name))}. "
+            f"Run: python utils/download_model.py {name}"
+        )
+
+    def _load_checks(self) -> Dict[str, dict]:
+        if self._checks is None:
+            try:
+                with open(self.checks_file, encoding="utf-8") as f:
+                    self._checks = json.load(f)
+            except (OSError, ValueError):
+                self._checks = {}
+        return self._checks
+
+    def _save_checks(self):
+        try:
+            tmp_path = self.checks_file + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._checks, f, indent=2)
+            os.replace(tmp_path, self.checks_file)
+        except OSError as e:
+            # Only costs a re-check on the next launch
+            logger.warning(f"Could not save model check results: {e}")
+
+    def _manifest(self, name: str, model_dir: str) -> dict:
+        path = os.path.join(model_dir, MANIFEST_FILE)
+        if not os.path.exists(path):
+            logger.warning(f"Model folder {model_dir} has no {MANIFEST_FILE}, recording its checksums now")
+            try:
+                return write_manifest(model_dir, name)
+            except OSError as e:
+                raise ModelError(f"Model '{name}' at {model_dir} has no {MANIFEST_FILE} and one cannot be written: {e}")
+        try:
+            with open(path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ModelError(f"Model '{name}' at {model_dir} has an unreadable {MANIFEST_FILE}: {e}")
+        if not isinstance(manifest, dict) or not isinstance(manifest.get("files"), dict):
+            raise ModelError(f"Model '{name}' at {model_dir} has an invalid {MANIFEST_FILE}")
+        _check_complete(model_dir, manifest["files"])
+        return manifest
+
+    def _stat_signature(self, name: str, model_dir: str, manifest: dict) -> Dict[str, list]:
+        signature = {}
+        for entry, expected in manifest["files"].items():
+            try:
+                stat = os.stat(os.path.join(model_dir, entry))
+            except OSError:
+                raise ModelError(f"Model '{name}' at {model_dir} is incomplete: {entry} is missing")
+            if stat.st_size != expected.get("size"):
+                raise ModelError(
+                    f"Model '{name}' at {model_dir} is damaged: {entry} is {stat.st_size} bytes, "
+                    f"expected {expected.get('size')}. Delete the folder and download the model again."
+                )
+            signature[entry] = [stat.st_size, stat.st_mtime_ns]
+        return signature
+
+    def _verify(self, name: str, model_dir: str):
+        manifest = self._manifest(name, model_dir)
+        signature = self._stat_signature(name, model_dir, manifest)
+        checks = self._load_checks()
+        key = os.path.normcase(os.path.abspath(model_dir))
+        if checks.get(key, {}).get("files") == signature:
+            return
+
+        started = time.perf_counter()
+        for entry, expected in manifest["files"].items():
+            if file_sha256(os.path.join(model_dir, entry)) != expected.get("sha256"):
+                checks.pop(key, None)
+                self._save_checks()
+                raise ModelError(
+                    f"Model '{name}' at {model_dir} failed its integrity check: {entry} does not match "
+                    f"{MANIFEST_FILE}. Delete the folder and download the model again."
+                )
+        checks[key] = {"name": name, "files": signature, "verified_at": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        self._save_checks()
+        logger.info(f"Model '{name}' verified in {time.perf_counter() - started:.1f}s: {model_dir}")
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> ModelRegistry:
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry()
+    return _registry
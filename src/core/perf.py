@@ -0,0 +1,177 @@
+import os
+import sys
+import json
+import time
+import logging
+import platform
+import threading
+from typing import Callable, Dict, List, Optional
+
+from src.constants import PERF_LOG_FILE
+
+logger = logging.getLogger(__name__)
+
+MAX_BYTES = 1024 * 1024
+BACKUP_COUNT = 3  # perf.1.jsonl ... perf.3.jsonl
+REPORT_JOBS = 50
+REPORT_FIELDS = {
+    "transcription": (
+        "model_load_s", "decode_s", "vad_s", "inference_s", "total_s",
+        "audio_seconds", "rtf", "segments_per_s", "peak_rss_mb"
+    ),
+    "recording": ("audio_seconds", "stop_s", "stitch_s", "gap_seconds", "dropped_frames", "peak_rss_mb"),
+}
+
+_write_lock = threading.Lock()
+_sink: Optional[Callable[[dict], None]] = None
+_cpu_model = None
+
+
+def cpu_model() -> str:
+    global _cpu_model
+    if _cpu_model is None:
+        name = None
+        try:
+            if sys.platform == "win32":
+                import winreg
+                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System\CentralProcessor\0") as key:
+                    name = winreg.QueryValueEx(key, "ProcessorNameString")[0]
+            elif os.path.exists("/proc/cpuinfo"):
+                with open("/proc/cpuinfo", encoding="utf-8", errors="replace") as f:
+                    for line in f:
+                        if line.startswith("model name"):
+                            name = line.split(":", 1)[1]
+                            break
+        except OSError:
+            pass
+        _cpu_model = " ".join((name or platform.processor() or platform.machine()).split())
+    return _cpu_model
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident memory of this process so far (it never goes down between jobs)."""
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            if not ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+                return None
+            return counters.PeakWorkingSetSize / 1024 ** 2
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS
+        return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+    except Exception:
+        return None
+
+
+def _backup_path(index: int) -> str:
+    root, ext = os.path.splitext(PERF_LOG_FILE)
+    return f"{root}.{index}{ext}"
+
+
+def _rotate():
+    for index in range(BACKUP_COUNT - 1, 0, -1):
+        if os.path.exists(_backup_path(index)):
+            os.replace(_backup_path(index), _backup_path(index + 1))
+    os.replace(PERF_LOG_FILE, _backup_path(1))
+
+
+def set_sink(sink: Optional[Callable[[dict], None]]):
+    """
+    Hand records to `sink` instead of writing them. The transcription worker
+    sends its records to the app this way: the lock below only covers one
+    process, so only the app appends to and rotates perf.jsonl.
+    """
+    global _sink
+    _sink = sink
+
+
+def write_record(kind: str, **fields):
+    """Append one job record to perf.jsonl; never raises into the job."""
+    record = {"ts": time.strftime("%Y-%m-%dT%H:%M:%S"), "kind": kind}
+    record.update(fields)
+    # Measured here, so a record relayed from the worker carries the worker's memory
+    record.setdefault("peak_rss_mb", peak_rss_mb())
+    record.setdefault("cpu", cpu_model())
+    for key, value in record.items():
+        if isinstance(value, float):
+            record[key] = round(value, 4)
+    sink = _sink
+    if sink is not None:
+        try:
+            sink(record)
+        except Exception as e:
+            logger.warning(f"Could not hand over performance record: {e}")
+        return
+    append_record(record)
+
+
+def append_record(record: dict):
+    """Write a finished record, e.g. one relayed from the worker; never raises."""
+    try:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with _write_lock:
+            if os.path.exists(PERF_LOG_FILE) and os.path.getsize(PERF_LOG_FILE) + len(line) > MAX_BYTES:
+                _rotate()
+            with open(PERF_LOG_FILE, "a", encoding="utf-8") as f:
+                f.write(line)
+    except Exception as e:
+        logger.warning(f"Could not write performance record: {e}")
+
+
+def load_records(kind: Optional[str] = None, limit: int = REPORT_JOBS) -> List[dict]:
+    """The newest `limit` records (of one kind), oldest first, across the rotated files."""
+    records = []
+    for path in [PERF_LOG_FILE] + [_backup_path(index) for index in range(1, BACKUP_COUNT + 1)]:
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8", errors="replace") as f:
+            lines = f.readlines()
+        for line in reversed(lines):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if kind is None or record.get("kind") == kind:
+                records.append(record)
+                if len(records) >= limit:
+                    return records[::-1]
+    return records[::-1]
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Linear interpolation between the closest ranks."""
+    values = sorted(values)
+    position = (len(values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def summarize(records: List[dict], fields) -> Dict[str, dict]:
+    """{field: {"n", "p50", "p90", "max"}} over the records that have the field."""
+    summary = {}
+    for field in fields:
+        values = [record[field] for record in records if isinstance(record.get(field), (int, float))]
+        if values:
+            summary[field] = {
+                "n": len(values),
+                "p50": percentile(values, 0.5),
+                "p90": percentile(values, 0.9),
+                "max": max(values),
+            }
+    return summary
@@ -0,0 +1,280 @@
+import os
+import sys
+import time
+import logging
+import threading
+from typing import Callable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Share of all cores used by other processes (ffmpeg capture, the video call)
+BUSY_LOAD = 0.6
+IDLE_LOAD = 0.4  # hysteresis: busy until the load drops below this
+SAMPLE_SECONDS = 0.5  # first reading of a job when the last one is stale
+MAX_SAMPLE_AGE = 5.0
+MIN_SAMPLE_INTERVAL = 0.25
+MAX_PAUSE = 10.0  # longest pause between two segments
+
+# Below normal, not background mode: that would also drop I/O and memory priority
+THREAD_PRIORITY_BELOW_NORMAL = -1
+BELOW_NORMAL_PRIORITY_CLASS = 0x00004000
+WORKER_NICE = 10
+TH32CS_SNAPTHREAD = 0x00000004
+THREAD_SET_INFORMATION = 0x0020
+THREAD_QUERY_INFORMATION = 0x0040
+
+
+def lower_worker_priority():
+    """Run the calling thread below normal priority. Linux threads it starts later inherit this."""
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_BELOW_NORMAL)
+        elif hasattr(os, "setpriority") and hasattr(threading, "get_native_id"):
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), WORKER_NICE)
+    except Exception as e:
+        logger.debug(f"Could not lower transcription priority: {e}")
+
+
+def lower_process_priority():
+    """Run the whole process below normal priority; threads it starts later follow."""
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), BELOW_NORMAL_PRIORITY_CLASS)
+        elif hasattr(os, "nice"):
+            os.nice(WORKER_NICE)
+    except Exception as e:
+        logger.debug(f"Could not lower worker process priority: {e}")
+
+
+def native_thread_ids() -> Set[int]:
+    """Native ids of every thread in this process (Windows only, empty elsewhere)."""
+    if sys.platform != "win32":
+        return set()
+    import ctypes
+    from ctypes import wintypes
+
+    class THREADENTRY32(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD), ("cntUsage", wintypes.DWORD), ("th32ThreadID", wintypes.DWORD),
+            ("th32OwnerProcessID", wintypes.DWORD), ("tpBasePri", wintypes.LONG),
+            ("tpDeltaPri", wintypes.LONG), ("dwFlags", wintypes.DWORD),
+        ]
+
+    kernel32 = ctypes.windll.kernel32
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPTHREAD, 0)
+    if snapshot in (None, wintypes.HANDLE(-1).value):
+        return set()
+    ids = set()
+    try:
+        pid = os.getpid()
+        entry = THREADENTRY32()
+        entry.dwSize = ctypes.sizeof(entry)
+        found = kernel32.Thread32First(snapshot, ctypes.byref(entry))
+        while found:
+            if entry.th32OwnerProcessID == pid:
+                ids.add(entry.th32ThreadID)
+            found = kernel32.Thread32Next(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(wintypes.HANDLE(snapshot))
+    return ids
+
+
+def lower_new_threads(known: Set[int]) -> Set[int]:
+    """
+    Windows threads do not inherit priority, so lower the threads CTranslate2
+    started for the model: everything not in `known` and not a Python thread.
+    Returns the ids now seen.
+    """
+    try:
+        current = native_thread_ids()
+        if not current:
+            return known
+        python_threads = {thread.native_id for thread in threading.enumerate()}
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        kernel32.OpenThread.restype = ctypes.c_void_p
+        for thread_id in current - known - python_threads:
+            handle = kernel32.OpenThread(THREAD_SET_INFORMATION | THREAD_QUERY_INFORMATION, False, thread_id)
+            if handle:
+                kernel32.SetThreadPriority(ctypes.c_void_p(handle), THREAD_PRIORITY_BELOW_NORMAL)
+                kernel32.CloseHandle(ctypes.c_void_p(handle))
+        return current
+    except Exception as e:
+        logger.debug(f"Could not lower model thread priority: {e}")
+        return known
+
+
+def _system_cpu_times() -> Optional[tuple]:
+    """(busy, total) CPU seconds of the whole machine, summed over cores."""
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+            idle, kernel, user = (wintypes.FILETIME() for _ in range(3))
+            if not ctypes.windll.kernel32.GetSystemTimes(ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user)):
+                return None
+            to_seconds = lambda ft: ((ft.dwHighDateTime << 32) + ft.dwLowDateTime) / 1e7
+            # Kernel time includes idle time
+            total = to_seconds(kernel) + to_seconds(user)
+            return total - to_seconds(idle), total
+        with open("/proc/stat") as f:
+            values = [int(value) for value in f.readline().split()[1:]]
+        ticks = os.sysconf("SC_CLK_TCK")
+        idle = values[3] + (values[4] if len(values) > 4 else 0)  # idle + iowait
+        total = sum(values[:8])
+        return (total - idle) / ticks, total / ticks
+    except Exception:
+        return None
+
+
+class CpuSampler:
+    """
+    Load of the machine excluding this process: the share of all cores that
+    other processes used since the previous reading. Transcription's own
+    threads must not count, or a running job would throttle itself.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last = None  # (monotonic, busy, total, own)
+        self._load: Optional[float] = None
+
+    def _read(self):
+        times = _system_cpu_times()
+        if times is None:
+            return None
+        return time.monotonic(), times[0], times[1], time.process_time()
+
+    def other_load(self, fresh: bool = False) -> Optional[float]:
+        """
+        With `fresh`, a reading older than MAX_SAMPLE_AGE is replaced by one
+        over the next SAMPLE_SECONDS (blocking); otherwise the load is averaged
+        over the time since the previous reading.
+        """
+        with self._lock:
+            stale = self._last is None or time.monotonic() - self._last[0] > MAX_SAMPLE_AGE
+            if self._last is None or (fresh and stale):
+                self._last = self._read()
+                if self._last is None:
+                    return None
+                time.sleep(SAMPLE_SECONDS)
+            elif time.monotonic() - self._last[0] < MIN_SAMPLE_INTERVAL:
+                return self._load
+
+            current = self._read()
+            if current is None:
+                return None
+            busy = current[1] - self._last[1]
+            total = current[2] - self._last[2]
+            own = current[3] - self._last[3]
+            self._last = current
+            if total > 0:
+                self._load = min(1.0, max(0.0, (busy - own) / total))
+            return self._load
+
+
+class ResourceGovernor:
+    """
+    Decides how hard transcription may use the CPU so it never starves a live
+    capture or the user's video call:
+
+    - at the start of a job it picks the model's thread count: cores/2 when the
+      machine is idle, half that while recording or while other processes
+      keep the CPU above BUSY_LOAD, and a single thread when both apply
+    - while a job runs (the thread count is fixed once the model is loaded)
+      `pace()` pauses between segments so the job's average CPU use matches
+      what the current state allows, and stops pausing as soon as the
+      recording ends or the load drops below IDLE_LOAD
+
+    Transcription threads also run below normal OS priority.
+    """
+
+    def __init__(self, cpu_count: Optional[int] = None, sampler: Optional[CpuSampler] = None):
+        self.cpu_count = cpu_count or os.cpu_count() or 2
+        self.sampler = sampler or CpuSampler()
+        self._recording = 0
+        self.recordings_started = 0
+        self._busy = False
+        self._listeners: List[Callable[[bool], None]] = []
+        self._lock = threading.Lock()
+
+    def set_recording(self, active: bool):
+        with self._lock:
+            self._recording = max(0, self._recording + (1 if active else -1))
+            if active:
+                self.recordings_started += 1
+            recording, listeners = self.recording, list(self._listeners)
+        for listener in listeners:
+            listener(recording)
+
+    def sync_recording(self, recording: bool):
+        """Mirror another process's recording state (the transcription worker)."""
+        with self._lock:
+            if recording and not self._recording:
+                self.recordings_started += 1
+            self._recording = 1 if recording else 0
+
+    def add_listener(self, callback: Callable[[bool], None]):
+        """Call `callback(recording)` whenever set_recording() is called."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    @property
+    def recording(self) -> bool:
+        return self._recording > 0
+
+    def busy(self, fresh: bool = False) -> bool:
+        load = self.sampler.other_load(fresh)
+        if load is not None:
+            if load > BUSY_LOAD:
+                self._busy = True
+            elif load < IDLE_LOAD:
+                self._busy = False
+        return self._busy
+
+    def full_threads(self) -> int:
+        return max(2, self.cpu_count // 2)
+
+    def thread_count(self, fresh: bool = False) -> int:
+        full = self.full_threads()
+        recording, busy = self.recording, self.busy(fresh)
+        if recording and busy:
+            return 1
+        if recording or busy:
+            return max(1, full // 2)
+        return full
+
+    def reason(self) -> Optional[str]:
+        """Why a job is held back right now, for logs and perf records."""
+        reasons = [name for name, active in (("recording", self.recording), ("cpu_busy", self._busy)) if active]
+        return "+".join(reasons) or None
+
+    def pace(self, threads: int, compute_seconds: float) -> float:
+        """
+        Call after each segment with the job's thread count and the time it
+        took; sleeps so the job uses about thread_count() cores on average.
+        Returns the seconds paused.
+        """
+        allowed = self.thread_count()
+        if allowed >= threads or compute_seconds <= 0:
+            return 0.0
+        pause = min(MAX_PAUSE, compute_seconds * (threads / allowed - 1))
+        time.sleep(pause)
+        return pause
+
+
+_governor = None
+_governor_lock = threading.Lock()
+
+
+def get_governor() -> ResourceGovernor:
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            _governor = ResourceGovernor()
+    return _governor
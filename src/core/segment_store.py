@@ -0,0 +1,295 @@
+import os
+import json
+import mmap
+import math
+import shutil
+import struct
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+# Next to each transcript: audio.txt -> audio.segments
+SIDECAR_EXT = ".segments"
+MAGIC = b"SYNSEGS\x00"
+VERSION = 1
+# magic, version, metadata bytes, segment count, word count, text bytes,
+# then the file offsets of the segment table, word table and text blob
+HEADER = struct.Struct("<8sIIQQQQQQ")
+ALIGN = 8
+PART_SECTIONS = ("segments", "words", "text")
+
+SEGMENT_DTYPE = np.dtype([
+    ("start", "<f8"), ("end", "<f8"),
+    ("avg_logprob", "<f4"), ("no_speech_prob", "<f4"),
+    ("compression_ratio", "<f4"), ("temperature", "<f4"),
+    ("text_offset", "<u8"), ("text_length", "<u4"),
+    ("word_count", "<u4"), ("word_offset", "<u8"),
+])
+# Word timings come rounded to 10 ms; float32 keeps that well past a day of audio
+WORD_DTYPE = np.dtype([
+    ("start", "<f4"), ("end", "<f4"), ("probability", "<f4"),
+    ("text_length", "<u4"), ("text_offset", "<u8"),
+])
+
+
+class SegmentStoreError(Exception):
+    pass
+
+
+def sidecar_path(txt_path: str) -> str:
+    return os.path.splitext(txt_path)[0] + SIDECAR_EXT
+
+
+def _padding(position: int) -> int:
+    return -position % ALIGN
+
+
+def _number(segment, name: str) -> float:
+    value = getattr(segment, name, None)
+    return math.nan if value is None else value
+
+
+# The .txt layout lives here so the transcriber and render_txt() cannot drift apart
+def txt_header(metadata: dict) -> str:
+    title = "SYNTHOTIC IMPORT REPORT" if metadata.get("is_import") else "SYNTHOTIC LIVE REPORT"
+    return f"{title}\nDate: {metadata.get('date')}\nFile: {metadata.get('file')}\n{'-'*40}\n\n"
+
+
+def txt_line(start: float, text: str) -> str:
+    return f"[{time.strftime('%H:%M:%S', time.gmtime(start))}] {text}\n"
+
+
+class SegmentWriter:
+    """
+    Streams segments to disk as the model yields them. Segment rows, word rows
+    and text bytes are appended to three .part files, each already in its
+    final layout; finish() concatenates them behind a header into the
+    sidecar, which replaces any previous one only when complete.
+    """
+
+    def __init__(self, path: str, metadata: dict):
+        self.path = path
+        self.metadata = dict(metadata)
+        self._parts = {section: open(f"{path}.{section}.part", "wb") for section in PART_SECTIONS}
+        self.segment_count = 0
+        self.word_count = 0
+        self.text_bytes = 0
+
+    def _add_text(self, text: str):
+        data = text.encode("utf-8")
+        self._parts["text"].write(data)
+        offset = self.text_bytes
+        self.text_bytes += len(data)
+        return offset, len(data)
+
+    def add(self, segment):
+        """Append one faster-whisper segment (anything with start, end and text)."""
+        words = getattr(segment, "words", None) or []
+        rows = np.zeros(len(words), dtype=WORD_DTYPE)
+        for row, word in zip(rows, words):
+            row["start"], row["end"] = word.start, word.end
+            row["probability"] = _number(word, "probability")
+            row["text_offset"], row["text_length"] = self._add_text(word.word)
+
+        entry = np.zeros(1, dtype=SEGMENT_DTYPE)
+        entry["start"], entry["end"] = segment.start, segment.end
+        for name in ("avg_logprob", "no_speech_prob", "compression_ratio", "temperature"):
+            entry[name] = _number(segment, name)
+        entry["text_offset"], entry["text_length"] = self._add_text(segment.text)
+        entry["word_offset"], entry["word_count"] = self.word_count, len(words)
+
+        self._parts["words"].write(rows.tobytes())
+        self._parts["segments"].write(entry.tobytes())
+        self.segment_count += 1
+        self.word_count += len(words)
+        # Hand each segment to the OS, so a crash keeps what was decoded so far
+        for part in self._parts.values():
+            part.flush()
+
+    def finish(self, **metadata) -> str:
+        """Write the sidecar (with any late metadata, e.g. the language) and drop the parts."""
+        self.metadata.update(metadata)
+        for part in self._parts.values():
+            part.close()
+        meta = json.dumps(self.metadata, ensure_ascii=False).encode("utf-8")
+
+        segments_at = HEADER.size + len(meta)
+        segments_at += _padding(segments_at)
+        words_at = segments_at + self.segment_count * SEGMENT_DTYPE.itemsize
+        text_at = words_at + self.word_count * WORD_DTYPE.itemsize
+
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(
+                MAGIC, VERSION, len(meta), self.segment_count, self.word_count, self.text_bytes,
+                segments_at, words_at, text_at
+            ))
+            f.write(meta)
+            f.write(b"\x00" * _padding(f.tell()))
+            for section in PART_SECTIONS:
+                with open(self._parts[section].name, "rb") as part:
+                    shutil.copyfileobj(part, f)
+        os.replace(tmp_path, self.path)
+        self._remove_parts()
+        return self.path
+
+    def abort(self):
+        for part in self._parts.values():
+            part.close()
+        self._remove_parts()
+
+    def _remove_parts(self):
+        for part in self._parts.values():
+            try:
+                os.remove(part.name)
+            except OSError:
+                pass
+
+
+class SegmentStore:
+    """
+    Read side of a sidecar: memory-maps the file, so opening costs a header
+    parse whatever the transcript's length. `segments` and `words` are
+    structured arrays over the mapping (one column per field); texts are
+    decoded from the blob only when asked for.
+
+    Close it (or use it as a context manager) before the file is replaced:
+    Windows keeps mapped files locked.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise SegmentStoreError(f"{path} is empty")
+        try:
+            self._parse()
+        except Exception:
+            self._map.close()
+            raise
+
+    def _parse(self):
+        if len(self._map) < HEADER.size:
+            raise SegmentStoreError(f"{self.path} is not a segment store")
+        (magic, version, meta_len, segment_count, word_count, text_bytes,
+         segments_at, words_at, text_at) = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise SegmentStoreError(f"{self.path} is not a segment store")
+        if version > VERSION:
+            raise SegmentStoreError(f"{self.path} was written by a newer version (format {version})")
+        if text_at + text_bytes > len(self._map):
+            raise SegmentStoreError(f"{self.path} is truncated")
+        self.metadata = json.loads(self._map[HEADER.size:HEADER.size + meta_len].decode("utf-8"))
+        self.segments = np.frombuffer(self._map, SEGMENT_DTYPE, segment_count, segments_at)
+        self.words = np.frombuffer(self._map, WORD_DTYPE, word_count, words_at)
+        self._text_at = text_at
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        # The arrays hold exported buffers of the mapping; drop them first
+        self.segments = self.words = None
+        try:
+            self._map.close()
+        except BufferError:
+            # A caller still holds a row or column; the mapping goes with its last reference
+            pass
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def _text(self, offset: int, length: int) -> str:
+        start = self._text_at + offset
+        return self._map[start:start + length].decode("utf-8")
+
+    def text(self, index: int) -> str:
+        row = self.segments[index]
+        return self._text(int(row["text_offset"]), int(row["text_length"]))
+
+    def segment_words(self, index: int) -> List[dict]:
+        row = self.segments[index]
+        first = int(row["word_offset"])
+        # tolist() converts a whole slice at once; per-field access on rows is far slower
+        return [
+            {"start": start, "end": end, "probability": probability, "word": self._text(offset, length)}
+            for start, end, probability, length, offset in self.words[first:first + int(row["word_count"])].tolist()
+        ]
+
+    def __iter__(self) -> Iterator[dict]:
+        for (start, end, avg_logprob, no_speech_prob, compression_ratio, temperature,
+             text_offset, text_length, _, _) in self.segments.tolist():
+            yield {
+                "start": start, "end": end, "text": self._text(text_offset, text_length),
+                "avg_logprob": avg_logprob, "no_speech_prob": no_speech_prob,
+                "compression_ratio": compression_ratio, "temperature": temperature,
+            }
+
+
+def _timestamp(seconds: float, separator: str) -> str:
+    millis = int(round(seconds * 1000))
+    return (f"{millis // 3600000:02d}:{millis // 60000 % 60:02d}:{millis // 1000 % 60:02d}"
+            f"{separator}{millis % 1000:03d}")
+
+
+def render_txt(store: SegmentStore) -> str:
+    """The transcript as the transcriber wrote it."""
+    return txt_header(store.metadata) + "".join(txt_line(segment["start"], segment["text"]) for segment in store)
+
+
+def render_srt(store: SegmentStore) -> str:
+    blocks = [
+        f"{number}\n{_timestamp(segment['start'], ',')} --> {_timestamp(segment['end'], ',')}\n"
+        f"{segment['text'].strip()}\n"
+        for number, segment in enumerate(store, 1)
+    ]
+    return "\n".join(blocks)
+
+
+def render_vtt(store: SegmentStore) -> str:
+    blocks = [
+        f"{_timestamp(segment['start'], '.')} --> {_timestamp(segment['end'], '.')}\n{segment['text'].strip()}\n"
+        for segment in store
+    ]
+    return "\n".join(["WEBVTT\n"] + blocks)
+
+
+def render_json(store: SegmentStore) -> str:
+    # NaN (a value the model did not report) is not valid JSON; NaN != NaN
+    clean = lambda value: None if value != value else value
+    segments = []
+    for index, segment in enumerate(store):
+        for key in ("avg_logprob", "no_speech_prob", "compression_ratio", "temperature"):
+            segment[key] = clean(segment[key])
+        segment["words"] = store.segment_words(index)
+        for word in segment["words"]:
+            word["probability"] = clean(word["probability"])
+        segments.append(segment)
+    # Without indent the C encoder does the work
+    return json.dumps({"metadata": store.metadata, "segments": segments}, ensure_ascii=False)
+
+
+RENDERERS: Dict[str, Callable[[SegmentStore], str]] = {
+    "txt": render_txt,
+    "srt": render_srt,
+    "vtt": render_vtt,
+    "json": render_json,
+}
+
+
+def render(path: str, fmt: str, output_path: Optional[str] = None) -> str:
+    """Render a sidecar as `fmt` without running the model; writes `output_path` if given."""
+    if fmt not in RENDERERS:
+        raise SegmentStoreError(f"Unknown format {fmt!r}, expected one of {', '.join(RENDERERS)}")
+    with SegmentStore(path) as store:
+        text = RENDERERS[fmt](store)
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(text)
+    return text
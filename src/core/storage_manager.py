@@ -0,0 +1,234 @@
+import os
+import sys
+import time
+import shutil
+import logging
+import datetime
+import threading
+import subprocess
+from typing import Callable, Optional
+
+from src.core.catalog import get_catalog
+
+logger = logging.getLogger(__name__)
+
+# Policy settings; 0 turns a policy off
+STORAGE_SETTINGS = ("storage_transcode_days", "storage_delete_days", "storage_max_gb")
+START_DELAY = 300.0  # seconds after launch before the first pass
+RUN_INTERVAL = 3600.0
+BUSY_POLL = 0.5
+BUSY_RETRY = 60.0  # seconds between checks while a recording runs
+OPUS_BITRATE = "32k"
+OPUS_EXTENSION = ".opus"
+
+# Windows priority flags
+IDLE_PRIORITY_CLASS = 0x00000040
+THREAD_MODE_BACKGROUND_BEGIN = 0x00010000
+
+
+class Paused(Exception):
+    """A recording started; the pass stops and resumes at the next run."""
+
+
+def lower_thread_priority():
+    """Run the calling thread at background CPU and I/O priority."""
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_MODE_BACKGROUND_BEGIN)
+        elif hasattr(os, "setpriority") and hasattr(threading, "get_native_id"):
+            # Linux niceness is per thread
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except Exception as e:
+        logger.debug(f"Could not lower storage worker priority: {e}")
+
+
+def _idle_child():
+    os.nice(19)
+
+
+def format_size(size: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+class StorageManager:
+    """
+    Applies the retention policies to finished recordings (transcript on disk)
+    from the catalog, oldest first:
+
+    - storage_transcode_days: WAV audio older than this is transcoded to Opus
+    - storage_delete_days: audio older than this is deleted, transcripts stay
+    - storage_max_gb: audio is deleted, oldest first, until the total fits
+
+    Only audio inside its recording folder is touched, never an imported
+    file kept in place. Runs on a background-priority thread, with ffmpeg at
+    idle priority, and stops as soon as `is_busy()` reports a recording.
+    """
+
+    def __init__(self, config, ffmpeg_path: Optional[str], is_busy: Callable[[], bool],
+                 on_report: Optional[Callable[[dict], None]] = None):
+        self.cfg = config
+        self.ffmpeg_path = ffmpeg_path
+        self.is_busy = is_busy
+        self.on_report = on_report
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        config.subscribe(self._on_config_changed, keys=STORAGE_SETTINGS)
+
+    def _on_config_changed(self, changes: dict):
+        self._wake.set()
+
+    def start(self) -> "StorageManager":
+        self._thread = threading.Thread(target=self._run, name="storage-manager", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self._wake.set()
+
+    def _run(self):
+        lower_thread_priority()
+        self._wake.wait(START_DELAY)
+        while not self._stopped.is_set():
+            self._wake.clear()
+            if self.is_busy():
+                self._wake.wait(BUSY_RETRY)
+                continue
+            try:
+                report = self.run_once()
+                if report["reclaimed"] and self.on_report:
+                    self.on_report(report)
+            except Exception as e:
+                logger.error(f"Storage pass failed: {e}")
+            self._wake.wait(RUN_INTERVAL)
+
+    def _policy(self, key: str) -> float:
+        try:
+            return max(0.0, float(self.cfg.get(key) or 0))
+        except (TypeError, ValueError):
+            return 0.0
+
+    def run_once(self) -> dict:
+        report = {"transcoded": 0, "deleted": 0, "reclaimed": 0, "paused": False}
+        transcode_days = self._policy("storage_transcode_days")
+        delete_days = self._policy("storage_delete_days")
+        max_bytes = self._policy("storage_max_gb") * 1024 ** 3
+        if not (transcode_days or delete_days or max_bytes):
+            return report
+
+        catalog = get_catalog()
+        try:
+            if transcode_days and self.ffmpeg_path:
+                for record in self._candidates(catalog, transcode_days):
+                    if record["audio_path"].lower().endswith(".wav"):
+                        self._transcode(catalog, record, report)
+
+            if delete_days:
+                for record in self._candidates(catalog, delete_days):
+                    self._delete(catalog, record, report)
+
+            if max_bytes:
+                # Only audio the manager can free counts: imports kept in place and
+                # hardlinked copies would otherwise push it to delete everything
+                candidates = self._candidates(catalog)
+                total = sum(self._freed(record["audio_path"]) for record in candidates)
+                for record in candidates:
+                    if total <= max_bytes:
+                        break
+                    total -= self._delete(catalog, record, report)
+        except Paused:
+            report["paused"] = True
+            logger.info("Storage pass paused for a recording")
+
+        if report["transcoded"] or report["deleted"]:
+            logger.info(
+                f"Storage pass: {report['transcoded']} transcoded, {report['deleted']} deleted, "
+                f"{format_size(report['reclaimed'])} reclaimed"
+            )
+        return report
+
+    def _candidates(self, catalog, older_than_days: Optional[float] = None) -> list:
+        """Finished recordings with audio in their own folder, oldest first."""
+        until = None
+        if older_than_days:
+            cutoff = datetime.datetime.now() - datetime.timedelta(days=older_than_days)
+            until = cutoff.isoformat(sep=" ", timespec="seconds")
+        records = []
+        for record in reversed(catalog.query(status="done", until=until)):
+            audio_path = record["audio_path"]
+            if not audio_path or os.path.dirname(os.path.abspath(audio_path)) != record["folder"]:
+                continue
+            if os.path.isfile(audio_path) and record["txt_path"] and os.path.isfile(record["txt_path"]):
+                records.append(record)
+        return records
+
+    def _check_busy(self):
+        if self.is_busy() or self._stopped.is_set():
+            raise Paused()
+
+    @staticmethod
+    def _freed(path: str) -> int:
+        # An import hardlinked from the user's file frees nothing when removed
+        stat = os.stat(path)
+        return stat.st_size if stat.st_nlink <= 1 else 0
+
+    def _transcode(self, catalog, record: dict, report: dict):
+        self._check_busy()
+        source = record["audio_path"]
+        target = os.path.splitext(source)[0] + OPUS_EXTENSION
+        part_path = target + ".part"
+        cmd = [
+            self.ffmpeg_path, "-hide_banner", "-loglevel", "error", "-y", "-i", source,
+            "-c:a", "libopus", "-b:a", OPUS_BITRATE, "-application", "voip", "-f", "opus", part_path
+        ]
+        if sys.platform == "win32":
+            process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                       creationflags=subprocess.CREATE_NO_WINDOW | IDLE_PRIORITY_CLASS)
+        else:
+            process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                       preexec_fn=_idle_child)
+        try:
+            while process.poll() is None:
+                if self.is_busy() or self._stopped.is_set():
+                    process.kill()
+                    process.wait()
+                    raise Paused()
+                time.sleep(BUSY_POLL)
+
+            error = process.stderr.read().decode("utf-8", errors="replace").strip()
+            if process.returncode != 0 or not os.path.isfile(part_path) or os.path.getsize(part_path) == 0:
+                logger.warning(f"Transcoding {source} failed: {error or process.returncode}")
+                return
+
+            shutil.copystat(source, part_path)
+            os.replace(part_path, target)
+        finally:
+            process.stderr.close()
+            if os.path.exists(part_path):
+                os.remove(part_path)
+
+        freed = self._freed(source)
+        os.remove(source)
+        size = os.path.getsize(target)
+        catalog.update(record["folder"], audio_path=target, size=size)
+        report["transcoded"] += 1
+        report["reclaimed"] += max(0, freed - size)
+
+    def _delete(self, catalog, record: dict, report: dict) -> int:
+        """Delete a recording's audio; returns the bytes actually reclaimed."""
+        self._check_busy()
+        audio_path = record["audio_path"]
+        if not os.path.isfile(audio_path):
+            return 0
+        freed = self._freed(audio_path)
+        os.remove(audio_path)
+        catalog.update(record["folder"], audio_path=None, size=0)
+        report["deleted"] += 1
+        report["reclaimed"] += freed
+        return freed
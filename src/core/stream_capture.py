@@ -0,0 +1,288 @@
+import time
+import logging
+import threading
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None
+
+from src.constants import SAMPLE_RATE, CHANNELS, CHUNK_SIZE
+from src.core.level_meter import LevelMeter
+
+logger = logging.getLogger(__name__)
+
+# Same balance as the ffmpeg filter graph: volume=0.9 / volume=1.2, then pan with
+# normalised "<" gains, which halves each input when two are summed
+SOURCE_GAINS = {"loopback": 0.9, "mic": 1.2}
+
+RING_SECONDS = 4
+WRITE_INTERVAL = 0.05
+# Once one source is this far ahead, the lagging one is padded with silence
+MAX_SKEW_SECONDS = 1.0
+
+
+def default_stream_factory(**kwargs):
+    import sounddevice as sd
+    return sd.InputStream(**kwargs)
+
+
+class _SourceRing:
+    """Single-producer/single-consumer ring filled from a PortAudio callback."""
+
+    def __init__(self, name: str, device, gain: float, capacity: int, channels: int):
+        self.name = name
+        self.device = device
+        self.gain = gain
+        self.channels = channels
+        self.buffer = np.zeros((capacity, channels), dtype=np.float32)
+        self.capacity = capacity
+        self.written = 0
+        self.read = 0
+        self.overflows = 0
+        self.dropped = 0
+        self.callback_count = 0
+        self.callback_time_total = 0.0
+        self.callback_time_max = 0.0
+        self.input_latency = 0.0
+        self.stream = None
+
+    def callback(self, indata, frames, time_info, status):
+        started = time.perf_counter()
+        if status and status.input_overflow:
+            self.overflows += 1
+
+        free = self.capacity - (self.written - self.read)
+        if frames > free:
+            # Reader fell behind: drop this block rather than overwrite unread audio
+            self.dropped += frames
+        else:
+            start = self.written % self.capacity
+            first = min(frames, self.capacity - start)
+            self.buffer[start:start + first] = indata[:first, :self.channels]
+            if first < frames:
+                self.buffer[:frames - first] = indata[first:frames, :self.channels]
+            self.written += frames
+
+        try:
+            self.input_latency = time_info.currentTime - time_info.inputBufferAdcTime
+        except AttributeError:
+            pass
+
+        elapsed = time.perf_counter() - started
+        self.callback_count += 1
+        self.callback_time_total += elapsed
+        if elapsed > self.callback_time_max:
+            self.callback_time_max = elapsed
+
+    def available(self) -> int:
+        return self.written - self.read
+
+    def read_into(self, out: np.ndarray, frames: int):
+        start = self.read % self.capacity
+        first = min(frames, self.capacity - start)
+        out[:first] = self.buffer[start:start + first]
+        if first < frames:
+            out[first:frames] = self.buffer[:frames - first]
+        self.read += frames
+
+
+class StreamCapture:
+    """
+    In-process capture: one callback stream per source, mixed in NumPy on a
+    writer thread and written through soundfile. All buffers are allocated up
+    front; callbacks only copy into their ring.
+
+    channel_mode "mix" reproduces the ffmpeg mix, "split" keeps each source on
+    its own channel (loopback left, mic right).
+
+    `sources` are (name, device) pairs, or (name, device, channels) for a
+    device with fewer than CHANNELS inputs; a mono source is upmixed.
+    """
+
+    def __init__(self, wav_path: str, sources: Sequence[tuple],
+                 channel_mode: str = "mix",
+                 sample_rate: int = SAMPLE_RATE,
+                 blocksize: int = CHUNK_SIZE,
+                 stream_factory: Optional[Callable] = None,
+                 meter: Optional[LevelMeter] = None,
+                 ring_seconds: float = RING_SECONDS):
+        if sf is None:
+            raise RuntimeError("Missing dependency: soundfile")
+        if channel_mode == "split" and len(sources) > 2:
+            raise ValueError("Split mode supports at most two sources")
+
+        self.wav_path = wav_path
+        self.sample_rate = sample_rate
+        self.blocksize = blocksize
+        self.channel_mode = channel_mode
+        self.stream_factory = stream_factory or default_stream_factory
+        self.meter = meter
+
+        capacity = int(sample_rate * ring_seconds)
+        # A lone source is recorded as-is, like the ffmpeg path without a mic
+        self._rings: List[_SourceRing] = [
+            _SourceRing(name, device, SOURCE_GAINS.get(name, 1.0) if len(sources) > 1 else 1.0, capacity,
+                        channels[0] if channels else CHANNELS)
+            for name, device, *channels in sources
+        ]
+
+        max_block = int(sample_rate * WRITE_INTERVAL * 4)
+        self._block_frames = max_block
+        self._mix = np.zeros((max_block, CHANNELS), dtype=np.float32)
+        self._scratch = np.zeros((max_block, CHANNELS), dtype=np.float32)
+        self._meter_block = np.zeros((max_block, len(self._rings)), dtype=np.float32)
+        self._mix_scale = 1.0 / len(self._rings) if len(self._rings) > 1 else 1.0
+
+        self._file = None
+        self._writer: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._frames_written = 0
+        self._padded_frames = 0
+        self._started_at = None
+        self._write_time_total = 0.0
+        self._write_count = 0
+        self.error: Optional[str] = None
+
+    def start(self):
+        self._file = sf.SoundFile(
+            self.wav_path, mode="w", samplerate=self.sample_rate,
+            channels=CHANNELS, subtype="PCM_16", format="WAV"
+        )
+        try:
+            for ring in self._rings:
+                ring.stream = self.stream_factory(
+                    device=ring.device,
+                    samplerate=self.sample_rate,
+                    channels=ring.channels,
+                    dtype="float32",
+                    blocksize=self.blocksize,
+                    callback=ring.callback,
+                )
+            for ring in self._rings:
+                ring.stream.start()
+        except Exception:
+            self._close_streams()
+            self._file.close()
+            raise
+
+        self._started_at = time.monotonic()
+        self._writer = threading.Thread(target=self._write_loop, name="stream-capture-writer", daemon=True)
+        self._writer.start()
+        logger.info(f"Stream capture started: {', '.join(r.name for r in self._rings)} ({self.channel_mode})")
+        return self
+
+    def stop(self):
+        self._close_streams()
+        self._stop_event.set()
+        if self._writer:
+            self._writer.join(timeout=5)
+        if self._file:
+            self._file.close()
+            self._file = None
+        return self.wav_path
+
+    @property
+    def is_running(self) -> bool:
+        return self._writer is not None and self._writer.is_alive()
+
+    @property
+    def streams_active(self) -> bool:
+        """False once any stream was stopped underneath us (device unplugged)."""
+        return all(ring.stream is not None and getattr(ring.stream, "active", True) for ring in self._rings)
+
+    def _close_streams(self):
+        for ring in self._rings:
+            if ring.stream is not None:
+                try:
+                    ring.stream.stop()
+                    ring.stream.close()
+                except Exception as e:
+                    logger.debug(f"Error closing {ring.name} stream: {e}")
+                ring.stream = None
+
+    def _write_loop(self):
+        try:
+            while not self._stop_event.wait(WRITE_INTERVAL):
+                self._drain()
+            self._drain(final=True)
+        except Exception as e:
+            self.error = str(e)
+            logger.error(f"Stream capture writer failed: {e}")
+
+    def _drain(self, final: bool = False):
+        max_skew = int(self.sample_rate * MAX_SKEW_SECONDS)
+        while True:
+            available = [ring.available() for ring in self._rings]
+            frames = min(available)
+            if (final or max(available) > max_skew) and max(available) > frames:
+                # A source stalled or its clock runs slow: pad it instead of stalling the file
+                frames = max(available)
+            frames = min(frames, self._block_frames)
+            if frames <= 0:
+                return
+            self._write_block(frames)
+
+    def _write_block(self, frames: int):
+        started = time.perf_counter()
+        mix = self._mix[:frames]
+        scratch = self._scratch[:frames]
+        meter_block = self._meter_block[:frames]
+        mix.fill(0.0)
+
+        for index, ring in enumerate(self._rings):
+            available = min(ring.available(), frames)
+            if available < frames:
+                scratch[available:].fill(0.0)
+                self._padded_frames += frames - available
+            if available:
+                ring.read_into(scratch[:, :ring.channels], available)
+            if ring.channels < CHANNELS:
+                # Mono device: the same signal on both channels
+                scratch[:, ring.channels:] = scratch[:, :1]
+
+            if self.meter is not None:
+                np.add(scratch[:, 0], scratch[:, 1], out=meter_block[:, index])
+                meter_block[:, index] *= 0.5
+
+            if self.channel_mode == "split":
+                np.add(scratch[:, 0], scratch[:, 1], out=mix[:, index])
+                mix[:, index] *= 0.5 * ring.gain
+            else:
+                scratch *= ring.gain * self._mix_scale
+                mix += scratch
+
+        np.clip(mix, -1.0, 1.0, out=mix)
+        self._file.write(mix)
+        self._frames_written += frames
+
+        if self.meter is not None:
+            self.meter.process(meter_block)
+
+        self._write_time_total += time.perf_counter() - started
+        self._write_count += 1
+
+    def get_stats(self) -> dict:
+        wall_time = time.monotonic() - self._started_at if self._started_at else 0.0
+        capture_time = self._frames_written / self.sample_rate
+        callbacks = sum(r.callback_count for r in self._rings)
+        callback_total = sum(r.callback_time_total for r in self._rings)
+        return {
+            "bytes_written": self._frames_written * CHANNELS * 2,
+            "capture_time": capture_time,
+            "bitrate_kbps": self.sample_rate * CHANNELS * 16 / 1000,
+            "wall_time": wall_time,
+            "drift": wall_time - capture_time,
+            "updated_at": time.time() if self._frames_written else None,
+            "padded_frames": self._padded_frames,
+            "dropped_frames": sum(r.dropped for r in self._rings),
+            "overflows": sum(r.overflows for r in self._rings),
+            "callback_avg_us": (callback_total / callbacks * 1e6) if callbacks else 0.0,
+            "callback_max_us": max((r.callback_time_max for r in self._rings), default=0.0) * 1e6,
+            "write_avg_us": (self._write_time_total / self._write_count * 1e6) if self._write_count else 0.0,
+            "input_latency_ms": max((r.input_latency for r in self._rings), default=0.0) * 1000,
+            "buffered_ms": max((r.available() for r in self._rings), default=0) / self.sample_rate * 1000,
+        }
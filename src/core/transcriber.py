@@ -3,74 +3,224 @@ import time
 import logging
 import traceback
 import datetime
-from queue import Queue
-
-try:
-    import soundfile as sf
-    from faster_whisper import WhisperModel
-except ImportError:
-    sf = None
-    WhisperModel = None
+import threading
 
 from src.constants import MODEL_SIZE
+from src.profiling import profiled
+from src.core import perf
+from src.core.catalog import record
+from src.core.model_registry import get_registry
+from src.core.resource_governor import get_governor, lower_worker_priority, lower_new_threads, native_thread_ids
+from src.core.wav_repair import repair_wav
+from src.core.transcript_index import index_transcript
+
+# Everything below the client functions runs in the transcription worker process
+# (src/core/transcription_service.py). faster-whisper pulls in ctranslate2 and
+# tokenizers (well over a second of imports), so the worker loads it on its first
+# job or when warm_up() asks it to once the window is up.
+_backend = None
+_backend_lock = threading.Lock()
+# (key, WhisperModel): the worker keeps its model loaded between jobs
+_model = None
+
+WHISPER_SAMPLE_RATE = 16000
+COMPUTE_TYPE = "int8"
+
+def load_backend():
+    """Return (decode_audio, WhisperModel), or None if faster-whisper is not installed."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            try:
+                # Models come from the local registry; keep huggingface_hub from ever going online
+                os.environ.setdefault("HF_HUB_OFFLINE", "1")
+                from faster_whisper import WhisperModel
+                from faster_whisper.audio import decode_audio
+                _backend = (decode_audio, WhisperModel)
+            except ImportError as e:
+                logging.error(f"Transcription backend unavailable: {e}")
+                _backend = False
+    return _backend or None
+
+def warm_up():
+    """Start the worker process and have it load the backend and model in the background."""
+    from src.core.transcription_service import get_service
+    get_service().warm_up()
+
+def transcription_worker(audio_path, gui_queue, config, is_import=False, txt_path=None):
+    """
+    Transcribe in the worker process and relay its messages to `gui_queue`;
+    blocks until the job is done, so callers run it on a thread as before.
+    """
+    from src.core.transcription_service import get_service
+    job = dict(
+        audio_path=audio_path, language=config.get("language"), is_import=is_import,
+        txt_path=txt_path or os.path.splitext(audio_path)[0] + ".txt"
+    )
+    get_service().transcribe(job, gui_queue)
 
-def transcription_worker(audio_path, gui_queue, config, is_import=False):
-    if WhisperModel is None:
+def model_params(threads):
+    return dict(device="cpu", compute_type=COMPUTE_TYPE, cpu_threads=threads)
+
+def load_model(model_path, params):
+    """The cached model if it was loaded with the same settings, otherwise a new one."""
+    global _model
+    key = (model_path, tuple(sorted(params.items())))
+    if _model is None or _model[0] != key:
+        # Release the old model before loading the next, not both at once
+        _model = None
+        _, WhisperModel = load_backend()
+        _model = (key, WhisperModel(model_path, local_files_only=True, **params))
+    return _model[1]
+
+def preload():
+    """Worker side of warm_up(): a first-use checksum pass and the model load happen here."""
+    started = time.perf_counter()
+    if not load_backend():
+        return
+    try:
+        load_model(get_registry().resolve(MODEL_SIZE), model_params(get_governor().thread_count(fresh=True)))
+        logging.info(f"Transcription model loaded in {time.perf_counter() - started:.2f}s")
+    except Exception as e:
+        logging.error(f"Transcription model unavailable: {e}")
+
+@profiled("transcription")
+def transcribe(audio_path, gui_queue, language, is_import=False, txt_path=None):
+    backend = load_backend()
+    if backend is None:
         gui_queue.put(("error", "Missing dependency: faster-whisper"))
         return
+    decode_audio, _ = backend
+    # Pulls in numpy, which the app's startup path leaves out
+    from src.core.segment_store import SegmentWriter, sidecar_path, txt_header, txt_line
+    
+    txt_path = txt_path or os.path.splitext(audio_path)[0] + ".txt"
+    folder = os.path.dirname(txt_path)
+    started = time.perf_counter()
+    segment_writer = None
 
     try:
         gui_queue.put(("status_proc", None))
         
-        user_lang = config.get("language")
-        whisper_lang = "pt" if "pt" in user_lang else "en"
+        # Interrupted recordings keep their samples but may carry zeroed header sizes.
+        # Imports are read in place from the user's file, which is never modified.
+        if not is_import and audio_path.lower().endswith(".wav"):
+            try:
+                repair_wav(audio_path)
+            except Exception as e:
+                logging.warning(f"WAV header check failed for {audio_path}: {e}")
+        
+        whisper_lang = "pt" if "pt" in (language or "") else "en"
         
         prompt = (
             "Professional meeting transcription. Use formal punctuation and proper grammar. "
             "Maintain technical terminology and acronyms accurately."
         )
 
-        try:
-            audio_info = sf.info(audio_path)
-            total_duration = audio_info.duration
-        except Exception:
-            total_duration = 1
-        
-        total_cores = os.cpu_count() or 2
-        safe_threads = max(2, int(total_cores / 2))
+        # Decoded here rather than inside transcribe() so decoding is timed on its own
+        # (the whole file is decoded to 16 kHz mono either way)
+        stage = time.perf_counter()
+        audio = decode_audio(audio_path, sampling_rate=WHISPER_SAMPLE_RATE)
+        decode_s = time.perf_counter() - stage
+        duration = len(audio) / WHISPER_SAMPLE_RATE or None
+        total_duration = duration or 1
         
-        model = WhisperModel(MODEL_SIZE, device="cpu", compute_type="int8", cpu_threads=safe_threads)
+        # Fewer threads, below normal priority, while a recording runs or the machine is busy
+        governor = get_governor()
+        lower_worker_priority()
+        total_cores = governor.cpu_count
+        safe_threads = governor.thread_count(fresh=True)
+        held_back = governor.reason()
+        if held_back:
+            logging.info(f"Transcribing with {safe_threads} of {governor.full_threads()} threads ({held_back})")
+        known_threads = native_thread_ids()
+        recordings_started = governor.recordings_started
         
-        segments, info = model.transcribe(
-            audio_path, 
-            beam_size=5, 
-            initial_prompt=prompt,
+        params = model_params(safe_threads)
+        transcribe_params = dict(
+            beam_size=5,
             vad_filter=True,
             vad_parameters=dict(min_silence_duration_ms=500),
             repetition_penalty=1.15,
-            condition_on_previous_text=False
+            condition_on_previous_text=False,
+            word_timestamps=True
         )
+        session = dict(
+            status="transcribing", model=MODEL_SIZE, error=None,
+            params=dict(params, language=whisper_lang, **transcribe_params)
+        )
+        if duration:
+            session["duration"] = duration
+        record(folder, **session)
+        
+        stage = time.perf_counter()
+        model = load_model(get_registry().resolve(MODEL_SIZE), params)
+        model_load_s = time.perf_counter() - stage
         
-        txt_path = os.path.splitext(audio_path)[0] + ".txt"
+        # transcribe() runs VAD (and language detection) up front; inference runs as segments are read
+        stage = time.perf_counter()
+        segments, info = model.transcribe(audio, initial_prompt=prompt, **transcribe_params)
+        vad_s = time.perf_counter() - stage
         
+        stage = time.perf_counter()
+        segment_count = 0
+        paused_s = 0.0
+        segment_started = stage
+        metadata = dict(
+            is_import=is_import, date=str(datetime.datetime.now()), file=os.path.basename(audio_path),
+            model=MODEL_SIZE, language=info.language, duration=duration
+        )
+        # Every segment also goes to the binary sidecar, with its timings, confidences and
+        # words, so other formats can be rendered later without running the model again
+        segment_writer = SegmentWriter(sidecar_path(txt_path), metadata)
         with open(txt_path, "w", encoding="utf-8") as f:
-            header = "SYNTHOTIC IMPORT REPORT\n" if is_import else "SYNTHOTIC LIVE REPORT\n"
-            f.write(f"{header}Date: {datetime.datetime.now()}\n")
-            f.write(f"File: {os.path.basename(audio_path)}\n{'-'*40}\n\n")
+            f.write(txt_header(metadata))
             
             for segment in segments:
                 current_pos = segment.end
                 percent = (current_pos / total_duration) * 100
                 gui_queue.put(("progress", min(99, percent)))
                 
-                ts = time.strftime('%H:%M:%S', time.gmtime(segment.start))
-                line = f"[{ts}] {segment.text}\n"
-                f.write(line)
+                f.write(txt_line(segment.start, segment.text))
+                segment_writer.add(segment)
+                segment_count += 1
+                
+                # The model's worker threads exist once the first segment is decoded; a capture
+                # started since the snapshot could have added its own, so leave those alone
+                if segment_count == 1 and governor.recordings_started == recordings_started:
+                    lower_new_threads(known_threads)
+                paused_s += governor.pace(safe_threads, time.perf_counter() - segment_started)
+                segment_started = time.perf_counter()
+        inference_s = time.perf_counter() - stage - paused_s
+        segment_writer.finish()
+        segment_writer = None
         
+        index_transcript(txt_path)
+        elapsed = time.perf_counter() - started
+        perf.write_record(
+            "transcription", status="done", folder=os.path.basename(folder), is_import=is_import, model=MODEL_SIZE,
+            compute_type=COMPUTE_TYPE, threads=safe_threads, cpu_count=total_cores,
+            governor=held_back, paused_s=paused_s,
+            model_load_s=model_load_s, decode_s=decode_s, vad_s=vad_s, inference_s=inference_s,
+            total_s=elapsed, audio_seconds=duration, rtf=elapsed / duration if duration else None,
+            segments=segment_count, segments_per_s=segment_count / inference_s if inference_s else None,
+            speech_seconds=getattr(info, "duration_after_vad", None)
+        )
+        record(
+            folder, status="done", txt_path=txt_path, transcribe_seconds=round(elapsed, 2),
+            rtf=round(elapsed / duration, 4) if duration else None
+        )
         gui_queue.put(("progress", 100))
         time.sleep(0.5)
         gui_queue.put(("done", txt_path))
         
     except Exception as e:
+        if segment_writer:
+            segment_writer.abort()
+        record(folder, status="failed", error=str(e))
+        perf.write_record(
+            "transcription", status="failed", folder=os.path.basename(folder), is_import=is_import,
+            total_s=time.perf_counter() - started, error=str(e)
+        )
         gui_queue.put(("error", str(e)))
         logging.error(traceback.format_exc())
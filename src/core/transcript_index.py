@@ -0,0 +1,245 @@
+import os
+import re
+import glob
+import sqlite3
+import logging
+import threading
+from contextlib import closing
+from typing import Callable, List, Optional
+
+from src.constants import INDEX_DB_FILE
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_LINE = re.compile(r"^\[(\d+):(\d{2}):(\d{2})\] ?(.*)$")
+RECORDING_FOLDERS = ("Live_*", "Import_*")
+SEARCH_LIMIT = 50
+BACKFILL_BATCH = 50
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    folder TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS segments (
+    id INTEGER PRIMARY KEY,
+    transcript_id INTEGER NOT NULL REFERENCES transcripts(id) ON DELETE CASCADE,
+    offset REAL NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS segments_transcript ON segments(transcript_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5(
+    text, content='segments', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS segments_ai AFTER INSERT ON segments BEGIN
+    INSERT INTO segments_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS segments_ad AFTER DELETE ON segments BEGIN
+    INSERT INTO segments_fts(segments_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+
+def parse_transcript(path: str) -> List[tuple]:
+    """(offset_seconds, text) for every "[HH:MM:SS] text" line of a transcript."""
+    segments = []
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            match = SEGMENT_LINE.match(line.rstrip("\n"))
+            if match and match.group(4).strip():
+                hours, minutes, seconds, text = match.groups()
+                segments.append((int(hours) * 3600 + int(minutes) * 60 + int(seconds), text.strip()))
+    return segments
+
+
+def find_transcripts(output_base: str) -> List[str]:
+    """Transcripts under output_base, oldest first (folder names carry the timestamp)."""
+    paths = []
+    for pattern in RECORDING_FOLDERS:
+        for folder in glob.glob(os.path.join(output_base, pattern)):
+            paths.extend(glob.glob(os.path.join(folder, "*.txt")))
+    return sorted(paths, key=lambda path: os.path.basename(os.path.dirname(path)).split("_", 1)[-1])
+
+
+def build_query(text: str) -> str:
+    """
+    Turn what the user typed into an FTS5 query: every word must match, the last
+    one as a prefix (search as you type). Quoting keeps FTS5 operators inert.
+    """
+    words = re.findall(r"\w+", text, flags=re.UNICODE)
+    if not words:
+        return ""
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def format_offset(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+class TranscriptIndex:
+    """
+    SQLite FTS5 index of every transcript segment with its offset and recording
+    folder. A short-lived connection per call keeps it usable from any thread;
+    WAL lets searches run while the scanner or a finished transcription writes.
+    Use get_index(): its write lock only serialises writers sharing the instance.
+    """
+
+    def __init__(self, db_path: str = INDEX_DB_FILE):
+        self.db_path = db_path
+        self._write_lock = threading.Lock()
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    def add_transcript(self, path: str, stat: Optional[os.stat_result] = None) -> int:
+        """(Re)index one transcript; returns the number of segments stored."""
+        with self._write_lock, closing(self._connect()) as conn, conn:
+            return self._add(conn, os.path.abspath(path), stat or os.stat(path))
+
+    def _add(self, conn: sqlite3.Connection, path: str, stat: os.stat_result) -> int:
+        segments = parse_transcript(path)
+        conn.execute("DELETE FROM transcripts WHERE path = ?", (path,))
+        cursor = conn.execute(
+            "INSERT INTO transcripts (path, folder, mtime, size) VALUES (?, ?, ?, ?)",
+            (path, os.path.basename(os.path.dirname(path)), stat.st_mtime, stat.st_size)
+        )
+        transcript_id = cursor.lastrowid
+        conn.executemany(
+            "INSERT INTO segments (transcript_id, offset, text) VALUES (?, ?, ?)",
+            ((transcript_id, offset, text) for offset, text in segments)
+        )
+        return len(segments)
+
+    def remove_transcript(self, path: str):
+        with self._write_lock, closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM transcripts WHERE path = ?", (os.path.abspath(path),))
+
+    def backfill(self, output_base: str) -> dict:
+        """
+        Index new or changed transcripts under output_base and drop the ones whose
+        file is gone. Unchanged files (same mtime and size) are not read.
+        """
+        with closing(self._connect()) as conn:
+            known = {path: (mtime, size) for path, mtime, size in
+                     conn.execute("SELECT path, mtime, size FROM transcripts")}
+
+        counts = {"indexed": 0, "unchanged": 0, "removed": 0}
+        changed = []
+        for path in find_transcripts(output_base):
+            path = os.path.abspath(path)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if known.pop(path, None) == (stat.st_mtime, stat.st_size):
+                counts["unchanged"] += 1
+            else:
+                changed.append((path, stat))
+
+        # Commit in batches: one transaction per file would spend most of the time syncing
+        for start in range(0, len(changed), BACKFILL_BATCH):
+            with self._write_lock, closing(self._connect()) as conn, conn:
+                for path, stat in changed[start:start + BACKFILL_BATCH]:
+                    try:
+                        self._add(conn, path, stat)
+                        counts["indexed"] += 1
+                    except (OSError, UnicodeError) as e:
+                        logger.warning(f"Could not index {path}: {e}")
+
+        # Whatever is left was not found under output_base this time
+        for path in known:
+            if not os.path.exists(path):
+                self.remove_transcript(path)
+                counts["removed"] += 1
+
+        if counts["indexed"] or counts["removed"]:
+            logger.info(f"Transcript index: {counts['indexed']} indexed, {counts['removed']} removed")
+        return counts
+
+    def search(self, text: str, limit: int = SEARCH_LIMIT) -> List[dict]:
+        """
+        Newest hits first. Walking the FTS index in rowid order stops after `limit`
+        hits; ranking by relevance would score every match of a common word.
+        """
+        query = build_query(text)
+        if not query:
+            return []
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                """
+                SELECT t.path, t.folder, s.offset,
+                       snippet(segments_fts, 0, '[', ']', '…', 16)
+                FROM segments_fts
+                JOIN segments s ON s.id = segments_fts.rowid
+                JOIN transcripts t ON t.id = s.transcript_id
+                WHERE segments_fts MATCH ?
+                ORDER BY segments_fts.rowid DESC
+                LIMIT ?
+                """,
+                (query, limit)
+            ).fetchall()
+        return [
+            {"path": path, "folder": folder, "offset": offset, "snippet": snippet}
+            for path, folder, offset, snippet in rows
+        ]
+
+    def stats(self) -> dict:
+        with closing(self._connect()) as conn:
+            transcripts = conn.execute("SELECT COUNT(*) FROM transcripts").fetchone()[0]
+            segments = conn.execute("SELECT COUNT(*) FROM segments").fetchone()[0]
+        return {"transcripts": transcripts, "segments": segments}
+
+
+_index = None
+_index_lock = threading.Lock()
+_sink: Optional[Callable[[str], None]] = None
+
+
+def get_index() -> TranscriptIndex:
+    """The process-wide index: the schema is set up once and every writer shares one lock."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = TranscriptIndex()
+    return _index
+
+
+def set_sink(sink: Optional[Callable[[str], None]]):
+    """
+    Hand finished transcripts to `sink` instead of indexing them. The
+    transcription worker sends them to the app this way, so only the app's
+    index writes to index.db, under the same lock as the backfill.
+    """
+    global _sink
+    _sink = sink
+
+
+def index_transcript(path: str):
+    """Add a freshly written transcript to the index; failures never reach the caller."""
+    try:
+        sink = _sink
+        if sink is not None:
+            sink(path)
+        else:
+            get_index().add_transcript(path)
+    except Exception as e:
+        logger.warning(f"Could not index {path}: {e}")
+
+
+def backfill_index(output_base: str):
+    """Background scanner entry point: bring the index up to date with output_base."""
+    try:
+        get_index().backfill(output_base)
+    except Exception as e:
+        logger.warning(f"Transcript index backfill failed: {e}")
@@ -0,0 +1,271 @@
+import os
+import queue
+import logging
+import itertools
+import threading
+import multiprocessing
+from typing import Callable, Dict
+
+from src import profiling
+from src.core import perf, transcript_index
+from src.core.catalog import record
+from src.core.resource_governor import get_governor
+
+logger = logging.getLogger(__name__)
+
+JOB_ATTEMPTS = 2  # a file that crashes the worker twice is reported as failed
+STOP_TIMEOUT = 5.0
+PROFILE_SUBFOLDER = "worker"
+
+
+class _PipeLogHandler(logging.Handler):
+    """Worker side: hands every log line to the app, which owns system.log."""
+
+    def __init__(self, send: Callable[[tuple], None]):
+        super().__init__()
+        self.send = send
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.send(("log", record.levelno, record.name, self.format(record)))
+        except Exception:
+            pass
+
+
+class _JobQueue:
+    """Worker side: what transcribe() puts on its "GUI queue" goes back up the pipe."""
+
+    def __init__(self, send: Callable[[tuple], None], job_id: int):
+        self.send = send
+        self.job_id = job_id
+
+    def put(self, message: tuple):
+        self.send(("job", self.job_id, message))
+
+
+def worker_main(conn):
+    """
+    Entry point of the transcription worker process. A reader thread takes
+    messages off the pipe (recording state applies at once, even mid-job);
+    jobs run one after another on the main thread, so the model stays loaded.
+    """
+    from src.core import transcriber
+    from src.core.resource_governor import lower_process_priority
+
+    lower_process_priority()
+    send_lock = threading.Lock()
+
+    def send(message: tuple):
+        with send_lock:
+            conn.send(message)
+
+    root = logging.getLogger()
+    root.handlers = [_PipeLogHandler(send)]
+    root.setLevel(logging.INFO)
+    # Only the app writes perf.jsonl and index.db, so the two processes never race on them
+    perf.set_sink(lambda record: send(("perf", record)))
+    transcript_index.set_sink(lambda path: send(("index", path)))
+
+    work = queue.Queue()
+
+    def read():
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                # The app is gone: finish nothing, just exit
+                work.put(None)
+                return
+            if message[0] == "recording":
+                get_governor().sync_recording(message[1])
+            elif message[0] == "stop":
+                work.put(None)
+                return
+            else:
+                work.put(message)
+
+    threading.Thread(target=read, name="worker-pipe", daemon=True).start()
+
+    while True:
+        message = work.get()
+        if message is None:
+            break
+        if message[0] == "warm_up":
+            transcriber.preload()
+        elif message[0] == "job":
+            _, job_id, job = message
+            # Profile the job when the app is profiling, into a subfolder of its session
+            profile_dir = job.pop("profile_dir", None)
+            profile_dir = profile_dir and os.path.join(profile_dir, PROFILE_SUBFOLDER)
+            if profiling.session_folder() != profile_dir:
+                profiling.stop_session()
+                if profile_dir:
+                    profiling.start_session(profile_dir, profile_tk_thread=False)
+            replies = _JobQueue(send, job_id)
+            try:
+                transcriber.transcribe(gui_queue=replies, **job)
+            except Exception as e:
+                logging.exception(f"Transcription job failed: {e}")
+                replies.put(("error", str(e)))
+    profiling.stop_session()
+
+
+class TranscriptionService:
+    """
+    App side of the transcription worker: a separate process that keeps the
+    model loaded between jobs, so decoding and segment handling never compete
+    with the Tk loop for the GIL, and a native crash in CTranslate2 cannot
+    take a recording down with it.
+
+    Jobs run one at a time. Progress and log lines come back over a pipe. If
+    the worker dies, it is started again and the job retried, up to
+    JOB_ATTEMPTS times.
+    """
+
+    def __init__(self):
+        self._context = multiprocessing.get_context("spawn")
+        self._process = None
+        self._conn = None
+        self._state_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._job_lock = threading.Lock()
+        self._jobs: Dict[int, queue.Queue] = {}
+        self._ids = itertools.count(1)
+        self._stopping = False
+        get_governor().add_listener(self._on_recording_changed)
+
+    def _ensure_started(self):
+        if self._process is not None and self._process.is_alive():
+            return
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=worker_main, args=(child_conn,), name="transcription-worker", daemon=True
+        )
+        process.start()
+        # Only the worker holds its end, so its exit shows up as EOF here
+        child_conn.close()
+        self._process, self._conn = process, parent_conn
+        threading.Thread(
+            target=self._read, args=(parent_conn, process), name="transcription-pipe", daemon=True
+        ).start()
+        self._send(("recording", get_governor().recording))
+        logger.info(f"Transcription worker started (pid {process.pid})")
+
+    def _send(self, message: tuple):
+        with self._send_lock:
+            self._conn.send(message)
+
+    def _read(self, conn, process):
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+            if message[0] == "log":
+                _, level, name, text = message
+                logging.getLogger(name).log(level, f"[worker] {text}")
+            elif message[0] == "perf":
+                perf.append_record(message[1])
+            elif message[0] == "index":
+                transcript_index.index_transcript(message[1])
+            elif message[0] == "job":
+                replies = self._jobs.get(message[1])
+                if replies is not None:
+                    replies.put(message[2])
+        process.join(STOP_TIMEOUT)
+        # After stop() the pipe closing is the shutdown, not a crash to retry
+        reply = ("stopped", None) if self._stopping else ("crashed", process.exitcode)
+        for replies in list(self._jobs.values()):
+            replies.put(reply)
+
+    def _on_recording_changed(self, recording: bool):
+        with self._state_lock:
+            if self._process is None or not self._process.is_alive():
+                return
+            try:
+                self._send(("recording", recording))
+            except OSError:
+                pass
+
+    def warm_up(self):
+        with self._state_lock:
+            if self._stopping:
+                return
+            self._ensure_started()
+            self._send(("warm_up",))
+
+    def transcribe(self, job: dict, gui_queue):
+        """Run one job in the worker, relaying its messages to `gui_queue` until it is done."""
+        with self._job_lock:
+            for attempt in range(1, JOB_ATTEMPTS + 1):
+                job_id = next(self._ids)
+                replies = queue.Queue()
+                self._jobs[job_id] = replies
+                try:
+                    with self._state_lock:
+                        if self._stopping:
+                            return
+                        self._ensure_started()
+                        self._send(("job", job_id, dict(job, profile_dir=profiling.session_folder())))
+                    while True:
+                        msg_type, data = replies.get()
+                        if msg_type == "stopped":
+                            logger.info(f"Transcription of {job['audio_path']} cut off by shutdown")
+                            return
+                        if msg_type == "crashed":
+                            exit_code = data
+                            break
+                        gui_queue.put((msg_type, data))
+                        if msg_type in ("done", "error"):
+                            return
+                except OSError as e:
+                    if self._stopping:
+                        return
+                    # The worker died between the liveness check and the send
+                    exit_code = str(e)
+                finally:
+                    self._jobs.pop(job_id, None)
+                logger.error(
+                    f"Transcription worker died (exit code {exit_code}) on {job['audio_path']}, "
+                    f"attempt {attempt} of {JOB_ATTEMPTS}"
+                )
+
+        error = f"The transcription engine crashed on this file ({JOB_ATTEMPTS} attempts)"
+        record(os.path.dirname(job["txt_path"]), status="failed", error=error)
+        perf.write_record(
+            "transcription", status="failed", folder=os.path.basename(os.path.dirname(job["txt_path"])),
+            is_import=job.get("is_import", False), error=error
+        )
+        gui_queue.put(("error", error))
+
+    def stop(self):
+        with self._state_lock:
+            self._stopping = True
+            process = self._process
+            if process is None or not process.is_alive():
+                return
+            try:
+                self._send(("stop",))
+            except OSError:
+                pass
+        process.join(STOP_TIMEOUT)
+        if process.is_alive():
+            process.terminate()
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_service() -> TranscriptionService:
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = TranscriptionService()
+    return _service
+
+
+def shutdown():
+    """Stop the worker if one was started; called when the app quits."""
+    if _service is not None:
+        _service.stop()
@@ -0,0 +1,118 @@
+import os
+import mmap
+import glob
+import struct
+import logging
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_RIFF_SIZE = 0xFFFFFFFF
+
+
+def _find_data_chunk(header: bytes) -> Optional[tuple]:
+    """Return (size_field_offset, data_start, declared_size, block_align) or None."""
+    if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+        return None
+
+    block_align = 1
+    pos = 12
+    while pos + 8 <= len(header):
+        chunk_id = header[pos:pos + 4]
+        chunk_size = struct.unpack_from("<I", header, pos + 4)[0]
+        if chunk_id == b"fmt " and pos + 8 + 14 <= len(header):
+            block_align = struct.unpack_from("<H", header, pos + 8 + 12)[0] or 1
+        if chunk_id == b"data":
+            return pos + 4, pos + 8, chunk_size, block_align
+        # Chunks are word aligned
+        pos += 8 + chunk_size + (chunk_size & 1)
+    return None
+
+
+def check_wav(path: str) -> Optional[dict]:
+    """
+    Inspect the RIFF header without reading sample data. Returns None if the
+    file is not a RIFF/WAVE file, otherwise the declared and expected sizes.
+    """
+    file_size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        header = f.read(4096)
+
+    found = _find_data_chunk(header)
+    if not found:
+        return None
+
+    size_offset, data_start, declared_data, block_align = found
+    actual_data = file_size - data_start
+    actual_data -= actual_data % block_align
+    expected_data = min(actual_data, MAX_RIFF_SIZE - (data_start - 8))
+    declared_riff = struct.unpack_from("<I", header, 4)[0]
+    expected_riff = min(data_start - 8 + expected_data, MAX_RIFF_SIZE)
+
+    return {
+        "file_size": file_size,
+        "data_offset": data_start,
+        "data_size_field": size_offset,
+        "declared_data": declared_data,
+        "expected_data": expected_data,
+        "declared_riff": declared_riff,
+        "expected_riff": expected_riff,
+        "consistent": declared_data == expected_data and declared_riff == expected_riff,
+    }
+
+
+def repair_wav(path: str) -> bool:
+    """
+    Patch the RIFF and data chunk sizes of a WAV left behind by an interrupted
+    writer (ffmpeg killed, power loss). Only the two size fields are rewritten,
+    in place through a memory map; samples are never read. Returns True if the
+    header was changed.
+    """
+    if not os.path.isfile(path) or os.path.getsize(path) < 44:
+        return False
+
+    info = check_wav(path)
+    if info is None or info["consistent"]:
+        return False
+
+    # Trailing bytes after the data chunk (LIST etc.) mean the header is fine as is
+    if info["declared_data"] and info["declared_data"] < info["expected_data"] \
+            and info["declared_riff"] == info["file_size"] - 8:
+        return False
+
+    with open(path, "r+b") as f:
+        with mmap.mmap(f.fileno(), info["data_offset"], access=mmap.ACCESS_WRITE) as header:
+            struct.pack_into("<I", header, 4, info["expected_riff"])
+            struct.pack_into("<I", header, info["data_size_field"], info["expected_data"])
+            header.flush()
+
+    logger.warning(
+        f"Repaired WAV header of {path}: data {info['declared_data']} -> {info['expected_data']} bytes"
+    )
+    if info["file_size"] - info["data_offset"] > MAX_RIFF_SIZE:
+        logger.warning(f"{path} exceeds the 4 GB WAV limit; audio past the limit is not addressable")
+    return True
+
+
+def find_orphaned_recordings(output_base: str) -> List[str]:
+    """Live_* recordings with audio but no transcript (app closed or crashed mid-session)."""
+    orphans = []
+    for folder in glob.glob(os.path.join(output_base, "Live_*")):
+        wav_path = os.path.join(folder, "audio.wav")
+        txt_path = os.path.join(folder, "audio.txt")
+        if os.path.isfile(wav_path) and not os.path.exists(txt_path):
+            orphans.append(wav_path)
+    return sorted(orphans)
+
+
+def repair_orphaned_recordings(output_base: str) -> List[str]:
+    repaired = []
+    for wav_path in find_orphaned_recordings(output_base):
+        try:
+            if repair_wav(wav_path):
+                repaired.append(wav_path)
+        except Exception as e:
+            logger.error(f"Could not repair {wav_path}: {e}")
+    if repaired:
+        logger.info(f"Repaired {len(repaired)} interrupted recording(s)")
+    return repaired
@@ -0,0 +1,112 @@
+import os
+import gzip
+import queue
+import shutil
+import logging
+import threading
+import collections
+import logging.handlers
+from typing import List, Optional
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 5  # system.log.1.gz ... system.log.5.gz
+RING_CAPACITY = 1000
+
+
+class EnqueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the writer thread: the caller only
+    resolves the message (a no-op for f-strings) and puts the record on the queue.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # The traceback references live frames, so render it while they exist
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class RingBufferHandler(logging.Handler):
+    """The last `capacity` formatted lines, for showing inside the app."""
+
+    def __init__(self, capacity: int = RING_CAPACITY):
+        super().__init__()
+        self._lines = collections.deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._lines.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+    def lines(self, count: Optional[int] = None) -> List[str]:
+        lines = list(self._lines)
+        return lines[-count:] if count else lines
+
+
+def _gzip_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str):
+    # Runs on the writer thread, so compressing never holds up a caller
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_ring: Optional[RingBufferHandler] = None
+_lock = threading.Lock()
+
+
+def start(log_file: str, level: int = logging.INFO, stream=None) -> logging.handlers.QueueListener:
+    """
+    Route the root logger through a queue to one writer thread that owns the
+    rotating, gzip-compressing file handler, the console and the ring buffer.
+    Safe to call again; later calls return the running listener.
+    """
+    global _listener, _ring
+    with _lock:
+        if _listener is not None:
+            return _listener
+
+        formatter = logging.Formatter(LOG_FORMAT)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8", delay=True
+        )
+        file_handler.namer = _gzip_namer
+        file_handler.rotator = _gzip_rotator
+        _ring = RingBufferHandler()
+        handlers = [file_handler, _ring]
+        # Windowed (frozen) builds have no console
+        if stream is not None:
+            handlers.append(logging.StreamHandler(stream))
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        records = queue.SimpleQueue()
+        root = logging.getLogger()
+        root.setLevel(level)
+        root.addHandler(EnqueueHandler(records))
+
+        _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+        _listener.start()
+        return _listener
+
+
+def stop():
+    """Write out everything still queued; called at exit."""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+def recent_lines(count: Optional[int] = None) -> List[str]:
+    return _ring.lines(count) if _ring else []
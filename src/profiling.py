@@ -0,0 +1,273 @@
+import io
+import os
+import sys
+import time
+import pstats
+import cProfile
+import datetime
+import platform
+import functools
+import threading
+import tracemalloc
+import logging
+from typing import Callable, Dict, Optional
+
+from src import logs
+from src.constants import PROFILES_DIR, VERSION
+
+logger = logging.getLogger(__name__)
+
+# Either turns profiling on for the whole run, Settings or not; works in frozen builds too
+PROFILE_ENV = "SYNTHOTIC_PROFILE"
+PROFILE_SETTING = "profiling_enabled"
+
+TRACEMALLOC_FRAMES = 10
+SUMMARY_FUNCTIONS = 30
+SUMMARY_ALLOCATIONS = 15
+TK_THREAD_LABEL = "tk_thread"
+SUMMARY_FILE = "summary.txt"
+LOG_TAIL_FILE = "recent.log"
+
+
+def requested(config=None) -> bool:
+    return bool(os.environ.get(PROFILE_ENV)) or bool(config and config.get(PROFILE_SETTING))
+
+
+def _top_functions(profiler: cProfile.Profile) -> str:
+    buffer = io.StringIO()
+    stats = pstats.Stats(profiler, stream=buffer)
+    stats.strip_dirs().sort_stats("cumulative").print_stats(SUMMARY_FUNCTIONS)
+    return buffer.getvalue().strip()
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    # Leave out what tracing and this module allocate themselves
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ))
+
+
+def _top_allocations(after: tracemalloc.Snapshot, before: Optional[tracemalloc.Snapshot]) -> str:
+    if before is not None:
+        stats = after.compare_to(before, "lineno")[:SUMMARY_ALLOCATIONS]
+    else:
+        stats = after.statistics("lineno")[:SUMMARY_ALLOCATIONS]
+    return "\n".join(f"  {stat}" for stat in stats)
+
+
+class ProfileSession:
+    """
+    One profiling run, written to a timestamped folder under PROFILES_DIR:
+
+      summary.txt        environment, then per wrapped call its wall time, traced
+                         memory, hottest functions and largest allocations
+      <name>_<n>.prof    cProfile stats of each call (pstats / snakeviz)
+      <name>_<n>.tracemalloc  tracemalloc snapshot at the end of each call
+      tk_thread.prof     the Tk thread from session start to stop
+      recent.log         the last log lines when the session stopped
+
+    Sections are appended as calls finish, so a crash still leaves the profiles
+    taken so far.
+    """
+
+    def __init__(self, folder: str, profile_tk_thread: bool = True):
+        self.folder = folder
+        self.profile_tk_thread = profile_tk_thread
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._counts: Dict[str, int] = {}
+        self._started_tracemalloc = False
+        self._tk_profiler: Optional[cProfile.Profile] = None
+        self._started = time.perf_counter()
+
+    def start(self) -> "ProfileSession":
+        os.makedirs(self.folder, exist_ok=True)
+        self._append(self._environment())
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._started_tracemalloc = True
+        # The Tk loop runs for the whole session, so it is profiled from here
+        # until stop() rather than wrapped like a job
+        if self.profile_tk_thread and threading.current_thread() is threading.main_thread():
+            self._tk_profiler = self._enable_profiler()
+        return self
+
+    def _environment(self) -> str:
+        from src.core.perf import cpu_model
+        return "\n".join((
+            f"Synthotic {VERSION} profile, started {datetime.datetime.now().isoformat(timespec='seconds')}",
+            f"Frozen: {bool(getattr(sys, 'frozen', False))}",
+            f"Python: {sys.version.split()[0]} ({platform.architecture()[0]})",
+            f"OS: {platform.platform()}",
+            f"CPU: {cpu_model()} ({os.cpu_count()} logical)",
+        ))
+
+    def _enable_profiler(self) -> Optional[cProfile.Profile]:
+        # One profiler per thread: a call made on an already profiled thread
+        # (the Tk thread) shows up in that thread's profile instead
+        if getattr(self._local, "profiler", None) is not None:
+            return None
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+ allows one profiler per process
+            return None
+        self._local.profiler = profiler
+        return profiler
+
+    def _disable_profiler(self, profiler: Optional[cProfile.Profile]):
+        if profiler is not None:
+            profiler.disable()
+            self._local.profiler = None
+
+    def _label(self, name: str) -> str:
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + 1
+            return f"{name}_{self._counts[name]}"
+
+    def run(self, name: str, fn: Callable, args: tuple, kwargs: dict):
+        label = self._label(name)
+        before = _snapshot() if tracemalloc.is_tracing() else None
+        memory_before = tracemalloc.get_traced_memory()[0]
+        profiler = self._enable_profiler()
+        started = time.perf_counter()
+        error = None
+        try:
+            return fn(*args, **kwargs)
+        except BaseException as e:
+            error = repr(e)
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self._disable_profiler(profiler)
+            try:
+                self._write_call(label, elapsed, memory_before, profiler, before, error)
+            except Exception as e:
+                logger.warning(f"Could not write profile {label}: {e}")
+
+    def _write_call(self, label: str, elapsed: float, memory_before: int,
+                    profiler: Optional[cProfile.Profile], before: Optional[tracemalloc.Snapshot],
+                    error: Optional[str]):
+        lines = [f"== {label} (thread {threading.current_thread().name}) =="]
+        line = f"Wall {elapsed:.3f} s"
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            line += f", traced memory {(current - memory_before) / 1024 ** 2:+.1f} MB (process peak {peak / 1024 ** 2:.1f} MB)"
+        if error:
+            line += f", raised {error}"
+        lines.append(line)
+
+        if profiler is not None:
+            profiler.dump_stats(os.path.join(self.folder, f"{label}.prof"))
+            lines.append(_top_functions(profiler))
+        else:
+            lines.append(f"No separate cProfile data: see {TK_THREAD_LABEL}.prof")
+
+        if tracemalloc.is_tracing():
+            after = _snapshot()
+            after.dump(os.path.join(self.folder, f"{label}.tracemalloc"))
+            lines.append("Largest allocation changes during the call:")
+            lines.append(_top_allocations(after, before))
+        self._append("\n".join(lines))
+
+    def _append(self, text: str):
+        with self._lock:
+            with open(os.path.join(self.folder, SUMMARY_FILE), "a", encoding="utf-8") as f:
+                f.write(text + "\n\n")
+
+    def stop(self):
+        """Write the Tk thread profile, the final memory picture and the log tail."""
+        try:
+            lines = [f"== {TK_THREAD_LABEL} ({time.perf_counter() - self._started:.1f} s session) =="]
+            if self._tk_profiler is not None:
+                self._disable_profiler(self._tk_profiler)
+                self._tk_profiler.dump_stats(os.path.join(self.folder, f"{TK_THREAD_LABEL}.prof"))
+                lines.append(_top_functions(self._tk_profiler))
+            if tracemalloc.is_tracing():
+                snapshot = _snapshot()
+                snapshot.dump(os.path.join(self.folder, "session_end.tracemalloc"))
+                lines.append(f"Traced memory at the end: {tracemalloc.get_traced_memory()[0] / 1024 ** 2:.1f} MB")
+                lines.append(_top_allocations(snapshot, None))
+            self._append("\n".join(lines))
+            recent = logs.recent_lines()
+            if recent:
+                with open(os.path.join(self.folder, LOG_TAIL_FILE), "w", encoding="utf-8") as f:
+                    f.write("\n".join(recent) + "\n")
+        except Exception as e:
+            logger.warning(f"Could not finish profile in {self.folder}: {e}")
+        finally:
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+
+
+_session: Optional[ProfileSession] = None
+_session_lock = threading.Lock()
+
+
+def active() -> bool:
+    return _session is not None
+
+
+def session_folder() -> Optional[str]:
+    session = _session
+    return session.folder if session else None
+
+
+def start_session(folder: Optional[str] = None, profile_tk_thread: bool = True) -> str:
+    """
+    Start profiling (no-op if already on); returns the profile folder. The
+    transcription worker passes a subfolder of the app's session and no Tk thread.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            stamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            folder = folder or os.path.join(PROFILES_DIR, f"Profile_{stamp}")
+            _session = ProfileSession(folder, profile_tk_thread).start()
+            logger.info(f"Profiling on, writing to {_session.folder}")
+        return _session.folder
+
+
+def stop_session() -> Optional[str]:
+    """Stop profiling and write everything out; call from the Tk thread. Returns the folder."""
+    global _session
+    with _session_lock:
+        session, _session = _session, None
+    if session is None:
+        return None
+    session.stop()
+    logger.info(f"Profile saved to {session.folder}")
+    return session.folder
+
+
+def configure(config):
+    """Start a session if requested, and follow the Settings switch from then on."""
+    if requested(config):
+        start_session()
+    config.subscribe(_on_config_changed, keys=(PROFILE_SETTING,))
+
+
+def _on_config_changed(changes: dict):
+    # The environment variable keeps profiling on regardless of Settings
+    if changes.get(PROFILE_SETTING) or os.environ.get(PROFILE_ENV):
+        start_session()
+    else:
+        stop_session()
+
+
+def profiled(name: str):
+    """
+    Profile each call of the decorated function while a session is running.
+    With profiling off a call costs one global lookup on top of the function.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            session = _session
+            if session is None:
+                return fn(*args, **kwargs)
+            return session.run(name, fn, args, kwargs)
+        return wrapper
+    return decorate
@@ -0,0 +1,173 @@
+import os
+import json
+import hmac
+import zlib
+import socket
+import getpass
+import logging
+import secrets
+import threading
+from typing import Callable, Optional
+
+from src.constants import INSTANCE_FILE
+
+logger = logging.getLogger(__name__)
+
+INSTANCE_HOST = "127.0.0.1"
+PORT_BASE = 42000
+PORT_RANGE = 8000
+CONNECT_TIMEOUT = 1.0
+MAX_MESSAGE = 64 * 1024
+
+# Command line commands -> gui_queue messages of the running instance
+COMMANDS = {
+    "show": "cmd_show",
+    "start": "cmd_start",
+    "stop": "cmd_stop",
+    "import": "cmd_import",
+}
+
+
+def instance_port() -> int:
+    """Per-user port, so two users on one machine each get their own instance."""
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = os.path.expanduser("~")
+    return PORT_BASE + zlib.crc32(user.encode("utf-8")) % PORT_RANGE
+
+
+def _read_line(conn: socket.socket) -> bytes:
+    data = b""
+    while not data.endswith(b"\n") and len(data) < MAX_MESSAGE:
+        chunk = conn.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+class InstanceServer:
+    """
+    Listens on a loopback port; holding the port is what makes this process the
+    single instance. Commands from later launches are handed to `on_command`
+    once it is set, and kept until then (e.g. while the onboarding wizard runs).
+    """
+
+    def __init__(self, sock: socket.socket):
+        self._sock = sock
+        self._token = secrets.token_hex(16)
+        self._lock = threading.Lock()
+        self._handler: Optional[Callable[[str, Optional[str]], None]] = None
+        self._pending = []
+        self._closed = False
+        self._write_instance_file()
+        self._thread = threading.Thread(target=self._serve, name="instance-server", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def acquire(cls, port: Optional[int] = None) -> Optional["InstanceServer"]:
+        """Bind the instance port. Returns None if another instance already holds it."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            if hasattr(socket, "SO_EXCLUSIVEADDRUSE"):
+                # Windows: without this another process could bind the same port
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+            else:
+                # POSIX: still refuses a port that is being listened on, but not one in TIME_WAIT
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((INSTANCE_HOST, port or instance_port()))
+            sock.listen(8)
+        except OSError:
+            sock.close()
+            return None
+        return cls(sock)
+
+    def _write_instance_file(self):
+        info = {"pid": os.getpid(), "port": self._sock.getsockname()[1], "token": self._token}
+        tmp_path = INSTANCE_FILE + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(info, f)
+        os.replace(tmp_path, INSTANCE_FILE)
+
+    def set_handler(self, on_command: Callable[[str, Optional[str]], None]):
+        with self._lock:
+            self._handler = on_command
+            pending, self._pending = self._pending, []
+        for command, argument in pending:
+            on_command(command, argument)
+
+    def _dispatch(self, command: str, argument: Optional[str]):
+        with self._lock:
+            handler = self._handler
+            if handler is None:
+                self._pending.append((command, argument))
+                return
+        handler(command, argument)
+
+    def _serve(self):
+        while not self._closed:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                break
+            with conn:
+                try:
+                    conn.settimeout(CONNECT_TIMEOUT)
+                    reply = self._handle(_read_line(conn))
+                    conn.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+                except Exception as e:
+                    logger.debug(f"Instance request failed: {e}")
+
+    def _handle(self, data: bytes) -> dict:
+        try:
+            message = json.loads(data.decode("utf-8"))
+        except ValueError:
+            return {"ok": False, "error": "bad request"}
+        if not hmac.compare_digest(str(message.get("token", "")), self._token):
+            return {"ok": False, "error": "bad token"}
+        command = COMMANDS.get(message.get("command"))
+        if command is None:
+            return {"ok": False, "error": "unknown command"}
+
+        logger.info(f"Command from another launch: {message['command']}")
+        self._dispatch(command, message.get("argument"))
+        return {"ok": True, "pid": os.getpid()}
+
+    def close(self):
+        self._closed = True
+        try:
+            # Wakes the blocked accept() so the port is released right away
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+        self._thread.join(timeout=1)
+        try:
+            with open(INSTANCE_FILE, encoding="utf-8") as f:
+                if json.load(f).get("token") == self._token:
+                    os.remove(INSTANCE_FILE)
+        except (OSError, ValueError):
+            pass
+
+
+def send_command(command: str, argument: Optional[str] = None, port: Optional[int] = None) -> bool:
+    """Forward a command to the running instance. Returns False if none accepted it."""
+    try:
+        with open(INSTANCE_FILE, encoding="utf-8") as f:
+            token = json.load(f)["token"]
+    except (OSError, ValueError, KeyError):
+        return False
+
+    message = {"token": token, "command": command, "argument": argument}
+    try:
+        with socket.create_connection((INSTANCE_HOST, port or instance_port()), timeout=CONNECT_TIMEOUT) as conn:
+            conn.sendall(json.dumps(message).encode("utf-8") + b"\n")
+            reply = json.loads(_read_line(conn).decode("utf-8") or "{}")
+    except (OSError, ValueError):
+        return False
+
+    if not reply.get("ok"):
+        logger.warning(f"Running instance refused '{command}': {reply.get('error')}")
+        return False
+    return True
@@ -0,0 +1,203 @@
+import os
+import sys
+import json
+import time
+import logging
+import datetime
+import builtins
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+from src.constants import STARTUP_REPORT_FILE, VERSION
+
+# Taken when main.py imports this module, before any other application import
+PROCESS_START = time.perf_counter()
+
+# Set by utils/benchmark_startup.py: print a startup report once the window is up, then exit
+BENCHMARK_ENV = "SYNTHOTIC_STARTUP_BENCHMARK"
+BENCHMARK_MARKER = "SYNTHOTIC_STARTUP"
+
+# Trace mode records nested spans (including imports); works in frozen builds too
+TRACE_ENV = "SYNTHOTIC_TRACE_STARTUP"
+TRACE_FLAG = "--trace-startup"
+TRACE_MIN_IMPORT_MS = 1.0  # cheaper imports are left out of the trace
+
+# Heavy stacks that must stay off the path to the first window
+DEFERRED_MODULES = (
+    "faster_whisper", "ctranslate2", "tokenizers", "numpy",
+    "soundfile", "sounddevice", "PIL", "pystray"
+)
+
+logger = logging.getLogger(__name__)
+
+
+def elapsed_ms() -> float:
+    return (time.perf_counter() - PROCESS_START) * 1000
+
+
+def benchmark_mode() -> bool:
+    return bool(os.environ.get(BENCHMARK_ENV))
+
+
+def trace_requested() -> bool:
+    return bool(os.environ.get(TRACE_ENV)) or TRACE_FLAG in sys.argv
+
+
+def loaded_deferred_modules() -> list:
+    return [name for name in DEFERRED_MODULES if name in sys.modules]
+
+
+def _process_age_ms() -> Optional[float]:
+    """Time the process existed before this module was imported (bootloader, interpreter start)."""
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            creation, exit_time, kernel, user = (wintypes.FILETIME() for _ in range(4))
+            ctypes.windll.kernel32.GetProcessTimes(
+                ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(creation),
+                ctypes.byref(exit_time), ctypes.byref(kernel), ctypes.byref(user)
+            )
+            # FILETIME counts 100 ns intervals since 1601-01-01
+            created = ((creation.dwHighDateTime << 32) + creation.dwLowDateTime) / 1e7 - 11644473600
+            return max(0.0, (time.time() - created) * 1000)
+        if sys.platform.startswith("linux"):
+            with open("/proc/self/stat") as f:
+                start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+            with open("/proc/uptime") as f:
+                uptime = float(f.read().split()[0])
+            return max(0.0, (uptime - start_ticks / os.sysconf("SC_CLK_TCK")) * 1000)
+    except Exception:
+        pass
+    return None
+
+
+class StartupTimer:
+    """
+    Times the startup phases on the way to the main window. Top-level phases are
+    always recorded; in trace mode every nested span is kept, together with the
+    imports that took longer than TRACE_MIN_IMPORT_MS.
+
+    `finish()` logs a one-line summary and writes the report to STARTUP_REPORT_FILE.
+    """
+
+    def __init__(self, trace: bool = False):
+        self.trace = trace
+        self.preamble_ms = _process_age_ms()
+        self._spans = []
+        self._marks = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._original_import = None
+        self._finished = False
+        if trace:
+            self._install_import_tracer()
+
+    def _stack(self) -> list:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def phase(self, name: str):
+        if self._finished:
+            yield
+            return
+        stack = self._stack()
+        depth = len(stack)
+        stack.append(name)
+        started = elapsed_ms()
+        try:
+            yield
+        finally:
+            stack.pop()
+            if depth == 0 or self.trace:
+                self._record(name, started, elapsed_ms() - started, depth)
+
+    def _record(self, name: str, start_ms: float, duration_ms: float, depth: int):
+        span = {
+            "name": name,
+            "start_ms": round(start_ms, 2),
+            "duration_ms": round(duration_ms, 2),
+            "depth": depth,
+        }
+        if self.trace:
+            span["thread"] = threading.current_thread().name
+        with self._lock:
+            self._spans.append(span)
+
+    def mark(self, name: str) -> float:
+        at = elapsed_ms()
+        self._marks[name] = round(at, 2)
+        return at
+
+    def _install_import_tracer(self):
+        original = builtins.__import__
+        self._original_import = original
+
+        def traced_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level or name in sys.modules:
+                return original(name, globals, locals, fromlist, level)
+            stack = self._stack()
+            depth = len(stack)
+            stack.append(name)
+            started = elapsed_ms()
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                stack.pop()
+                duration = elapsed_ms() - started
+                if duration >= TRACE_MIN_IMPORT_MS:
+                    self._record(f"import {name}", started, duration, depth)
+
+        builtins.__import__ = traced_import
+
+    def _remove_import_tracer(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def report(self) -> dict:
+        with self._lock:
+            spans = sorted(self._spans, key=lambda span: span["start_ms"])
+        report = {
+            "version": VERSION,
+            "frozen": bool(getattr(sys, "frozen", False)),
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "trace": self.trace,
+            "preamble_ms": round(self.preamble_ms, 1) if self.preamble_ms is not None else None,
+            "marks": dict(self._marks),
+            "phases": [
+                {"name": span["name"], "start_ms": span["start_ms"], "duration_ms": span["duration_ms"]}
+                for span in spans if span["depth"] == 0
+            ],
+        }
+        if self.trace:
+            report["spans"] = spans
+        return report
+
+    def finish(self, path: str = STARTUP_REPORT_FILE) -> dict:
+        """Log the startup summary and write the JSON report. Only the first call counts."""
+        self._remove_import_tracer()
+        report = self.report()
+        if self._finished:
+            return report
+        self._finished = True
+
+        summary = " | ".join(f"{phase['name']} {phase['duration_ms']:.0f} ms" for phase in report["phases"])
+        window = report["marks"].get("window_shown")
+        logger.info(f"Startup: {summary}" + (f" | window at {window:.0f} ms" if window is not None else ""))
+
+        try:
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write startup report: {e}")
+        return report
+
+
+timer = StartupTimer(trace=trace_requested())
@@ -5,6 +5,7 @@ from src.constants import (
     APP_NAME, VERSION, BUILD_DATE, WEBSITE_URL, COPYRIGHT
 )
 from src.utils import get_resource_path
+from src.ui.perf_window import PerfReportWindow
 
 class AboutWindow(tk.Toplevel):
     
@@ -68,6 +69,10 @@ class AboutWindow(tk.Toplevel):
         lbl_git.pack(side="left", padx=10)
         lbl_git.bind("<Button-1>", lambda e: webbrowser.open(MY_GITHUB))
         
+        lbl_perf = tk.Label(link_frm, text=self.get_text("perf_title"), font=("Segoe UI", 10, "underline"), bg=THEME_COLORS["bg"], fg=THEME_COLORS["text_dim"], cursor="hand2")
+        lbl_perf.pack(side="left", padx=10)
+        lbl_perf.bind("<Button-1>", lambda e: PerfReportWindow(self, self.cfg))
+        
         tk.Label(self, text=COPYRIGHT, font=("Segoe UI", 8), bg=THEME_COLORS["bg"], fg=THEME_COLORS["text_dim"]).pack(side="bottom", pady=10)
         
         btn = tk.Button(self, text="OK", font=("Segoe UI", 10, "bold"), bg=THEME_COLORS["surface"], fg="white",
@@ -0,0 +1,150 @@
+import time
+import queue
+import socket
+import logging
+import tkinter as tk
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+WAKE_HOST = "127.0.0.1"
+FALLBACK_POLL_MS = 100  # only if the wake-up connection cannot be set up
+MAX_BATCH = 50  # messages handled per Tk callback; the rest go in the next one
+RESCHEDULE_MS = 1  # gap between batches so redraws and input get a turn
+REENTRY_DELAY_MS = 50
+# Only the newest message of these types in a batch matters
+COALESCE_TYPES = ("progress", "copy_progress")
+
+
+class GuiQueue(queue.Queue):
+    """
+    Queue of (msg_type, data) messages for the Tk thread.
+
+    Producers call put() from any thread. The post that finds no wake-up pending
+    writes one byte to a loopback connection whose other end is a Tcl channel,
+    so Tcl's notifier runs dispatch() on the Tk thread and the Tk loop stays
+    asleep while nothing happens instead of polling. The write never waits
+    for the Tk loop, unlike event_generate from another thread (and Tk on
+    Windows has no createfilehandler for a plain pipe). Each wake-up handles
+    at most `max_batch` messages and drops all but the last message of each
+    COALESCE_TYPES type in the batch.
+    """
+
+    def __init__(self, root: tk.Misc, handler: Callable[[str, object], None], max_batch: int = MAX_BATCH):
+        super().__init__()
+        self.root = root
+        self.handler = handler
+        self.max_batch = max_batch
+        self._wake_pending = False
+        self._dispatching = False
+        self.stats = {"wakeups": 0, "dispatched": 0, "coalesced": 0, "max_batch_ms": 0.0}
+        self._channel = None
+        self._wake_socket = None
+        try:
+            self._open_wake_connection()
+        except (OSError, tk.TclError) as e:
+            logger.warning(f"GUI wake-up connection unavailable, polling every {FALLBACK_POLL_MS} ms: {e}")
+
+    def _open_wake_connection(self):
+        tcl = self.root.tk
+        server = tcl.call("socket", "-server", self.root.register(self._accepted), "-myaddr", WAKE_HOST, 0)
+        self._server = server
+        try:
+            port = int(tcl.splitlist(tcl.call("fconfigure", server, "-sockname"))[2])
+            wake_socket = socket.create_connection((WAKE_HOST, port))
+            wake_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            wake_socket.setblocking(False)
+        except Exception:
+            tcl.call("close", server)
+            raise
+        # Accepted once the event loop runs; bytes sent until then wait in the socket
+        self._wake_socket = wake_socket
+
+    def _accepted(self, channel, host, port):
+        tcl = self.root.tk
+        tcl.call("close", self._server)
+        tcl.call("fconfigure", channel, "-blocking", 0, "-translation", "binary")
+        tcl.call("fileevent", channel, "readable", self.root.register(self._on_wake))
+        self._channel = channel
+
+    def _on_wake(self):
+        tcl = self.root.tk
+        tcl.call("read", self._channel)
+        if tcl.getboolean(tcl.call("eof", self._channel)):
+            tcl.call("close", self._channel)
+            self._channel = None
+            self._wake_socket = None
+            self.root.after(FALLBACK_POLL_MS, self._poll)
+        self.dispatch()
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        with self.mutex:
+            wake = not self._wake_pending
+            self._wake_pending = True
+        if wake:
+            self._wake()
+
+    def _wake(self):
+        wake_socket = self._wake_socket
+        if wake_socket is None:
+            return  # polling
+        try:
+            wake_socket.send(b"\x01")
+        except BlockingIOError:
+            pass  # unread bytes already wake the loop
+        except OSError:
+            # Closing down; start() or the fallback poll picks the messages up
+            with self.mutex:
+                self._wake_pending = False
+
+    def _poll(self):
+        self.dispatch()
+        self.root.after(FALLBACK_POLL_MS, self._poll)
+
+    def start(self):
+        """Handle whatever was posted before the main loop started."""
+        self.root.after_idle(self.dispatch)
+        if self._wake_socket is None:
+            self.root.after(FALLBACK_POLL_MS, self._poll)
+
+    def dispatch(self):
+        if self._dispatching:
+            # A handler opened a modal dialog whose nested loop delivered the wake-up
+            self.root.after(REENTRY_DELAY_MS, self.dispatch)
+            return
+
+        with self.mutex:
+            self._wake_pending = False
+        batch = []
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(self.get_nowait())
+            except queue.Empty:
+                break
+        if not batch:
+            return
+
+        last = {msg[0]: i for i, msg in enumerate(batch) if msg[0] in COALESCE_TYPES}
+        messages = [msg for i, msg in enumerate(batch) if msg[0] not in last or last[msg[0]] == i]
+
+        started = time.perf_counter()
+        self._dispatching = True
+        try:
+            for msg_type, data in messages:
+                try:
+                    self.handler(msg_type, data)
+                except Exception:
+                    logger.exception(f"GUI handler failed for {msg_type}")
+        finally:
+            self._dispatching = False
+
+        self.stats["wakeups"] += 1
+        self.stats["dispatched"] += len(messages)
+        self.stats["coalesced"] += len(batch) - len(messages)
+        self.stats["max_batch_ms"] = max(self.stats["max_batch_ms"], (time.perf_counter() - started) * 1000)
+
+        if not self.empty():
+            with self.mutex:
+                self._wake_pending = True
+            self.root.after(RESCHEDULE_MS, self.dispatch)
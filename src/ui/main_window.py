@@ -1,63 +1,137 @@
 import os
 import sys
-import queue
-import shutil
 import subprocess
 import threading
-import datetime
+import time
+import json
+import logging
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
 
 from src.config import AppConfig
-from src.constants import APP_NAME, VERSION, BASE_DIR, LOG_FILE, THEME_COLORS, LANG_TEXTS, CONFIG_FILE
+from src.constants import APP_NAME, VERSION, BASE_DIR, LOG_FILE, THEME_COLORS, LANG_TEXTS, CONFIG_FILE, METER_RATE_HZ
+from src.core import audio_engine, transcriber, transcription_service
 from src.core.audio_engine import AudioEngine, LoopbackNotFoundError, FFmpegRuntimeError
+from src.core.importer import ImportJob
 from src.core.transcriber import transcription_worker
+from src.core.wav_repair import repair_orphaned_recordings
+from src.core.transcript_index import backfill_index, get_index
+from src.core.catalog import reconcile_catalog
+from src.core.storage_manager import StorageManager, format_size
+from src.core.folder_watcher import FolderWatcher
 from src.ui.welcome_window import WelcomeWindow
 from src.ui.about_window import AboutWindow
 from src.ui.settings_window import SettingsWindow
+from src.ui.search_window import SearchWindow
 from src.ui.tray import TrayManager
+from src.ui.gui_queue import GuiQueue
 from src.utils import get_resource_path
+from src import startup
+
+METER_WIDTH = 440
+METER_FLOOR_DB = -60.0
+WARM_UP_DELAY_MS = 2000  # let the first frames settle before loading the heavy stacks
 
 class DashboardApp(tk.Tk):
     
     def __init__(self, config):
-        super().__init__()
-        self.cfg = config
-        
-        self.title(APP_NAME)
-        try:
-            self.iconbitmap(get_resource_path("app.ico"))
-        except Exception:
-            pass
+        # Sessions still "recording" or "transcribing" from before this launch were cut off
+        self._launched_at = time.time()
+        with startup.timer.phase("tk_init"):
+            super().__init__()
+            self.cfg = config
             
-        self.geometry("620x450")
-        self.configure(bg=THEME_COLORS["bg"])
-        self.resizable(False, False)
-        self.protocol("WM_DELETE_WINDOW", self.hide_to_tray)
+            self.title(APP_NAME)
+            try:
+                self.iconbitmap(get_resource_path("app.ico"))
+            except Exception:
+                pass
+                
+            self.geometry("620x530")
+            self.configure(bg=THEME_COLORS["bg"])
+            self.resizable(False, False)
+            self.protocol("WM_DELETE_WINDOW", self.hide_to_tray)
 
-        self.engine = AudioEngine()
+        with startup.timer.phase("AudioEngine"):
+            self.engine = AudioEngine(self.cfg)
         self.is_recording = False
+        self._meter_ticks = 0
+        self._copy_percent = None
+        self._proc_percent = None
+        self.search_window = None
+        self.storage = None
+        self.watcher = None
         
-        self.gui_queue = queue.Queue()
+        self.gui_queue = GuiQueue(self, self.handle_message)
+        self.engine.silence_callback = lambda source: self.gui_queue.put(("warn_silent", source))
+        self.engine.failover_callback = lambda devices: self.gui_queue.put(("device_changed", devices))
         
-        self.setup_ui()
+        with startup.timer.phase("setup_ui"):
+            self.setup_ui()
         
-        self.tray = TrayManager(
-            command_queue=self.gui_queue,
-            restore_callback=self.restore_from_tray,
-            exit_callback=self.quit_app,
-            config=self.cfg
-        )
-        threading.Thread(target=self.tray.run, daemon=True).start()
+        with startup.timer.phase("TrayManager"):
+            self.tray = TrayManager(
+                command_queue=self.gui_queue,
+                restore_callback=self.restore_from_tray,
+                exit_callback=self.quit_app,
+                config=self.cfg
+            )
         
+        self.after_idle(self._on_window_shown)
         self.after(500, self.check_first_run)
         
-        self.check_queue()
+        self.gui_queue.start()
+
+    def _on_window_shown(self):
+        with startup.timer.phase("first_draw"):
+            self.update_idletasks()
+        time_to_window = startup.timer.mark("window_shown")
+        
+        if startup.benchmark_mode():
+            report = startup.timer.report()
+            report.update(
+                time_to_window_ms=round(time_to_window, 1),
+                deferred_loaded=startup.loaded_deferred_modules()
+            )
+            print(f"{startup.BENCHMARK_MARKER} {json.dumps(report)}", flush=True)
+            self.after(0, self.quit_app)
+            return
+        
+        # Background work starts only once the window is on screen
+        with startup.timer.phase("tray_launch"):
+            threading.Thread(target=self.tray.run, daemon=True).start()
+        output_base = self.cfg.get("output_folder") or BASE_DIR
+        threading.Thread(target=repair_orphaned_recordings, args=(output_base,), daemon=True).start()
+        threading.Thread(target=backfill_index, args=(output_base,), daemon=True).start()
+        threading.Thread(target=reconcile_catalog, args=(output_base, self._launched_at), daemon=True).start()
+        self.storage = StorageManager(
+            self.cfg, self.engine.ffmpeg_path,
+            is_busy=lambda: self.is_recording,
+            on_report=lambda report: self.gui_queue.put(("storage_report", report))
+        ).start()
+        self.watcher = FolderWatcher(
+            self.cfg,
+            is_busy=lambda: self.is_recording,
+            on_event=lambda kind, data: self.gui_queue.put((kind, data))
+        ).start()
+        startup.timer.finish()
+        self.after(WARM_UP_DELAY_MS, lambda: threading.Thread(target=self._warm_up, daemon=True).start())
+
+    def _warm_up(self):
+        try:
+            audio_engine.warm_up()
+            transcriber.warm_up()
+        except Exception as e:
+            logging.warning(f"Background warm-up failed: {e}")
 
     def check_first_run(self):
         if self.cfg.get("first_run"):
             WelcomeWindow(self, self.cfg)
 
+    def warn_instance_unreachable(self):
+        # Commands from shortcuts and later launches cannot reach this window
+        messagebox.showwarning(self.get_text("warn_instance_title"), self.get_text("warn_instance_msg"))
+
     def get_text(self, key):
         lang = self.cfg.get("language")
         return LANG_TEXTS.get(lang, LANG_TEXTS["en_US"]).get(key, key)
@@ -109,6 +183,19 @@ class DashboardApp(tk.Tk):
         self.progress = ttk.Progressbar(main_frm, style="Synthotic.Horizontal.TProgressbar", orient="horizontal", length=520, mode="determinate")
         self.progress.pack(pady=10)
         
+        meter_frm = tk.Frame(main_frm, bg=THEME_COLORS["bg"])
+        meter_frm.pack(pady=(5, 0))
+        
+        self.meters = {}
+        for row, source in enumerate(("loopback", "mic")):
+            lbl = tk.Label(meter_frm, text="", font=("Segoe UI", 8), bg=THEME_COLORS["bg"], fg=THEME_COLORS["text_dim"], width=10, anchor="w")
+            lbl.grid(row=row, column=0, sticky="w")
+            canvas = tk.Canvas(meter_frm, width=METER_WIDTH, height=6, bg=THEME_COLORS["surface"], highlightthickness=0)
+            canvas.grid(row=row, column=1, pady=2)
+            bar = canvas.create_rectangle(0, 0, 0, 6, fill=THEME_COLORS["primary"], width=0)
+            peak = canvas.create_line(0, 0, 0, 6, fill="white")
+            self.meters[source] = (lbl, canvas, bar, peak)
+        
         btn_frm = tk.Frame(main_frm, bg=THEME_COLORS["bg"])
         btn_frm.pack(pady=30)
 
@@ -118,6 +205,18 @@ class DashboardApp(tk.Tk):
         self.btn_import = self.create_flat_button(btn_frm, "", "#3498db", self.import_file)
         self.btn_import.grid(row=0, column=1, padx=15)
         
+        search_frm = tk.Frame(main_frm, bg=THEME_COLORS["bg"])
+        search_frm.pack(fill="x")
+        
+        self.lbl_search = tk.Label(search_frm, text="", font=("Segoe UI", 9), bg=THEME_COLORS["bg"], fg=THEME_COLORS["text_dim"])
+        self.lbl_search.pack(side="left", padx=(0, 10))
+        
+        self.search_var = tk.StringVar()
+        search_entry = tk.Entry(search_frm, textvariable=self.search_var, font=("Segoe UI", 10), bg=THEME_COLORS["surface"], fg=THEME_COLORS["text"],
+                                insertbackground=THEME_COLORS["text"], bd=0, relief="flat")
+        search_entry.pack(side="left", fill="x", expand=True, ipady=4)
+        search_entry.bind("<Return>", lambda e: self.run_search())
+        
         footer_frm = tk.Frame(self, bg=THEME_COLORS["bg"])
         footer_frm.pack(side="bottom", fill="x", pady=20, padx=25)
 
@@ -143,6 +242,9 @@ class DashboardApp(tk.Tk):
         self.btn_folder.config(text=self.get_text("link_folder"))
         self.btn_about.config(text=self.get_text("tray_about").replace("ℹ️ ", ""))
         self.btn_import.config(text=self.get_text("btn_import"))
+        self.lbl_search.config(text=self.get_text("search_label"))
+        self.meters["loopback"][0].config(text=self.get_text("meter_loopback"))
+        self.meters["mic"][0].config(text=self.get_text("meter_mic"))
         
         if not self.is_recording:
             self.lbl_status.config(text=self.get_text("status_ready"))
@@ -163,6 +265,8 @@ class DashboardApp(tk.Tk):
                 self.progress['value'] = 0
                 self.refresh_ui_text()
                 self.tray.update_state("rec")
+                self.after(1000, self.update_capture_stats)
+                self.update_meters()
             except LoopbackNotFoundError:
                 response = messagebox.askyesno(
                     self.get_text("err_loopback_title"),
@@ -181,76 +285,196 @@ class DashboardApp(tk.Tk):
             self.lbl_status.config(text="Finalizando...")
             threading.Thread(target=self.async_stop_live, daemon=True).start()
 
+    def update_capture_stats(self):
+        if not self.is_recording:
+            return
+        
+        stats = self.engine.get_capture_stats()
+        if stats and stats["updated_at"]:
+            elapsed = time.strftime('%H:%M:%S', time.gmtime(stats["capture_time"]))
+            size_mb = stats["bytes_written"] / (1024 * 1024)
+            text = f"{self.get_text('sub_rec')}  {elapsed} · {size_mb:.1f} MB"
+            if abs(stats["drift"]) >= 1.0:
+                text += f" · drift {stats['drift']:+.1f}s"
+            silent = [source for source, level in self.engine.get_levels().items() if level["silent"]]
+            if silent:
+                text = self.get_text(f"warn_silent_{silent[0]}")
+            self.lbl_substatus.config(text=text)
+        
+        self.after(1000, self.update_capture_stats)
+
+    def update_meters(self):
+        levels = self.engine.get_levels() if self.is_recording else {}
+        
+        for source, (lbl, canvas, bar, peak) in self.meters.items():
+            level = levels.get(source)
+            if not level:
+                canvas.coords(bar, 0, 0, 0, 6)
+                canvas.coords(peak, 0, 0, 0, 6)
+                lbl.config(fg=THEME_COLORS["text_dim"])
+                continue
+            rms_x = self._db_to_width(level["rms_db"])
+            peak_x = self._db_to_width(level["peak_db"])
+            canvas.coords(bar, 0, 0, rms_x, 6)
+            canvas.coords(peak, peak_x, 0, peak_x, 6)
+            lbl.config(fg=THEME_COLORS["rec"] if level["silent"] else THEME_COLORS["text_dim"])
+        
+        if not self.is_recording:
+            return
+        
+        # Tray tooltip only needs ~1 Hz
+        self._meter_ticks += 1
+        if levels and self._meter_ticks % METER_RATE_HZ == 0:
+            parts = [f"{self.get_text('meter_' + source)} {level['rms_db']:.0f} dB" for source, level in levels.items()]
+            self.tray.set_tooltip(f"{APP_NAME} — " + " | ".join(parts))
+        
+        self.after(1000 // METER_RATE_HZ, self.update_meters)
+
+    def _db_to_width(self, db):
+        fraction = (db - METER_FLOOR_DB) / -METER_FLOOR_DB
+        return int(METER_WIDTH * min(1.0, max(0.0, fraction)))
+
     def async_stop_live(self):
         wav_path = self.engine.stop()
         transcription_worker(wav_path, self.gui_queue, self.cfg)
 
-    def import_file(self):
-        file_path = filedialog.askopenfilename(parent=self, filetypes=[("Audio Files", "*.wav *.mp3 *.m4a *.ogg *.flac")])
+    def import_file(self, file_path=None):
+        if file_path is None:
+            file_path = filedialog.askopenfilename(parent=self, filetypes=[("Audio Files", "*.wav *.mp3 *.m4a *.ogg *.flac")])
+        elif not os.path.isfile(file_path):
+            messagebox.showerror("Error", f"File not found: {file_path}")
+            return
         if file_path:
             self.btn_rec.config(state="disabled")
             self.btn_import.config(state="disabled")
             
-            ts = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            imp_dir = os.path.join(BASE_DIR, f"Import_{ts}")
-            os.makedirs(imp_dir, exist_ok=True)
-            dest = os.path.join(imp_dir, os.path.basename(file_path))
+            output_base = self.cfg.get("output_folder") or BASE_DIR
+            job = ImportJob(
+                file_path, output_base, self.cfg.get("import_mode") or "auto",
+                on_progress=lambda percent: self.gui_queue.put(("copy_progress", percent)),
+                on_done=lambda error: self.gui_queue.put(("copy_done", error))
+            )
+            try:
+                job.start()
+            except OSError as e:
+                messagebox.showerror("Error", str(e))
+                self.reset_ui()
+                return
             
-            self.lbl_status.config(text="Copiando arquivo...")
-            self.update()
-            shutil.copy2(file_path, dest)
-            threading.Thread(target=transcription_worker, args=(dest, self.gui_queue, self.cfg, True), daemon=True).start()
+            # Transcription reads the original, so it does not wait for the copy
+            self.progress['value'] = 0
+            self._proc_percent = None
+            self._copy_percent = 0.0 if job.is_copying else None
+            threading.Thread(
+                target=transcription_worker,
+                args=(job.transcribe_path, self.gui_queue, self.cfg, True, job.txt_path),
+                daemon=True
+            ).start()
 
-    def check_queue(self):
+    def run_search(self):
+        query = self.search_var.get().strip()
+        if query:
+            threading.Thread(target=self._search_worker, args=(query,), daemon=True).start()
+
+    def _search_worker(self, query):
+        started = time.perf_counter()
         try:
-            while True:
-                msg_type, data = self.gui_queue.get_nowait()
-                
-                if msg_type == "cmd_start":
-                    if not self.is_recording: self.toggle_recording()
-                elif msg_type == "cmd_stop":
-                    if self.is_recording: self.toggle_recording()
-                elif msg_type == "cmd_import":
-                    if not self.is_recording: 
-                        self.deiconify()
-                        self.import_file()
-                elif msg_type == "cmd_about":
-                    self.deiconify()
-                    self.open_about()
-                
-                elif msg_type == "status_proc":
-                    self.lbl_status.config(text=self.get_text("status_proc"))
-                    self.lbl_substatus.config(text=self.get_text("sub_proc"))
-                    self.tray.update_state("proc")
-                    
-                elif msg_type == "progress":
-                    self.progress['value'] = data
-                    self.lbl_substatus.config(text=f"{self.get_text('sub_proc')} {data:.1f}%")
-                    
-                elif msg_type == "done":
-                    self.lbl_status.config(text=self.get_text("status_done"))
-                    self.lbl_substatus.config(text=self.get_text("sub_done"))
-                    self.progress['value'] = 100
-                    self.reset_ui()
-                    self.tray.update_state("idle")
-                    try:
-                        os.startfile(data)
-                        os.startfile(os.path.dirname(data))
-                    except Exception: pass
-                    self.deiconify()
-                    self.lift()
-                    
-                elif msg_type == "error":
-                    self.lbl_status.config(text=self.get_text("status_err"))
-                    messagebox.showerror("Error", str(data))
-                    self.reset_ui()
-                    self.tray.update_state("idle")
-                    
-        except queue.Empty: pass
-        finally: self.after(100, self.check_queue)
+            hits = get_index().search(query)
+        except Exception as e:
+            logging.warning(f"Transcript search failed: {e}")
+            hits = []
+        self.gui_queue.put(("search_results", (query, hits, (time.perf_counter() - started) * 1000)))
+
+    def _proc_substatus(self, percent=None):
+        text = self.get_text("sub_proc")
+        if percent is not None:
+            text += f" {percent:.1f}%"
+        if self._copy_percent is not None:
+            text += f" · {self.get_text('import_copying')} {self._copy_percent:.0f}%"
+        return text
+
+    def handle_message(self, msg_type, data):
+        if msg_type == "cmd_start":
+            if not self.is_recording: self.toggle_recording()
+        elif msg_type == "cmd_stop":
+            if self.is_recording: self.toggle_recording()
+        elif msg_type == "cmd_import":
+            # data: a path forwarded from another launch, None to ask for one
+            if not self.is_recording and str(self.btn_import["state"]) == "normal":
+                self.deiconify()
+                self.import_file(data)
+        elif msg_type == "cmd_show":
+            self.restore_from_tray()
+        elif msg_type == "cmd_about":
+            self.deiconify()
+            self.open_about()
+        
+        elif msg_type == "search_results":
+            if self.search_window is None or not self.search_window.winfo_exists():
+                self.search_window = SearchWindow(self, self.cfg)
+            self.search_window.show_results(*data)
+        
+        elif msg_type == "storage_report":
+            self.tray.notify(APP_NAME, self.get_text("storage_reclaimed").format(size=format_size(data["reclaimed"])))
+        
+        elif msg_type in ("watch_done", "watch_failed"):
+            self.tray.notify(APP_NAME, self.get_text(msg_type).format(name=os.path.basename(data["source"])))
+        
+        elif msg_type == "warn_silent":
+            if self.is_recording:
+                message = self.get_text(f"warn_silent_{data}")
+                self.lbl_substatus.config(text=message)
+                self.tray.notify(self.get_text("warn_silent_title"), message)
+        
+        elif msg_type == "device_changed":
+            if self.is_recording:
+                message = self.get_text("warn_device_switch" if data else "warn_device_lost")
+                self.lbl_substatus.config(text=message)
+                self.tray.notify(self.get_text("warn_device_title"), message)
+        
+        elif msg_type == "status_proc":
+            self.lbl_status.config(text=self.get_text("status_proc"))
+            self.lbl_substatus.config(text=self._proc_substatus())
+            self.tray.update_state("proc")
+            
+        elif msg_type == "progress":
+            self.progress['value'] = data
+            self._proc_percent = data
+            self.lbl_substatus.config(text=self._proc_substatus(data))
+        
+        elif msg_type == "copy_progress":
+            if self._copy_percent is not None:
+                self._copy_percent = data
+                if self.progress['value'] < 100:
+                    self.lbl_substatus.config(text=self._proc_substatus(self._proc_percent))
+        
+        elif msg_type == "copy_done":
+            self._copy_percent = None
+            if data:
+                self.tray.notify(APP_NAME, self.get_text("import_copy_failed"))
+            
+        elif msg_type == "done":
+            self.lbl_status.config(text=self.get_text("status_done"))
+            self.lbl_substatus.config(text=self.get_text("sub_done"))
+            self.progress['value'] = 100
+            self.reset_ui()
+            self.tray.update_state("idle")
+            try:
+                os.startfile(data)
+                os.startfile(os.path.dirname(data))
+            except Exception: pass
+            self.deiconify()
+            self.lift()
+            
+        elif msg_type == "error":
+            self.lbl_status.config(text=self.get_text("status_err"))
+            messagebox.showerror("Error", str(data))
+            self.reset_ui()
+            self.tray.update_state("idle")
 
     def reset_ui(self):
         self.is_recording = False
+        self.tray.set_tooltip(f"{APP_NAME} {VERSION}")
         self.btn_rec.config(state="normal")
         self.btn_import.config(state="normal")
         self.refresh_ui_text()
@@ -264,6 +488,11 @@ class DashboardApp(tk.Tk):
         self.lift()
 
     def quit_app(self, icon=None, item=None):
+        if self.storage:
+            self.storage.stop()
+        if self.watcher:
+            self.watcher.stop()
+        transcription_service.shutdown()
         self.tray.stop()
         self.quit()
 
@@ -39,7 +39,7 @@ class OnboardingWizard(tk.Toplevel):
         self.selected_lang = tk.StringVar(value=self.cfg.get("language") or "pt_BR")
         
         # Audio engine
-        self.engine = AudioEngine()
+        self.engine = AudioEngine(self.cfg)
         self.devices_list = []
         
         self.pages = []
@@ -613,28 +613,30 @@ class OnboardingWizard(tk.Toplevel):
         if not self.validate_current_page():
             return
         
-        # Save folder
-        output_folder = self.selected_folder.get()
-        if output_folder != BASE_DIR:
-            self.cfg.set("output_folder", output_folder)
-            os.makedirs(output_folder, exist_ok=True)
-        
-        # Save device GUIDs
-        for d in self.devices_list:
-            if d["friendly_name"] == self.selected_loopback.get():
-                self.cfg.set("loopback_device_guid", d["alternative_name"])
-                break
-        
-        for d in self.devices_list:
-            if d["friendly_name"] == self.selected_mic.get():
-                self.cfg.set("mic_device_guid", d["alternative_name"])
-                break
-        
-        # Save language
-        self.cfg.set("language", self.selected_lang.get())
-        
-        # Mark complete
-        self.cfg.set("first_run", False)
+        # One write for the whole wizard
+        with self.cfg.batch():
+            # Save folder
+            output_folder = self.selected_folder.get()
+            if output_folder != BASE_DIR:
+                self.cfg.set("output_folder", output_folder)
+                os.makedirs(output_folder, exist_ok=True)
+        
+            # Save device GUIDs
+            for d in self.devices_list:
+                if d["friendly_name"] == self.selected_loopback.get():
+                    self.cfg.set("loopback_device_guid", d["alternative_name"])
+                    break
+        
+            for d in self.devices_list:
+                if d["friendly_name"] == self.selected_mic.get():
+                    self.cfg.set("mic_device_guid", d["alternative_name"])
+                    break
+        
+            # Save language
+            self.cfg.set("language", self.selected_lang.get())
+        
+            # Mark complete
+            self.cfg.set("first_run", False)
         
         # Close
         self.grab_release()
@@ -0,0 +1,76 @@
+import tkinter as tk
+from src.constants import THEME_COLORS, LANG_TEXTS, PERF_LOG_FILE
+from src import logs
+from src.core import perf
+from src.utils import get_resource_path
+
+RECENT_LOG_LINES = 40
+
+class PerfReportWindow(tk.Toplevel):
+    """Percentiles of the recent jobs in perf.jsonl and the last log lines."""
+
+    def __init__(self, parent, config):
+        super().__init__(parent)
+        self.parent = parent
+        self.cfg = config
+        self.title(self.get_text("perf_title"))
+        try:
+            self.iconbitmap(get_resource_path("app.ico"))
+        except Exception:
+            pass
+
+        self.geometry("600x420")
+        self.configure(bg=THEME_COLORS["bg"])
+        self.transient(parent)
+        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.setup_ui()
+
+    def get_text(self, key):
+        lang = self.cfg.get("language")
+        return LANG_TEXTS.get(lang, LANG_TEXTS["en_US"]).get(key, key)
+
+    def setup_ui(self):
+        text = tk.Text(self, font=("Consolas", 9), bg=THEME_COLORS["surface"], fg=THEME_COLORS["text"],
+                       bd=0, highlightthickness=0, padx=15, pady=10, wrap="none")
+        text.pack(fill="both", expand=True, padx=15, pady=(15, 10))
+        text.insert("end", self.build_report())
+        text.config(state="disabled")
+
+        tk.Button(self, text="OK", font=("Segoe UI", 10, "bold"), bg=THEME_COLORS["surface"], fg="white",
+                  width=15, bd=0, relief="flat", cursor="hand2", command=self.close).pack(pady=(0, 15))
+
+    def build_report(self):
+        lines = []
+        for kind, fields in perf.REPORT_FIELDS.items():
+            records = perf.load_records(kind)
+            lines.append(self.get_text(f"perf_{kind}").format(count=len(records)))
+            summary = perf.summarize([r for r in records if r.get("status", "done") == "done"], fields)
+            if not summary:
+                lines.append(f"  {self.get_text('perf_no_data')}\n")
+                continue
+            lines.append(f"  {'':<18}{'p50':>10}{'p90':>10}{'max':>10}")
+            for field, stats in summary.items():
+                lines.append(f"  {field:<18}{stats['p50']:>10.2f}{stats['p90']:>10.2f}{stats['max']:>10.2f}")
+            failed = sum(1 for r in records if r.get("status") == "failed")
+            if failed:
+                lines.append(f"  {self.get_text('perf_failed').format(count=failed)}")
+            lines.append("")
+
+        cpu = next((r["cpu"] for r in reversed(perf.load_records()) if r.get("cpu")), perf.cpu_model())
+        lines.append(f"CPU: {cpu}")
+        lines.append(PERF_LOG_FILE)
+
+        recent = logs.recent_lines(RECENT_LOG_LINES)
+        if recent:
+            lines.append("")
+            lines.append(self.get_text("perf_recent_log"))
+            lines.extend(recent)
+        return "\n".join(lines)
+
+    def close(self):
+        self.destroy()
+        # The About window is modal too
+        if self.parent.winfo_exists():
+            self.parent.grab_set()
@@ -0,0 +1,71 @@
+import os
+import tkinter as tk
+from src.constants import THEME_COLORS, LANG_TEXTS
+from src.core.transcript_index import format_offset
+from src.utils import get_resource_path
+
+class SearchWindow(tk.Toplevel):
+    """Transcript search hits; double-click opens the transcript."""
+
+    def __init__(self, parent, config):
+        super().__init__(parent)
+        self.cfg = config
+        self.hits = []
+        try:
+            self.iconbitmap(get_resource_path("app.ico"))
+        except Exception:
+            pass
+
+        self.geometry("700x400")
+        self.configure(bg=THEME_COLORS["bg"])
+        self.transient(parent)
+
+        self.setup_ui()
+
+    def get_text(self, key):
+        lang = self.cfg.get("language")
+        return LANG_TEXTS.get(lang, LANG_TEXTS["en_US"]).get(key, key)
+
+    def setup_ui(self):
+        self.lbl_summary = tk.Label(self, text="", font=("Segoe UI", 9), bg=THEME_COLORS["bg"], fg=THEME_COLORS["text_dim"], anchor="w")
+        self.lbl_summary.pack(fill="x", padx=15, pady=(10, 5))
+
+        list_frm = tk.Frame(self, bg=THEME_COLORS["bg"])
+        list_frm.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+
+        scrollbar = tk.Scrollbar(list_frm)
+        scrollbar.pack(side="right", fill="y")
+
+        self.listbox = tk.Listbox(
+            list_frm, font=("Consolas", 9), bg=THEME_COLORS["surface"], fg=THEME_COLORS["text"],
+            selectbackground=THEME_COLORS["secondary"], selectforeground="white",
+            bd=0, highlightthickness=0, activestyle="none", yscrollcommand=scrollbar.set
+        )
+        self.listbox.pack(side="left", fill="both", expand=True)
+        scrollbar.config(command=self.listbox.yview)
+
+        self.listbox.bind("<Double-Button-1>", self.open_selected)
+        self.listbox.bind("<Return>", self.open_selected)
+
+    def show_results(self, query, hits, elapsed_ms):
+        self.hits = hits
+        self.title(f"{self.get_text('search_title')}: {query}")
+        self.lbl_summary.config(text=self.get_text("search_summary").format(count=len(hits), ms=elapsed_ms))
+
+        self.listbox.delete(0, "end")
+        for hit in hits:
+            snippet = " ".join(hit["snippet"].split())
+            self.listbox.insert("end", f"{hit['folder']}  [{format_offset(hit['offset'])}]  {snippet}")
+        if not hits:
+            self.listbox.insert("end", self.get_text("search_no_results"))
+
+        self.deiconify()
+        self.lift()
+
+    def open_selected(self, event=None):
+        selection = self.listbox.curselection()
+        if not selection or selection[0] >= len(self.hits):
+            return
+        try:
+            os.startfile(self.hits[selection[0]]["path"])
+        except Exception: pass
@@ -3,8 +3,9 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
 
-from src.constants import THEME_COLORS, BASE_DIR
+from src.constants import THEME_COLORS, BASE_DIR, PROFILES_DIR
 from src.core.audio_engine import AudioEngine
+from src.core.importer import IMPORT_MODES
 
 
 class SettingsWindow(tk.Toplevel):
@@ -209,6 +210,163 @@ class SettingsWindow(tk.Toplevel):
         )
         browse_btn.pack(side="left")
         
+        tk.Label(
+            folder_inner,
+            text=self.get_text("settings_import_label"),
+            bg=THEME_COLORS["surface"],
+            fg=THEME_COLORS["text"],
+            font=("Segoe UI", 9)
+        ).pack(anchor="w", pady=(12, 5))
+        
+        self.import_modes = {self.get_text(f"import_mode_{mode}"): mode for mode in IMPORT_MODES}
+        self.import_mode_var = tk.StringVar()
+        ttk.Combobox(
+            folder_inner,
+            textvariable=self.import_mode_var,
+            values=list(self.import_modes),
+            state="readonly",
+            width=45,
+            font=("Segoe UI", 9)
+        ).pack(anchor="w")
+        
+        # === STORAGE SECTION ===
+        storage_section = tk.LabelFrame(
+            main_frame,
+            text=self.get_text("settings_storage"),
+            font=("Segoe UI", 10, "bold"),
+            bg=THEME_COLORS["surface"],
+            fg="#888888",
+            bd=1,
+            relief="solid"
+        )
+        storage_section.pack(fill="x", pady=(0, 15))
+        
+        storage_inner = tk.Frame(storage_section, bg=THEME_COLORS["surface"])
+        storage_inner.pack(padx=15, pady=15, fill="x")
+        
+        self.storage_vars = {}
+        for row, (key, limit) in enumerate((
+            ("storage_transcode_days", 3650),
+            ("storage_delete_days", 3650),
+            ("storage_max_gb", 10000)
+        )):
+            tk.Label(
+                storage_inner,
+                text=self.get_text(f"settings_{key[len('storage_'):]}"),
+                bg=THEME_COLORS["surface"],
+                fg=THEME_COLORS["text"],
+                font=("Segoe UI", 9)
+            ).grid(row=row, column=0, sticky="w", pady=3)
+            
+            var = tk.StringVar()
+            tk.Spinbox(
+                storage_inner,
+                from_=0,
+                to=limit,
+                textvariable=var,
+                width=6,
+                bg=THEME_COLORS["secondary"],
+                fg=THEME_COLORS["text"],
+                buttonbackground=THEME_COLORS["secondary"],
+                font=("Segoe UI", 9),
+                bd=1,
+                relief="solid"
+            ).grid(row=row, column=1, sticky="e", padx=(10, 0), pady=3)
+            self.storage_vars[key] = var
+        storage_inner.columnconfigure(0, weight=1)
+        
+        # === WATCH FOLDERS SECTION ===
+        watch_section = tk.LabelFrame(
+            main_frame,
+            text=self.get_text("settings_watch"),
+            font=("Segoe UI", 10, "bold"),
+            bg=THEME_COLORS["surface"],
+            fg="#888888",
+            bd=1,
+            relief="solid"
+        )
+        watch_section.pack(fill="x", pady=(0, 15))
+        
+        watch_inner = tk.Frame(watch_section, bg=THEME_COLORS["surface"])
+        watch_inner.pack(padx=15, pady=15, fill="x")
+        
+        tk.Label(
+            watch_inner,
+            text=self.get_text("settings_watch_label"),
+            bg=THEME_COLORS["surface"],
+            fg=THEME_COLORS["text"],
+            font=("Segoe UI", 9),
+            justify="left",
+            wraplength=520
+        ).pack(anchor="w", pady=(0, 5))
+        
+        self.watch_list = tk.Listbox(
+            watch_inner,
+            height=3,
+            bg=THEME_COLORS["secondary"],
+            fg=THEME_COLORS["text"],
+            font=("Segoe UI", 9),
+            bd=1,
+            relief="solid",
+            activestyle="none"
+        )
+        self.watch_list.pack(fill="x")
+        
+        watch_buttons = tk.Frame(watch_inner, bg=THEME_COLORS["surface"])
+        watch_buttons.pack(anchor="w", pady=(5, 0))
+        for text_key, command in (("settings_watch_add", self.add_watch_folder), ("settings_watch_remove", self.remove_watch_folder)):
+            tk.Button(
+                watch_buttons,
+                text=self.get_text(text_key),
+                command=command,
+                bg="#555555",
+                fg="white",
+                font=("Segoe UI", 9, "bold"),
+                cursor="hand2",
+                bd=0,
+                padx=12,
+                pady=4
+            ).pack(side="left", padx=(0, 10))
+        
+        # === DIAGNOSTICS SECTION ===
+        diag_section = tk.LabelFrame(
+            main_frame,
+            text=self.get_text("settings_diagnostics"),
+            font=("Segoe UI", 10, "bold"),
+            bg=THEME_COLORS["surface"],
+            fg="#888888",
+            bd=1,
+            relief="solid"
+        )
+        diag_section.pack(fill="x", pady=(0, 15))
+        
+        diag_inner = tk.Frame(diag_section, bg=THEME_COLORS["surface"])
+        diag_inner.pack(padx=15, pady=15, fill="x")
+        
+        self.profiling_var = tk.BooleanVar()
+        tk.Checkbutton(
+            diag_inner,
+            text=self.get_text("settings_profiling"),
+            variable=self.profiling_var,
+            bg=THEME_COLORS["surface"],
+            fg=THEME_COLORS["text"],
+            selectcolor=THEME_COLORS["secondary"],
+            activebackground=THEME_COLORS["surface"],
+            activeforeground=THEME_COLORS["text"],
+            font=("Segoe UI", 9),
+            bd=0
+        ).pack(anchor="w")
+        
+        tk.Label(
+            diag_inner,
+            text=self.get_text("settings_profiling_label").format(folder=PROFILES_DIR),
+            bg=THEME_COLORS["surface"],
+            fg=THEME_COLORS["text_dim"],
+            font=("Segoe UI", 8),
+            justify="left",
+            wraplength=520
+        ).pack(anchor="w", pady=(5, 0))
+        
         # === LANGUAGE SECTION ===
         lang_section = tk.LabelFrame(
             main_frame,
@@ -291,6 +449,23 @@ class SettingsWindow(tk.Toplevel):
         current_folder = self.cfg.get("output_folder") or BASE_DIR
         self.folder_var.set(current_folder)
         
+        # Load import mode
+        mode = self.cfg.get("import_mode") or "auto"
+        self.import_mode_var.set(self.get_text(f"import_mode_{mode}"))
+        
+        for key, var in self.storage_vars.items():
+            var.set(str(self.cfg.get(key) or 0))
+        
+        self.profiling_var.set(bool(self.cfg.get("profiling_enabled")))
+        
+        # Entries keep any per-folder settings (concurrency) made in config.json
+        self.watch_folders = [
+            entry if isinstance(entry, dict) else {"path": entry}
+            for entry in self.cfg.get("watch_folders") or []
+        ]
+        for entry in self.watch_folders:
+            self.watch_list.insert("end", entry["path"])
+        
         # Load language
         self.lang_var.set(self.cfg.get("language") or "pt_BR")
         
@@ -372,42 +547,69 @@ class SettingsWindow(tk.Toplevel):
         if folder:
             self.folder_var.set(folder)
     
+    def add_watch_folder(self):
+        folder = filedialog.askdirectory(parent=self, title=self.get_text("settings_watch_add"))
+        if folder and all(os.path.normcase(entry["path"]) != os.path.normcase(folder) for entry in self.watch_folders):
+            self.watch_folders.append({"path": folder, "concurrency": 1})
+            self.watch_list.insert("end", folder)
+    
+    def remove_watch_folder(self):
+        for index in reversed(self.watch_list.curselection()):
+            self.watch_list.delete(index)
+            del self.watch_folders[index]
+    
     def on_save(self):
-        # Save folder
-        output_folder = self.folder_var.get()
-        if output_folder and output_folder != BASE_DIR:
-            self.cfg.set("output_folder", output_folder)
-            os.makedirs(output_folder, exist_ok=True)
-        else:
-            self.cfg.set("output_folder", None)
-        
-        # Save language
-        old_lang = self.cfg.get("language")
-        new_lang = self.lang_var.get()
-        if old_lang != new_lang:
-            self.cfg.set("language", new_lang)
-            self.parent.refresh_ui_text()
-        
-        # Save audio devices
-        auto_option = self.get_text("settings_auto_detect")
-        
-        loopback_selection = self.loopback_var.get()
-        if loopback_selection and loopback_selection != auto_option:
-            for d in self.devices_list:
-                if d["friendly_name"] == loopback_selection:
-                    self.cfg.set("loopback_device_guid", d["alternative_name"])
-                    break
-        else:
-            self.cfg.set("loopback_device_guid", None)
-        
-        mic_selection = self.mic_var.get()
-        if mic_selection and mic_selection != auto_option:
-            for d in self.devices_list:
-                if d["friendly_name"] == mic_selection:
-                    self.cfg.set("mic_device_guid", d["alternative_name"])
-                    break
-        else:
-            self.cfg.set("mic_device_guid", None)
+        # One write for the whole form
+        with self.cfg.batch():
+            # Save folder
+            output_folder = self.folder_var.get()
+            if output_folder and output_folder != BASE_DIR:
+                self.cfg.set("output_folder", output_folder)
+                os.makedirs(output_folder, exist_ok=True)
+            else:
+                self.cfg.set("output_folder", None)
+        
+            # Save import mode
+            self.cfg.set("import_mode", self.import_modes.get(self.import_mode_var.get(), "auto"))
+        
+            # Save storage policies; anything unreadable turns the policy off
+            for key, var in self.storage_vars.items():
+                try:
+                    value = max(0, float(var.get()))
+                except ValueError:
+                    value = 0
+                self.cfg.set(key, int(value) if value.is_integer() else value)
+        
+            self.cfg.set("watch_folders", self.watch_folders)
+            self.cfg.set("profiling_enabled", self.profiling_var.get())
+        
+            # Save language
+            old_lang = self.cfg.get("language")
+            new_lang = self.lang_var.get()
+            if old_lang != new_lang:
+                self.cfg.set("language", new_lang)
+                self.parent.refresh_ui_text()
+        
+            # Save audio devices
+            auto_option = self.get_text("settings_auto_detect")
+        
+            loopback_selection = self.loopback_var.get()
+            if loopback_selection and loopback_selection != auto_option:
+                for d in self.devices_list:
+                    if d["friendly_name"] == loopback_selection:
+                        self.cfg.set("loopback_device_guid", d["alternative_name"])
+                        break
+            else:
+                self.cfg.set("loopback_device_guid", None)
+        
+            mic_selection = self.mic_var.get()
+            if mic_selection and mic_selection != auto_option:
+                for d in self.devices_list:
+                    if d["friendly_name"] == mic_selection:
+                        self.cfg.set("mic_device_guid", d["alternative_name"])
+                        break
+            else:
+                self.cfg.set("mic_device_guid", None)
         
         # Show confirmation
         messagebox.showinfo(
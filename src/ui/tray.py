@@ -1,64 +1,166 @@
 import os
 import queue
 import logging
-from PIL import Image, ImageDraw
-
-try:
-    import pystray
-except ImportError:
-    pystray = None
+import threading
 
 from src.constants import LANG_TEXTS, BASE_DIR, LOG_FILE, VERSION
 from src.utils import get_resource_path
 
 logger = logging.getLogger(__name__)
 
+# Pillow and pystray are imported by the tray thread, after the main window is up
+pystray = None
+Image = ImageDraw = None
+
+def _load_backend():
+    global pystray, Image, ImageDraw
+    if pystray is None:
+        from PIL import Image as _Image, ImageDraw as _ImageDraw
+        Image, ImageDraw = _Image, _ImageDraw
+        import pystray as _pystray
+        pystray = _pystray
+
+# Tint applied to app.ico per state, and the plain colours used when it cannot be loaded
+ICON_STATES = ("idle", "rec", "proc")
+STATE_TINTS = {"rec": (255, 82, 82, 100), "proc": (0, 230, 118, 100)}
+FALLBACK_COLORS = {"idle": "#333333", "rec": "#FF5252", "proc": "#00E676"}
+UPDATE_IDLE_CHECK = 5.0  # seconds
+
 class TrayManager:
+    """
+    System tray icon. pystray runs its loop on the thread that calls run(); every
+    change after that (icon, menu, tooltip, notifications) is queued by the caller
+    and applied on the icon's setup thread, so callers never block on the shell.
+    The three state images are rendered once, and the menu is only rebuilt when
+    its structure (recording or not, language) changes.
+    """
     
     def __init__(self, command_queue, restore_callback, exit_callback, config):
-        if pystray is None:
-            raise ImportError("pystray not installed")
-
         self.queue = command_queue
         self.restore_callback = restore_callback
         self.exit_callback = exit_callback
         self.cfg = config
         self.icon = None
         self.is_recording = False
+        self._state = "idle"
+        self._title = f"Synthotic {VERSION}"
+        self._images = {}
+        self._menus = {}
+        self._menu_key = None
+        self._updates = queue.Queue()
+        self._running = False
+        config.subscribe(self._on_config_changed, keys=("language",))
         
     def get_text(self, key):
         lang = self.cfg.get("language")
         return LANG_TEXTS.get(lang, LANG_TEXTS["en_US"]).get(key, key)
 
     def run(self):
-        image = self.create_image("idle")
-        self.icon = pystray.Icon("Synthotic", image, f"Synthotic {VERSION}", self.create_menu())
-        self.icon.run()
+        try:
+            _load_backend()
+        except Exception as e:
+            # ImportError, or no tray backend for this desktop session
+            logger.error(f"System tray unavailable: {e}")
+            return
+        self._images = self.create_images()
+        self._menu_key = self._current_menu_key()
+        self.icon = pystray.Icon("Synthotic", self._images[self._state], self._title, self._menu_for(self._menu_key))
+        self._running = True
+        self.icon.run(setup=self._apply_updates)
 
     def stop(self):
-        if self.icon:
-            self.icon.stop()
+        if self._running:
+            self._post("stop", None)
 
     def update_state(self, state):
         if state == "rec":
             self.is_recording = True
         elif state == "idle":
             self.is_recording = False
-            
-        if self.icon:
-            self.icon.icon = self.create_image(state)
-            self.icon.menu = self.create_menu()
+        self._state = state
+        self._post("state", state)
+
+    def _on_config_changed(self, changes):
+        # Menu labels follow the language; the key check below rebuilds it
+        self._post("menu", None)
+
+    def set_tooltip(self, text):
+        self._title = text
+        self._post("title", text)
 
     def notify(self, title, message):
-        if self.icon:
-            self.icon.notify(message, title)
+        self._post("notify", (title, message))
+
+    def _post(self, kind, data):
+        # Before the icon exists the latest state and title are picked up by run()
+        if self._running:
+            self._updates.put((kind, data))
+
+    def _apply_updates(self, icon):
+        icon.visible = True
+        while True:
+            try:
+                updates = [self._updates.get(timeout=UPDATE_IDLE_CHECK)]
+            except queue.Empty:
+                # The app died without calling stop(): don't keep the process alive
+                if not threading.main_thread().is_alive():
+                    icon.stop()
+                    return
+                continue
+            while not self._updates.empty():
+                updates.append(self._updates.get_nowait())
+            if not self._apply(icon, updates):
+                return
 
-    def create_menu(self):
+    def _apply(self, icon, updates):
+        """Apply a burst of queued updates; returns False once the icon is stopped."""
+        # Only the last icon and title of a burst are worth sending to the shell
+        state = title = None
+        for kind, data in updates:
+            if kind == "stop":
+                self._running = False
+                icon.stop()
+                return False
+            if kind == "state":
+                state = data
+            elif kind == "title":
+                title = data
+            elif kind == "notify":
+                self._safe_call(icon.notify, data[1], data[0])
+        
+        if state is not None:
+            self._safe_call(setattr, icon, "icon", self._images.get(state) or self._images["idle"])
+        if title is not None and title != icon.title:
+            self._safe_call(setattr, icon, "title", title)
+        
+        menu_key = self._current_menu_key()
+        if menu_key != self._menu_key:
+            self._menu_key = menu_key
+            self._safe_call(setattr, icon, "menu", self._menu_for(menu_key))
+        return True
+
+    def _safe_call(self, func, *args):
+        try:
+            func(*args)
+        except Exception as e:
+            logger.debug(f"Tray update failed: {e}")
+
+    def _current_menu_key(self):
+        return self.is_recording, self.cfg.get("language")
+
+    def _menu_for(self, key):
+        if key not in self._menus:
+            self._menus[key] = self.create_menu(recording=key[0])
+        return self._menus[key]
+
+    def create_menu(self, recording=None):
+        if recording is None:
+            recording = self.is_recording
         items = []
         items.append(pystray.MenuItem(self.get_text("tray_open"), self.restore_callback, default=True))
         items.append(pystray.Menu.SEPARATOR)
         
-        if not self.is_recording:
+        if not recording:
             items.append(pystray.MenuItem(self.get_text("tray_start"), lambda icon, item: self.queue.put(("cmd_start", None))))
             items.append(pystray.MenuItem(self.get_text("tray_import"), lambda icon, item: self.queue.put(("cmd_import", None))))
         else:
@@ -73,7 +175,11 @@ class TrayManager:
         
         return pystray.Menu(*items)
 
-    def create_image(self, state):
+    def create_images(self):
+        base = self._load_app_icon()
+        return {state: self.create_image(state, base) for state in ICON_STATES}
+
+    def _load_app_icon(self):
         # Try to load app.ico for professional appearance
         try:
             icon_path = get_resource_path("app.ico")
@@ -82,30 +188,22 @@ class TrayManager:
                 # Resize to appropriate tray icon size if needed
                 if img.size != (64, 64):
                     img = img.resize((64, 64), Image.Resampling.LANCZOS)
-                
-                # For recording state, add a red overlay/tint
-                if state == "rec":
-                    overlay = Image.new('RGBA', img.size, (255, 82, 82, 100))
-                    if img.mode != 'RGBA':
-                        img = img.convert('RGBA')
-                    img = Image.alpha_composite(img, overlay)
-                # For processing state, add a green overlay/tint
-                elif state == "proc":
-                    overlay = Image.new('RGBA', img.size, (0, 230, 118, 100))
-                    if img.mode != 'RGBA':
-                        img = img.convert('RGBA')
-                    img = Image.alpha_composite(img, overlay)
-                
-                return img.convert('RGB')
+                return img.convert('RGBA')
         except Exception as e:
             logger.debug(f"Could not load app.ico, using fallback: {e}")
+        return None
+
+    def create_image(self, state, base=None):
+        if base is not None:
+            img = base
+            # Red overlay while recording, green while processing
+            if state in STATE_TINTS:
+                overlay = Image.new('RGBA', base.size, STATE_TINTS[state])
+                img = Image.alpha_composite(base, overlay)
+            return img.convert('RGB')
         
         # Fallback: draw a simple circle (original behavior)
-        color = "#333333"
-        if state == "rec": color = "#FF5252"
-        elif state == "proc": color = "#00E676"
-        
-        img = Image.new('RGB', (64, 64), color)
+        img = Image.new('RGB', (64, 64), FALLBACK_COLORS.get(state, FALLBACK_COLORS["idle"]))
         draw = ImageDraw.Draw(img)
         draw.ellipse((16, 16, 48, 48), fill="white")
         return img
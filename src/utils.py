@@ -1,17 +1,13 @@
-import logging
 import sys
 import os
+import atexit
+from src import logs
 from src.constants import LOG_FILE
 
 def setup_logging():
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        handlers=[
-            logging.FileHandler(LOG_FILE, encoding='utf-8', mode='a'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # Log calls only enqueue; a writer thread formats, writes, rotates and compresses
+    logs.start(LOG_FILE, stream=sys.stdout)
+    atexit.register(logs.stop)
 
 def get_resource_path(relative_path):
     # Handles PyInstaller frozen builds
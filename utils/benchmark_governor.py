@@ -0,0 +1,250 @@
+"""
+Synthotic - Resource Governor Benchmark
+
+Checks that a live capture keeps up while a transcription-like CPU load runs
+next to it. The capture is the in-process backend fed by a synthetic stream (no
+devices needed). The load runs "segments" of matrix products on a thread pool,
+the way CTranslate2 decodes: first as the transcriber used to (cores/2 threads,
+normal priority, no pauses), then governed (thread count from the governor,
+below normal priority, paced between segments), once started during the
+recording and once started before it.
+
+A probe thread at normal priority wakes every 5 ms, like a capture or call
+client would; how late it wakes is what a starved audio thread feels.
+
+Before the timed runs, check_governor() asserts the governor's decisions
+against a scripted CPU load (no real load or sleeping involved); a failure
+exits non-zero.
+
+Usage:
+    python utils/benchmark_governor.py
+    python utils/benchmark_governor.py --seconds 20 --size 768
+    python utils/benchmark_governor.py --check-only
+"""
+
+import os
+import sys
+
+# One BLAS thread per caller, so the pool below decides how many cores the load uses
+for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(var, "1")
+
+import time
+import argparse
+import tempfile
+import threading
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Setup paths
+script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, script_dir)
+
+from src.core import resource_governor
+from src.core.capture_sources import create_test_source
+from src.core.resource_governor import BUSY_LOAD, IDLE_LOAD, MAX_PAUSE, ResourceGovernor, lower_worker_priority
+
+SEGMENT_PRODUCTS = 4  # matrix products per thread per segment
+PROBE_INTERVAL = 0.005
+
+
+class ScriptedSampler:
+    """Stands in for CpuSampler: reports whatever load the check sets."""
+
+    def __init__(self):
+        self.load = 0.0
+
+    def other_load(self, fresh=False):
+        return self.load
+
+
+def check_governor():
+    """Assert thread counts and pacing for each recording/load state; raises AssertionError."""
+    sampler = ScriptedSampler()
+    governor = ResourceGovernor(cpu_count=8, sampler=sampler)
+    slept = []
+    real_time = resource_governor.time
+    # pace() sleeps for real; record the pauses instead
+    resource_governor.time = SimpleNamespace(sleep=slept.append, monotonic=real_time.monotonic)
+    try:
+        assert governor.full_threads() == 4
+        assert governor.thread_count() == 4 and governor.reason() is None, "idle machine: cores/2"
+        assert governor.pace(4, 1.0) == 0.0, "no pause at full speed"
+
+        governor.set_recording(True)
+        assert governor.thread_count() == 2 and governor.reason() == "recording", "recording halves the threads"
+        assert governor.pace(4, 1.0) == 1.0 and slept[-1] == 1.0, "4 threads paced down to 2 cores"
+        assert governor.pace(2, 1.0) == 0.0, "a job started during the recording is not paced"
+
+        sampler.load = BUSY_LOAD + 0.1
+        assert governor.thread_count() == 1 and governor.reason() == "recording+cpu_busy", "both: one thread"
+        assert governor.pace(4, 1.0) == 3.0
+        assert governor.pace(4, 100.0) == MAX_PAUSE, "pauses are capped"
+
+        governor.set_recording(False)
+        assert governor.thread_count() == 2 and governor.reason() == "cpu_busy", "busy alone halves the threads"
+        sampler.load = (BUSY_LOAD + IDLE_LOAD) / 2
+        assert governor.thread_count() == 2, "hysteresis: still busy between the thresholds"
+        sampler.load = IDLE_LOAD - 0.1
+        assert governor.thread_count() == 4 and governor.reason() is None, "load dropped: full speed again"
+        sampler.load = None
+        assert governor.thread_count() == 4, "no reading keeps the last state"
+
+        # Nested recordings (two captures) only release once both stop
+        governor.set_recording(True)
+        governor.set_recording(True)
+        governor.set_recording(False)
+        assert governor.recording and governor.recordings_started == 3
+        governor.set_recording(False)
+        assert not governor.recording
+        # The worker mirrors the app's state instead of counting
+        governor.sync_recording(True)
+        governor.sync_recording(True)
+        assert governor.recording and governor.recordings_started == 4
+        governor.sync_recording(False)
+        assert not governor.recording
+    finally:
+        resource_governor.time = real_time
+
+
+class Load:
+    """A transcription stand-in: `threads` cores busy per segment, optionally governed."""
+
+    def __init__(self, size, governor=None):
+        self.size = size
+        self.governor = governor
+        self.threads = None
+        self._matrix = np.random.rand(size, size).astype(np.float32)
+        self.products = 0
+        self.paused_s = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _work(self, _):
+        # Matrix products release the GIL, as CTranslate2 does while decoding
+        out = np.empty_like(self._matrix)
+        for _ in range(SEGMENT_PRODUCTS):
+            np.matmul(self._matrix, self._matrix, out=out)
+
+    def _run(self):
+        # Chosen when the job starts, fixed from then on, like the model's cpu_threads
+        if self.governor:
+            self.threads = self.governor.thread_count(fresh=True)
+            # Pool threads are started from here, so on Linux they inherit the niceness
+            lower_worker_priority()
+        else:
+            self.threads = max(2, (os.cpu_count() or 2) // 2)
+        with ThreadPoolExecutor(self.threads) as pool:
+            while not self._stop.is_set():
+                started = time.perf_counter()
+                list(pool.map(self._work, range(self.threads)))
+                self.products += self.threads * SEGMENT_PRODUCTS
+                if self.governor:
+                    self.paused_s += self.governor.pace(self.threads, time.perf_counter() - started)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+
+class WakeProbe:
+    """Oversleep of a normal-priority thread that wakes every PROBE_INTERVAL."""
+
+    def __init__(self):
+        self.late_ms = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            started = time.perf_counter()
+            time.sleep(PROBE_INTERVAL)
+            self.late_ms.append((time.perf_counter() - started - PROBE_INTERVAL) * 1000)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+
+def run(seconds, folder, label, load=None, governor=None, record_after=0.0):
+    """Capture for `seconds` next to `load`; the recording reaches the governor after `record_after`."""
+    source = create_test_source("synthetic")
+    probe = WakeProbe()
+    if load and record_after:
+        load.start()
+        time.sleep(record_after)
+    source.start(os.path.join(folder, f"{label}.wav"))
+    if governor:
+        # What AudioEngine.start() reports
+        governor.set_recording(True)
+    probe.start()
+    if load and not record_after:
+        load.start()
+    products = load.products if load else 0
+    wall_start = time.monotonic()
+    time.sleep(seconds)
+    stats = source.get_stats()
+    wall = time.monotonic() - wall_start
+    probe.stop()
+    if load:
+        products = load.products - products
+        load.stop()
+    source.stop()
+    if governor:
+        governor.set_recording(False)
+    return {"label": label, "stats": stats, "probe": sorted(probe.late_ms), "load": load,
+            "rate": products / wall if load else None}
+
+
+def print_row(result):
+    stats, late, load = result["stats"], result["probe"], result["load"]
+    captured = stats["capture_time"] / stats["wall_time"] * 100 if stats["wall_time"] else 0.0
+    p99 = late[int(len(late) * 0.99)] if late else 0.0
+    load_text = "-" if load is None else f"{result['rate']:.1f}/s on {load.threads} thr"
+    print(f"  {result['label']:<24}{captured:9.1f}%{stats['drift']:+9.3f}s{stats['dropped_frames']:9d}"
+          f"{p99:9.2f}{(late[-1] if late else 0.0):9.2f}   {load_text}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Capture throughput under a transcription load")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--size", type=int, default=512, help="Matrix size of the load (work per segment)")
+    parser.add_argument("--check-only", action="store_true", help="Only assert the governor's decisions")
+    args = parser.parse_args()
+
+    check_governor()
+    print("✓ Governor decisions match the expected thread counts and pauses")
+    if args.check_only:
+        return
+
+    print("=" * 86)
+    print("SYNTHOTIC - RESOURCE GOVERNOR BENCHMARK")
+    print("=" * 86)
+    print(f"  {os.cpu_count()} logical cores, {args.seconds:g}s per run")
+
+    with tempfile.TemporaryDirectory() as folder:
+        results = [run(args.seconds, folder, "no load")]
+        results.append(run(args.seconds, folder, "ungoverned", Load(args.size)))
+        governor = ResourceGovernor()
+        results.append(run(args.seconds, folder, "governed, started during", Load(args.size, governor), governor))
+        governor = ResourceGovernor()
+        before = Load(args.size, governor)
+        results.append(run(args.seconds, folder, "governed, started before", before, governor, record_after=1.0))
+
+    print(f"\n  {'':<24}{'captured':>10}{'drift':>10}{'dropped':>9}{'wake p99':>9}{'max ms':>9}   load (products)")
+    for result in results:
+        print_row(result)
+    print(f"\n  Started before the recording, the governed load paused {before.paused_s:.1f}s between segments")
+    print("\n" + "=" * 86)
+
+
+if __name__ == "__main__":
+    main()
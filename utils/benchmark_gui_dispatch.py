@@ -0,0 +1,135 @@
+"""
+Synthotic - GUI Dispatch Benchmark
+
+Compares the old 100 ms queue polling with the event-driven GuiQueue:
+
+    idle  - Tk loop wakeups and CPU time while nothing is posted (app hidden in the tray)
+    burst - a worker posts a flood of progress updates followed by "done"; measures
+            how long until "done" is handled and the longest single Tk callback
+            (how long the window stays frozen)
+
+Needs a display (Tk). Usage:
+    python utils/benchmark_gui_dispatch.py
+    python utils/benchmark_gui_dispatch.py --idle-seconds 30 --burst 20000
+"""
+
+import os
+import sys
+import time
+import queue
+import argparse
+import threading
+import tkinter as tk
+
+# Setup paths
+script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, script_dir)
+
+from src.ui.gui_queue import GuiQueue
+
+POLL_MS = 100
+
+
+class PollingQueue(queue.Queue):
+    """The previous DashboardApp.check_queue loop: drain everything every POLL_MS."""
+
+    def __init__(self, root, handler):
+        super().__init__()
+        self.root = root
+        self.handler = handler
+        self.stats = {"wakeups": 0, "dispatched": 0, "coalesced": 0, "max_batch_ms": 0.0}
+
+    def start(self):
+        self.root.after(POLL_MS, self.poll)
+
+    def poll(self):
+        started = time.perf_counter()
+        try:
+            while True:
+                msg_type, data = self.get_nowait()
+                self.handler(msg_type, data)
+                self.stats["dispatched"] += 1
+        except queue.Empty:
+            pass
+        finally:
+            self.stats["wakeups"] += 1
+            self.stats["max_batch_ms"] = max(self.stats["max_batch_ms"], (time.perf_counter() - started) * 1000)
+            self.root.after(POLL_MS, self.poll)
+
+
+def run(kind, idle_seconds, burst):
+    root = tk.Tk()
+    root.withdraw()
+    label = tk.Label(root)
+    label.pack()
+    done = {}
+
+    def handler(msg_type, data):
+        if msg_type == "progress":
+            label.config(text=f"{data:.1f}%")
+        elif msg_type == "done":
+            done["at"] = time.perf_counter()
+            root.quit()
+
+    messages = PollingQueue(root, handler) if kind == "polling" else GuiQueue(root, handler)
+    messages.start()
+
+    # Idle: nothing posted
+    cpu_start = time.process_time()
+    root.after(int(idle_seconds * 1000), root.quit)
+    root.mainloop()
+    idle_cpu = time.process_time() - cpu_start
+    idle_wakeups = messages.stats["wakeups"]
+
+    # Burst: a transcription-like producer with no pacing at all
+    def produce():
+        for i in range(burst):
+            messages.put(("progress", i * 100.0 / burst))
+        done["posted"] = time.perf_counter()
+        messages.put(("done", None))
+
+    messages.stats["max_batch_ms"] = 0.0
+    root.after(0, lambda: threading.Thread(target=produce, daemon=True).start())
+    root.mainloop()
+    root.destroy()
+
+    return {
+        "idle_wakeups_per_s": idle_wakeups / idle_seconds,
+        "idle_cpu_pct": idle_cpu / idle_seconds * 100,
+        "done_latency_ms": (done["at"] - done["posted"]) * 1000,
+        "max_callback_ms": messages.stats["max_batch_ms"],
+        "handled": messages.stats["dispatched"] - 1,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the GUI message dispatch")
+    parser.add_argument("--idle-seconds", type=float, default=10.0)
+    parser.add_argument("--burst", type=int, default=10000, help="Progress messages in the burst")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SYNTHOTIC - GUI DISPATCH BENCHMARK")
+    print("=" * 60)
+
+    try:
+        results = {kind: run(kind, args.idle_seconds, args.burst) for kind in ("polling", "event")}
+    except tk.TclError as e:
+        print(f"[ERROR] Tk unavailable: {e}")
+        sys.exit(1)
+
+    print(f"\n  {'':<28}{'polling':>12}{'event':>12}")
+    for key, label in (
+        ("idle_wakeups_per_s", "Idle wakeups / s"),
+        ("idle_cpu_pct", "Idle CPU (%)"),
+        ("done_latency_ms", "'done' after burst (ms)"),
+        ("max_callback_ms", "Longest callback (ms)"),
+        ("handled", "Progress updates drawn"),
+    ):
+        print(f"  {label:<28}{results['polling'][key]:12.2f}{results['event'][key]:12.2f}")
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Synthotic - Logging Cost Benchmark
+
+What a log call costs the thread that makes it (the Tk thread, a capture or
+transcription thread): the old synchronous FileHandler + console setup against
+the queue pipeline in src/logs.py, where the caller only enqueues. Runs a
+single-threaded loop and a few threads logging at once.
+
+Usage:
+    python utils/benchmark_logging.py
+    python utils/benchmark_logging.py --messages 50000 --threads 8
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import tempfile
+import threading
+import statistics
+
+# Setup paths
+script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, script_dir)
+
+from src import logs
+
+
+def reset_root():
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+
+def setup_legacy(log_file, stream):
+    logging.basicConfig(
+        level=logging.INFO,
+        format=logs.LOG_FORMAT,
+        handlers=[logging.FileHandler(log_file, encoding="utf-8", mode="a"), logging.StreamHandler(stream)],
+        force=True
+    )
+
+
+def time_calls(logger, count):  # microseconds per call
+    samples = []
+    for i in range(count):
+        started = time.perf_counter()
+        logger.info(f"Segment {i}: 12.3 MB written, drift 0.004 s")
+        samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+def run_threads(logger, count, threads):
+    per_thread = count // threads
+    results = [None] * threads
+
+    def worker(index):
+        results[index] = time_calls(logger, per_thread)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for worker_thread in workers:
+        worker_thread.start()
+    for worker_thread in workers:
+        worker_thread.join()
+    return [sample for result in results for sample in result]
+
+
+def measure(label, setup, args, folder):
+    log_file = os.path.join(folder, f"{label}.log")
+    with open(os.devnull, "w") as console:
+        setup(log_file, console)
+        logger = logging.getLogger("benchmark")
+        single = time_calls(logger, args.messages)
+        threaded = run_threads(logger, args.messages, args.threads)
+        started = time.perf_counter()
+        logs.stop()  # no-op for the legacy setup
+        drain_ms = (time.perf_counter() - started) * 1000
+        reset_root()
+    return single, threaded, drain_ms
+
+
+def print_row(label, samples):
+    samples = sorted(samples)
+    p99 = samples[int(len(samples) * 0.99)]
+    print(f"  {label:<30}{statistics.mean(samples):10.1f}{statistics.median(samples):10.1f}{p99:10.1f}{samples[-1]:10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the cost of a log call")
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("SYNTHOTIC - LOGGING COST BENCHMARK")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as folder:
+        legacy = measure("legacy", setup_legacy, args, folder)
+        queued = measure("queued", lambda path, stream: logs.start(path, stream=stream), args, folder)
+
+    print(f"\n  {'per call on the caller (us)':<30}{'mean':>10}{'median':>10}{'p99':>10}{'max':>10}")
+    print_row("FileHandler, 1 thread", legacy[0])
+    print_row("Queue, 1 thread", queued[0])
+    print_row(f"FileHandler, {args.threads} threads", legacy[1])
+    print_row(f"Queue, {args.threads} threads", queued[1])
+    print(f"\n  Writer thread caught up {queued[2]:.0f} ms after the last call")
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Synthotic - Segment Store Benchmark
+
+Writes a synthetic transcript the way the transcriber does (the .txt and the
+binary .segments sidecar, one segment at a time), then compares getting the
+segments back: parsing the .txt with the transcript index's parser against
+opening the memory-mapped sidecar. Also times rendering every format from the
+sidecar and checks that the rendered .txt matches the one written.
+
+Usage:
+    python utils/benchmark_segment_store.py
+    python utils/benchmark_segment_store.py --minutes 180
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from types import SimpleNamespace
+
+# Setup paths
+script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, script_dir)
+
+from src.core.segment_store import RENDERERS, SegmentStore, SegmentWriter, sidecar_path, txt_header, txt_line
+from src.core.transcript_index import parse_transcript
+
+SEGMENT_SECONDS = 4.0  # a typical faster-whisper segment with VAD on
+WORDS = "a reunião de hoje cobre o orçamento do próximo trimestre and the release plan".split()
+
+
+def make_segments(minutes, seed=1):
+    rng = random.Random(seed)
+    segments, start = [], 0.0
+    while start < minutes * 60:
+        words, at = [], start
+        for _ in range(rng.randint(6, 16)):
+            end = at + rng.uniform(0.15, 0.45)
+            words.append(SimpleNamespace(start=at, end=end, word=" " + rng.choice(WORDS), probability=rng.random()))
+            at = end
+        segments.append(SimpleNamespace(
+            start=start, end=at, text="".join(word.word for word in words), words=words,
+            avg_logprob=-rng.random(), no_speech_prob=rng.random() / 10,
+            compression_ratio=rng.uniform(1.2, 2.0), temperature=0.0,
+        ))
+        start = at + rng.uniform(0.2, SEGMENT_SECONDS)
+    return segments
+
+
+def best_ms(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - started) * 1000)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Binary segment sidecar against the .txt transcript")
+    parser.add_argument("--minutes", type=float, default=60.0, help="Length of the synthetic recording")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SYNTHOTIC - SEGMENT STORE BENCHMARK")
+    print("=" * 60)
+
+    segments = make_segments(args.minutes)
+    with tempfile.TemporaryDirectory() as folder:
+        txt_path = os.path.join(folder, "audio.txt")
+        metadata = dict(is_import=False, date="2026-01-01 09:00:00", file="audio.wav", language="pt")
+
+        started = time.perf_counter()
+        writer = SegmentWriter(sidecar_path(txt_path), metadata)
+        with open(txt_path, "w", encoding="utf-8") as f:
+            f.write(txt_header(metadata))
+            for segment in segments:
+                f.write(txt_line(segment.start, segment.text))
+                writer.add(segment)
+        writer.finish()
+        write_ms = (time.perf_counter() - started) * 1000
+
+        txt_size = os.path.getsize(txt_path)
+        store_size = os.path.getsize(sidecar_path(txt_path))
+        words = sum(len(segment.words) for segment in segments)
+        print(f"\n  {len(segments)} segments, {words} words ({args.minutes:g} min)")
+        print(f"  Streamed .txt + sidecar in {write_ms:.1f} ms "
+              f"({write_ms * 1000 / len(segments):.0f} us per segment)")
+        print(f"  .txt {txt_size / 1024:.0f} KB, .segments {store_size / 1024:.0f} KB "
+              f"(with word timings and confidences)")
+
+        def open_store():
+            with SegmentStore(sidecar_path(txt_path)) as store:
+                return float(store.segments["start"][-1])
+
+        def low_confidence():
+            with SegmentStore(sidecar_path(txt_path)) as store:
+                return int((store.segments["avg_logprob"] < -0.5).sum())
+
+        print(f"\n  {'parse .txt (index parser)':<32}{best_ms(lambda: parse_transcript(txt_path)):9.2f} ms")
+        print(f"  {'open sidecar':<32}{best_ms(open_store):9.2f} ms")
+        print(f"  {'open + scan avg_logprob':<32}{best_ms(low_confidence):9.2f} ms")
+        with SegmentStore(sidecar_path(txt_path)) as store:
+            for fmt, renderer in RENDERERS.items():
+                print(f"  {'render ' + fmt:<32}{best_ms(lambda: renderer(store), repeat=3):9.2f} ms")
+            rendered = RENDERERS["txt"](store)
+
+        with open(txt_path, encoding="utf-8") as f:
+            same = f.read() == rendered
+        print(f"\n  Rendered .txt identical to the written one: {'yes' if same else 'NO'}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
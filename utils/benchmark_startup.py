@@ -0,0 +1,166 @@
+"""
+Synthotic - Cold Start Benchmark
+
+Measures how long the app takes to put its window on screen and fails if that
+regresses past a budget, or if a heavy stack (faster-whisper, NumPy, PortAudio,
+Pillow...) is imported before the window appears.
+
+Phases:
+    imports - `python -X importtime` over main.py and the UI it loads: import cost of the startup path
+    window  - launches main.py in benchmark mode; the app reports time-to-window and its
+              startup phases (see src/startup.py), then exits
+
+Usage:
+    python utils/benchmark_startup.py
+    python utils/benchmark_startup.py --runs 5 --budget-ms 1200
+    python utils/benchmark_startup.py --imports-only --top 25
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+# Setup paths
+script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, script_dir)
+
+from src.startup import BENCHMARK_ENV, BENCHMARK_MARKER, DEFERRED_MODULES
+
+# main.py imports the UI inside main(), after the single-instance check
+STARTUP_IMPORTS = "import main, src.utils, src.config, src.ui.main_window"
+
+
+def parse_importtime(stderr: str) -> list:
+    """Return (module, self_us, cumulative_us, depth) per line of -X importtime output."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            depth = (len(name) - len(name.lstrip())) // 2
+            entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+        except ValueError:
+            continue
+    return entries
+
+
+def run_imports(top: int, budget_ms: float) -> bool:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_IMPORTS],
+        cwd=script_dir, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(f"[ERROR] Startup imports failed:\n{result.stderr.strip().splitlines()[-1]}")
+        return False
+
+    entries = parse_importtime(result.stderr)
+    # Top-level entries (depth 0) partition the total; the first is the interpreter's own encodings etc.
+    total_ms = sum(cumulative for _, _, cumulative, depth in entries if depth == 0) / 1000
+    heavy = sorted({name.split(".")[0] for name, _, _, _ in entries} & set(DEFERRED_MODULES))
+
+    print("\n[Imports on the startup path]")
+    print(f"  Total:            {total_ms:8.1f} ms (budget {budget_ms:.0f} ms)")
+    print(f"  Modules:          {len(entries):8d}")
+    print(f"\n  {'cumulative ms':>13}  {'self ms':>8}  module")
+    for name, self_us, cumulative_us, depth in sorted(entries, key=lambda e: -e[2])[:top]:
+        print(f"  {cumulative_us / 1000:13.1f}  {self_us / 1000:8.1f}  {name}")
+
+    ok = total_ms <= budget_ms
+    if heavy:
+        print(f"\n[FAIL] Deferred modules imported at startup: {', '.join(heavy)}")
+        ok = False
+    elif not ok:
+        print(f"\n[FAIL] Startup imports over budget by {total_ms - budget_ms:.1f} ms")
+    return ok
+
+
+def run_window_once(timeout: float) -> dict:
+    env = dict(os.environ, **{BENCHMARK_ENV: "1"})
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(script_dir, "main.py")],
+        cwd=script_dir, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+    report = None
+    try:
+        for line in process.stdout:
+            if line.startswith(BENCHMARK_MARKER):
+                report = json.loads(line[len(BENCHMARK_MARKER):])
+                report["wall_ms"] = (time.perf_counter() - started) * 1000
+                break
+            if time.perf_counter() - started > timeout:
+                break
+    finally:
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+    return report
+
+
+def run_window(runs: int, budget_ms: float, timeout: float) -> bool:
+    reports = []
+    for i in range(runs):
+        report = run_window_once(timeout)
+        if report is None:
+            print(f"[ERROR] Run {i + 1}: the app exited without reporting a window (see system.log)")
+            return False
+        reports.append(report)
+        print(f"  Run {i + 1}: window after {report['time_to_window_ms']:.0f} ms "
+              f"({report['wall_ms']:.0f} ms including interpreter start)")
+
+    median = statistics.median(r["time_to_window_ms"] for r in reports)
+    median_wall = statistics.median(r["wall_ms"] for r in reports)
+    heavy = sorted({name for r in reports for name in r["deferred_loaded"]})
+
+    print("\n[Time to window]")
+    print(f"  Median:           {median:8.1f} ms (budget {budget_ms:.0f} ms)")
+    print(f"  Median wall:      {median_wall:8.1f} ms")
+
+    phase_names = [phase["name"] for phase in reports[0].get("phases", [])]
+    if phase_names:
+        print(f"\n  {'median ms':>13}  phase")
+        for name in phase_names:
+            durations = [p["duration_ms"] for r in reports for p in r["phases"] if p["name"] == name]
+            print(f"  {statistics.median(durations):13.1f}  {name}")
+
+    ok = median <= budget_ms
+    if heavy:
+        print(f"\n[FAIL] Deferred modules loaded before the window: {', '.join(heavy)}")
+        ok = False
+    elif not ok:
+        print(f"\n[FAIL] Time to window over budget by {median - budget_ms:.1f} ms")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Synthotic cold start")
+    parser.add_argument("--runs", type=int, default=3, help="App launches for the time-to-window median")
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="Time-to-window budget")
+    parser.add_argument("--import-budget-ms", type=float, default=600.0, help="Startup import budget")
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to list")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for each launch")
+    parser.add_argument("--imports-only", action="store_true", help="Skip launching the app")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SYNTHOTIC - COLD START BENCHMARK")
+    print("=" * 60)
+
+    ok = run_imports(args.top, args.import_budget_ms)
+    if not args.imports_only:
+        print()
+        ok = run_window(args.runs, args.budget_ms, args.timeout) and ok
+
+    print("\n" + "=" * 60)
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Synthotic - Tray State Transition Benchmark
+
+Micro-benchmark of TrayManager.update_state(): the old path (reopen app.ico,
+resize, tint, rebuild the whole menu on the calling thread) against the current
+one (queue the change on the caller; apply a cached image and rebuild the menu
+only when its structure changes on the tray thread). No tray icon is shown.
+
+Usage:
+    python utils/benchmark_tray.py
+    python utils/benchmark_tray.py --transitions 2000
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+
+# Setup paths
+script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, script_dir)
+
+# Menus and images are built the same way with every backend; the dummy one needs no desktop
+os.environ.setdefault("PYSTRAY_BACKEND", "dummy")
+
+from src.ui import tray
+from src.ui.tray import TrayManager
+
+# A recording session: start, tooltip refreshes, stop, transcription, done
+CYCLE = ["rec", "rec", "rec", "idle", "proc", "idle"]
+
+
+class StaticConfig:
+    def __init__(self, language="en_US"):
+        self.language = language
+
+    def get(self, key):
+        return self.language if key == "language" else None
+
+    def subscribe(self, callback, keys=None):
+        return callback
+
+
+class FakeIcon:
+    """Stands in for pystray.Icon: records what would be sent to the shell."""
+
+    def __init__(self):
+        self.icon = self.menu = None
+        self.title = ""
+        self.visible = True
+
+    def notify(self, message, title):
+        pass
+
+    def stop(self):
+        pass
+
+
+def legacy_update(manager, state):
+    manager.is_recording = state == "rec" or (state != "idle" and manager.is_recording)
+    manager.create_image(state, manager._load_app_icon())
+    if tray.pystray is not None:
+        manager.create_menu()
+
+
+def time_per_call(func, states):  # microseconds per call
+    samples = []
+    for state in states:
+        started = time.perf_counter()
+        func(state)
+        samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+def print_row(label, samples):
+    print(f"  {label:<34}{statistics.mean(samples):10.1f}{statistics.median(samples):10.1f}{max(samples):10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tray state transitions")
+    parser.add_argument("--transitions", type=int, default=600)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SYNTHOTIC - TRAY STATE TRANSITION BENCHMARK")
+    print("=" * 60)
+
+    try:
+        tray._load_backend()
+    except Exception as e:
+        if tray.Image is None:
+            print(f"[ERROR] Pillow is required: {e}")
+            sys.exit(1)
+        print(f"[WARN] pystray unavailable ({e}); menu cost not measured")
+
+    states = (CYCLE * (args.transitions // len(CYCLE) + 1))[:args.transitions]
+    manager = TrayManager(command_queue=None, restore_callback=None, exit_callback=None, config=StaticConfig())
+
+    legacy = time_per_call(lambda state: legacy_update(manager, state), states)
+
+    started = time.perf_counter()
+    manager._images = manager.create_images()
+    render_ms = (time.perf_counter() - started) * 1000
+    manager._menu_key = manager._current_menu_key()
+    manager._running = True
+    icon = FakeIcon()
+
+    caller, applied, menu_rebuilds = [], [], 0
+    for state in states:
+        started = time.perf_counter()
+        manager.update_state(state)
+        caller.append((time.perf_counter() - started) * 1e6)
+
+        # One update per batch: the worst case, nothing coalesced
+        menu = icon.menu
+        started = time.perf_counter()
+        manager._apply(icon, [manager._updates.get_nowait()])
+        applied.append((time.perf_counter() - started) * 1e6)
+        menu_rebuilds += icon.menu is not menu
+
+    print(f"\n  One-off render of all icon states: {render_ms:.2f} ms")
+    print(f"\n  {'per transition (us)':<34}{'mean':>10}{'median':>10}{'max':>10}")
+    print_row("Old update_state (caller thread)", legacy)
+    print_row("update_state (caller thread)", caller)
+    print_row("apply on tray thread", applied)
+    print(f"\n  Menu swaps: {menu_rebuilds} for {len(states)} transitions ({len(manager._menus)} menus built)")
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    main()
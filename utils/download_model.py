@@ -0,0 +1,137 @@
+"""
+Whisper Model Download Utility for Synthotic.
+
+Downloads a faster-whisper (CTranslate2) model from Hugging Face into models/
+in the project root, where build.spec bundles it, and writes the
+manifest.json with the SHA-256 of every file that the app checks before
+using it. The app itself never downloads models.
+
+Usage:
+    python utils/download_model.py                 # the model the app uses
+    python utils/download_model.py medium
+    python utils/download_model.py small --user    # into the user's models folder
+"""
+import os
+import sys
+import shutil
+import argparse
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+# Setup paths
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.constants import MODEL_SIZE, MODELS_DIR
+from src.core.model_registry import BUNDLED_MODELS, ModelError, write_manifest
+
+MODEL_REPO = "Systran/faster-whisper-{name}"
+MODEL_URL = "https://huggingface.co/{repo}/resolve/main/{file}"
+MODEL_FILES = ("config.json", "model.bin", "tokenizer.json")
+# Depending on the model: vocabulary.txt or vocabulary.json, and large-v3's preprocessor config
+OPTIONAL_FILES = ("vocabulary.txt", "vocabulary.json", "preprocessor_config.json")
+
+
+def download_with_progress(url: str, destination: Path) -> None:
+    """
+    Download a file with progress indication.
+
+    Args:
+        url: URL to download from.
+        destination: Local path to save the file.
+    """
+    def reporthook(block_num, block_size, total_size):
+        """Display download progress."""
+        downloaded = block_num * block_size
+        if total_size > 0:
+            percent = min(100, downloaded * 100 / total_size)
+            bar_length = 40
+            filled = int(bar_length * percent / 100)
+            bar = '█' * filled + '░' * (bar_length - filled)
+            print(f"\r  [{bar}] {percent:.1f}% ({downloaded // 1024 // 1024}MB / {total_size // 1024 // 1024}MB)", end='')
+        else:
+            print(f"\r  Downloaded: {downloaded // 1024 // 1024}MB", end='')
+
+    urllib.request.urlretrieve(url, destination, reporthook)
+    print()
+
+
+def download_model(name: str, target: Path) -> None:
+    """
+    Download every file of a model into `target`, through a .part folder so an
+    interrupted download never looks like an installed model.
+
+    Args:
+        name: Model name, e.g. "small".
+        target: Final model folder.
+    """
+    repo = MODEL_REPO.format(name=name)
+    partial = target.with_name(target.name + ".part")
+    if partial.exists():
+        shutil.rmtree(partial)
+    partial.mkdir(parents=True)
+
+    for file in MODEL_FILES + OPTIONAL_FILES:
+        url = MODEL_URL.format(repo=repo, file=file)
+        print(f"{file}:")
+        try:
+            download_with_progress(url, partial / file)
+        except urllib.error.HTTPError as e:
+            if e.code == 404 and file in OPTIONAL_FILES:
+                print("  (not part of this model)")
+                continue
+            raise
+
+    print("\nWriting checksums...")
+    write_manifest(str(partial), name, source=repo)
+    if target.exists():
+        shutil.rmtree(target)
+    partial.rename(target)
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Download a faster-whisper model for Synthotic")
+    parser.add_argument("name", nargs="?", default=MODEL_SIZE, help=f"Model name (default: {MODEL_SIZE})")
+    parser.add_argument("--user", action="store_true", help=f"Install into {MODELS_DIR} instead of the build")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Synthotic - Whisper Model Download Utility")
+    print("=" * 60)
+
+    models_dir = Path(MODELS_DIR) if args.user else project_root / BUNDLED_MODELS
+    target = models_dir / args.name
+
+    if (target / "manifest.json").exists():
+        print(f"\n✓ Model already exists at: {target}")
+        response = input("Do you want to re-download? (y/N): ").strip().lower()
+        if response != 'y':
+            print("Skipping download.")
+            return
+
+    try:
+        print(f"\nDownloading {MODEL_REPO.format(name=args.name)} to {target}\n")
+        download_model(args.name, target)
+
+        size_mb = sum(f.stat().st_size for f in target.iterdir()) / (1024 * 1024)
+        print("\n" + "=" * 60)
+        print(f"✓ SUCCESS! Model '{args.name}' is ready to use.")
+        print(f"  Location: {target}")
+        print(f"  Size: {size_mb:.1f} MB")
+        print("=" * 60)
+
+    except (OSError, urllib.error.URLError, ModelError) as e:
+        print("\n" + "=" * 60)
+        print(f"✗ ERROR: {e}")
+        print("=" * 60)
+        print("\nManual installation instructions:")
+        print(f"1. Download the files of https://huggingface.co/{MODEL_REPO.format(name=args.name)}")
+        print(f"2. Put them in {target}")
+        print("3. Synthotic writes the checksums on first use")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Transcript Render Utility for Synthotic.
+
+Renders a transcript as .txt, .srt, .vtt or .json from the binary .segments
+sidecar the transcriber writes next to it, without running the model again.
+Pass either the sidecar or the transcript's .txt.
+
+Usage:
+    python utils/render_transcript.py "Live_2026-01-01_09-00-00/audio.txt" --format srt
+    python utils/render_transcript.py audio.segments --format json --output audio.json
+"""
+import os
+import sys
+import argparse
+
+# Setup paths
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.core.segment_store import RENDERERS, SIDECAR_EXT, SegmentStoreError, render, sidecar_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a transcript from its segment sidecar")
+    parser.add_argument("path", help=f"The {SIDECAR_EXT} sidecar or its transcript .txt")
+    parser.add_argument("--format", choices=list(RENDERERS), default="srt")
+    parser.add_argument("--output", help="Write here (default: next to the sidecar, with the format's extension; txt is printed)")
+    parser.add_argument("--stdout", action="store_true", help="Print instead of writing a file")
+    args = parser.parse_args()
+
+    path = args.path if args.path.endswith(SIDECAR_EXT) else sidecar_path(args.path)
+    output = args.output
+    # A second .txt in a recording folder would be indexed and searched twice, so txt
+    # goes to the console unless --output says otherwise
+    if not output and not args.stdout and args.format != "txt":
+        output = os.path.splitext(path)[0] + "." + args.format
+
+    try:
+        text = render(path, args.format, output)
+    except (OSError, SegmentStoreError) as e:
+        print(f"✗ ERROR: {e}")
+        sys.exit(1)
+    if output:
+        print(f"✓ {output}")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Synthotic - Session Simulator
+
+Runs the full start -> stop -> transcribe path without audio devices, using a
+synthetic or replayed capture source. Useful for reproducible recordings of any
+length and for load testing on Linux / CI.
+
+Usage:
+    python utils/simulate_session.py --seconds 600 --speed 20
+    python utils/simulate_session.py --source replay:meeting.wav --transcribe
+"""
+
+import os
+import sys
+import time
+import queue
+import argparse
+
+# Setup paths
+script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, script_dir)
+
+from src.config import AppConfig
+from src.core.audio_engine import AudioEngine
+from src.core.capture_sources import FileReplaySource, SyntheticSource
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate a Synthotic recording session")
+    parser.add_argument("--source", default="synthetic:speech", help="synthetic[:tone|noise|speech] or replay:<file>")
+    parser.add_argument("--seconds", type=float, default=60.0, help="Length of the synthetic recording")
+    parser.add_argument("--speed", type=float, default=1.0, help="Capture speed (x real time)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-mic", action="store_true", help="Record the loopback source only")
+    parser.add_argument("--transcribe", action="store_true", help="Run transcription after stopping")
+    args = parser.parse_args()
+
+    kind, _, arg = args.source.partition(":")
+    if kind == "replay":
+        source = FileReplaySource(arg, speed=args.speed)
+    else:
+        source = SyntheticSource(
+            loopback=arg or "speech",
+            mic=None if args.no_mic else "tone",
+            duration=args.seconds,
+            speed=args.speed,
+            seed=args.seed
+        )
+
+    engine = AudioEngine(source=source)
+
+    started = time.monotonic()
+    wav_path = engine.start()
+    print(f"Recording to: {wav_path}")
+
+    source.wait_finished()
+    engine.stop()
+    elapsed = time.monotonic() - started
+    stats = source.get_stats()
+    print(f"Captured {stats['capture_time']:.1f}s of audio in {elapsed:.1f}s "
+          f"(padded {stats['padded_frames']}, dropped {stats['dropped_frames']} frames)")
+
+    if args.transcribe:
+        from src.core.transcriber import transcription_worker
+
+        messages = queue.Queue()
+        started = time.monotonic()
+        transcription_worker(wav_path, messages, AppConfig())
+        while not messages.empty():
+            msg_type, data = messages.get()
+            if msg_type in ("done", "error"):
+                print(f"{msg_type}: {data}")
+        print(f"Transcription took {time.monotonic() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()